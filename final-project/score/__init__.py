@@ -1,5 +1,6 @@
 __all__ = [
     'interval',
+    'interval_array',
     'pitch',
     'ratio',
     'meter',
@@ -21,6 +22,7 @@ __all__ = [
 ]
 
 from .interval import *
+from .interval_array import *
 from .pitch import *
 from .ratio import *
 from .meter import *
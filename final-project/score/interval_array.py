@@ -0,0 +1,184 @@
+##############################################################################
+## @file
+#  A columnar collection of intervals.
+#  An IntervalArray stores the span, qual, xoct and sign of the intervals
+#  between two aligned pitch sequences (see Interval(pitch1, pitch2)) in
+#  signed byte columns (see Python's array module), together with their
+#  semitones, and answers predicates such as is_fifth() or is_consonant()
+#  for the whole collection at once. The harmonic intervals of two voices,
+#  or the melodic intervals of one voice, are computed once for a whole
+#  piece. Where either pitch is missing (e.g. a rest) the interval is empty
+#  and stored as -1 in the span, qual and xoct columns and 0 in the sign
+#  and semitones columns.
+
+from array import array
+
+from .interval import Interval
+from .pitch import Pitch
+
+## The quality indexes of the minor, perfect and major qualities.
+_minor, _perfect, _major = 5, 6, 7
+
+## The spans of the perfect intervals (unison, fourth, fifth and octave)
+# and of the imperfect consonances (third and sixth).
+_perfect_spans = (0, 3, 4, 7)
+_imperfect_consonant_spans = (2, 5)
+
+## A class that implements an array of intervals.
+#
+# An IntervalArray holds five attributes of equal length:
+# * spans  An array of span indexes 0-7, or -1 for an empty interval.
+# * quals  An array of quality indexes 0-12, or -1.
+# * xocts  An array of extra octaves 0-10, or -1.
+# * signs  An array of signs 1 or -1, or 0.
+# * semitones  An array of signed semitones, or 0.
+#
+# The Intervals themselves are kept as well, so indexing and iteration
+# return them (or None) without constructing new ones.
+#
+# Unlike hw5/interval_array.py this copy has no masks column or has_flags():
+# the compiled Interval of this package has no mask(), so the predicates
+# test the span, qual, xoct and sign columns directly.
+class IntervalArray:
+
+    ## Creates an IntervalArray from two aligned sequences of pitches. The
+    # interval at index i goes from lower[i] to upper[i].
+    # @param lower  An iterable of Pitches, empty Pitches or None values.
+    # @param upper  An iterable of the same length as lower.
+    #
+    # The constructor should raise a ValueError if the sequences have
+    # different lengths and a TypeError if a value is not a Pitch or None.
+    def __init__(self, lower=(), upper=()):
+        lower, upper = list(lower), list(upper)
+        if len(lower) != len(upper):
+            raise ValueError("Pitch sequences have different lengths")
+        self.spans = array('b')
+        self.quals = array('b')
+        self.xocts = array('b')
+        self.signs = array('b')
+        self.semitones = array('b')
+        self._intervals = []
+        for pitch1, pitch2 in zip(lower, upper):
+            for pitch in (pitch1, pitch2):
+                if pitch is not None and not isinstance(pitch, Pitch):
+                    raise TypeError(f"Invalid pitch: {pitch}.")
+            if pitch1 is None or pitch2 is None or pitch1.is_empty() or pitch2.is_empty():
+                self._append(None)
+            else:
+                self._append(Interval(pitch1, pitch2))
+
+    ## Creates an IntervalArray of the melodic intervals of a voice, the
+    # interval at index i going from voice[i] to voice[i + distance].
+    # @param voice  A sequence of Pitches, empty Pitches or None values.
+    # @param distance  The number of notes between the two pitches of each
+    # interval. Defaults to 1, the intervals between adjacent notes.
+    @classmethod
+    def melodic(cls, voice, distance=1):
+        voice = list(voice)
+        return cls(voice[:-distance], voice[distance:])
+
+    ## Private method that appends an Interval, or None for an empty
+    # interval, to the array.
+    def _append(self, interval):
+        self._intervals.append(interval)
+        if interval is None:
+            self.spans.append(-1)
+            self.quals.append(-1)
+            self.xocts.append(-1)
+            self.signs.append(0)
+            self.semitones.append(0)
+        else:
+            self.spans.append(interval.span)
+            self.quals.append(interval.qual)
+            self.xocts.append(interval.xoct)
+            self.signs.append(interval.sign)
+            self.semitones.append(interval.semitones())
+
+    ## Returns a string showing the interval names and the hex id of the array.
+    # Example: '<IntervalArray: [M3, empty, -P5] 0x109877c50>'
+    def __str__(self):
+        names = ', '.join('empty' if i is None else i.string() for i in self)
+        return f'<IntervalArray: [{names}] {hex(id(self))}>'
+
+    ## Returns the number of intervals in the array.
+    def __len__(self):
+        return len(self.spans)
+
+    ## Implements IntervalArray iteration by returning an iterator of
+    # Intervals, with None for empty intervals.
+    def __iter__(self):
+        return iter(self._intervals)
+
+    ## Returns the Interval (or None) at an integer index, or a new
+    # IntervalArray for a slice.
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            intervals = IntervalArray()
+            for interval in self._intervals[index]:
+                intervals._append(interval)
+            return intervals
+        return self._intervals[index]
+
+    ## Returns a list of the array's intervals, with None for empty intervals.
+    def to_intervals(self):
+        return list(self._intervals)
+
+    ## Returns an array of 0/1 flags, 1 where an interval is empty.
+    def is_empty(self):
+        return array('b', [s < 0 for s in self.spans])
+
+    ## Private method that returns an array of 0/1 flags, 1 where the span
+    # of an interval is in spans. Empty intervals are 0.
+    def _spans_in(self, spans):
+        return array('b', [s in spans for s in self.spans])
+
+    ## Returns an array of 0/1 flags, 1 where an interval is a unison.
+    def is_unison(self):
+        return self._spans_in((0,))
+
+    ## Returns an array of 0/1 flags, 1 where an interval is a second.
+    def is_second(self):
+        return self._spans_in((1,))
+
+    ## Returns an array of 0/1 flags, 1 where an interval is a third.
+    def is_third(self):
+        return self._spans_in((2,))
+
+    ## Returns an array of 0/1 flags, 1 where an interval is a fourth.
+    def is_fourth(self):
+        return self._spans_in((3,))
+
+    ## Returns an array of 0/1 flags, 1 where an interval is a fifth.
+    def is_fifth(self):
+        return self._spans_in((4,))
+
+    ## Returns an array of 0/1 flags, 1 where an interval is a sixth.
+    def is_sixth(self):
+        return self._spans_in((5,))
+
+    ## Returns an array of 0/1 flags, 1 where an interval is a seventh.
+    def is_seventh(self):
+        return self._spans_in((6,))
+
+    ## Returns an array of 0/1 flags, 1 where an interval is an octave.
+    def is_octave(self):
+        return self._spans_in((7,))
+
+    ## Returns an array of 0/1 flags, 1 where an interval is consonant,
+    # see Interval.is_consonant(). Empty intervals are 0.
+    def is_consonant(self):
+        return array('b', [q == _perfect if s in _perfect_spans
+                           else s in _imperfect_consonant_spans and q in (_minor, _major)
+                           for s, q in zip(self.spans, self.quals)])
+
+    ## Returns an array of 0/1 flags, 1 where an interval is compound.
+    def is_compound(self):
+        return array('b', [x > 0 for x in self.xocts])
+
+    ## Returns an array of 0/1 flags, 1 where an interval is ascending.
+    def is_ascending(self):
+        return array('b', [s == 1 for s in self.signs])
+
+    ## Returns an array of 0/1 flags, 1 where an interval is descending.
+    def is_descending(self):
+        return array('b', [s == -1 for s in self.signs])
@@ -2,7 +2,7 @@
 
 ## You can import from score, theory, and any python system modules you want.
 
-from .score import Note, Pitch, Rest, Interval, Ratio, Mode, import_score
+from .score import Note, Pitch, Rest, Interval, IntervalArray, Ratio, Mode, import_score
 from .theory import Analysis, Rule, timepoints
 from copy import copy
 from math import inf
@@ -116,13 +116,14 @@ class ConsecutiveUnisons(Rule):
     def apply(self):
         species = self.analysis.species
         intervals = self.analysis.intervals
+        unisons = intervals.is_unison()
         lower_voice = self.analysis.lower_voice
         illegal_intervals = []
         end_index = len(intervals) - 1
         for i in range(end_index):
             if intervals[i] is None:
                 continue
-            if intervals[i].is_unison() and intervals[i + 1].is_unison():
+            if unisons[i] and unisons[i + 1]:
                 if i != end_index or species == 1:
                     illegal_intervals.append(i)
                 elif lower_voice[i] != lower_voice[i + 1]:
@@ -142,13 +143,14 @@ class ConsecutiveFifths(Rule):
     def apply(self):
         species = self.analysis.species
         intervals = self.analysis.intervals
+        fifths = intervals.is_fifth()
         lower_voice = self.analysis.lower_voice
         illegal_intervals = []
         end_index = len(intervals) - 1
         for i in range(end_index):
             if intervals[i] is None:
                 continue
-            if intervals[i].is_fifth() and intervals[i + 1].is_fifth():
+            if fifths[i] and fifths[i + 1]:
                 if i != end_index or species == 1:
                     illegal_intervals.append(i)
                 elif lower_voice[i] != lower_voice[i + 1]:
@@ -168,13 +170,14 @@ class ConsecutiveOctaves(Rule):
     def apply(self):
         species = self.analysis.species
         intervals = self.analysis.intervals
+        octaves = intervals.is_octave()
         lower_voice = self.analysis.lower_voice
         illegal_intervals = []
         end_index = len(intervals) - 1
         for i in range(end_index):
             if intervals[i] is None:
                 continue
-            if intervals[i].is_octave() and intervals[i + 1].is_octave():
+            if octaves[i] and octaves[i + 1]:
                 if i != end_index or species == 1:
                     illegal_intervals.append(i)
                 elif lower_voice[i] != lower_voice[i + 1]:
@@ -194,16 +197,16 @@ class DirectUnisons(Rule):
 
     def apply(self):
         intervals = self.analysis.intervals
-        lower_voice = self.analysis.lower_voice
-        upper_voice = self.analysis.upper_voice
+        lower_melodic = self.analysis.lower_melodic
+        upper_melodic = self.analysis.upper_melodic
         illegal_intervals = []
         end_index = len(intervals) - 1
         for i in range(1, end_index):
             if intervals[i] is None:
                 continue
             if intervals[i].is_unison():
-                lower_interval = Interval(lower_voice[i - 1], lower_voice[i])
-                upper_interval = Interval(upper_voice[i - 1], upper_voice[i])
+                lower_interval = lower_melodic[i - 1]
+                upper_interval = upper_melodic[i - 1]
                 if not is_leap(upper_interval):
                     pass
                 elif lower_interval.sign != upper_interval.sign:
@@ -221,16 +224,16 @@ class DirectFifths(Rule):
 
     def apply(self):
         intervals = self.analysis.intervals
-        lower_voice = self.analysis.lower_voice
-        upper_voice = self.analysis.upper_voice
+        lower_melodic = self.analysis.lower_melodic
+        upper_melodic = self.analysis.upper_melodic
         illegal_intervals = []
         end_index = len(intervals) - 1
         for i in range(1, end_index):
             if intervals[i] is None:
                 continue
             if intervals[i].is_fifth():
-                lower_interval = Interval(lower_voice[i - 1], lower_voice[i])
-                upper_interval = Interval(upper_voice[i - 1], upper_voice[i])
+                lower_interval = lower_melodic[i - 1]
+                upper_interval = upper_melodic[i - 1]
                 if not is_leap(upper_interval):
                     pass
                 elif lower_interval.sign != upper_interval.sign:
@@ -248,16 +251,16 @@ class DirectOctaves(Rule):
 
     def apply(self):
         intervals = self.analysis.intervals
-        lower_voice = self.analysis.lower_voice
-        upper_voice = self.analysis.upper_voice
+        lower_melodic = self.analysis.lower_melodic
+        upper_melodic = self.analysis.upper_melodic
         illegal_intervals = []
         end_index = len(intervals) - 1
         for i in range(1, end_index):
             if intervals[i] is None:
                 continue
             if intervals[i].is_octave():
-                lower_interval = Interval(lower_voice[i - 1], lower_voice[i])
-                upper_interval = Interval(upper_voice[i - 1], upper_voice[i])
+                lower_interval = lower_melodic[i - 1]
+                upper_interval = upper_melodic[i - 1]
                 if not is_leap(upper_interval):
                     pass
                 elif lower_interval.sign != upper_interval.sign:
@@ -394,7 +397,7 @@ class WeakBeatDissonance(Rule):
     def apply(self):
         illegal_intervals = []
         intervals = self.analysis.intervals
-        cp_voice = self.analysis.cp_voice
+        cp_melodic = self.analysis.cp_melodic
         cp_dur = self.analysis.cp_dur
         end_index = len(intervals)
         species = self.analysis.species
@@ -407,8 +410,8 @@ class WeakBeatDissonance(Rule):
             if intervals[i] is None:
                 continue
             if intervals[i].span not in [0, 2, 4, 5, 7]:
-                interval1 = Interval(cp_voice[i - 1], cp_voice[i])
-                interval2 = Interval(cp_voice[i], cp_voice[i + 1])
+                interval1 = cp_melodic[i - 1]
+                interval2 = cp_melodic[i]
                 if not interval1.is_second() or not interval2.is_second():
                     illegal_intervals.append(i)
                 elif interval1.sign != interval2.sign:
@@ -583,7 +586,7 @@ class MelodicCadence(Rule):
         if cp_voice[-1].pnum() != tonic:
             illegal_intervals.append(len(cp_voice) - 2)
         else:
-            interval = Interval(cp_voice[-2], cp_voice[-1])
+            interval = self.analysis.cp_melodic[-1]
             if interval.is_ascending() and interval != Interval('m2'):
                 illegal_intervals.append(len(cp_voice) - 2)
             elif interval.is_descending() and interval != Interval('-M2'):
@@ -624,21 +627,15 @@ class DissonantMelodicInterval(Rule):
 
     def apply(self):
         illegal_intervals = []
-        cf = []
-        cp = []
-        cflow = self.analysis.cflow
-        if cflow:
-            cf = self.analysis.lower_voice
-            cp = self.analysis.upper_voice
-        else:
-            cf = self.analysis.upper_voice
-            cp = self.analysis.lower_voice
-        end_index = len(cf) - 1
+        cp = self.analysis.cp_voice
+        cf_melodic = self.analysis.cf_melodic
+        cp_melodic = self.analysis.cp_melodic
+        end_index = len(cp) - 1
         for i in range(end_index):
             if cp[i] is None:
                 continue
-            interval1 = Interval(cf[i], cf[i + 1])
-            interval2 = Interval(cp[i], cp[i + 1])
+            interval1 = cf_melodic[i]
+            interval2 = cp_melodic[i]
             if is_melodic_dissonance(interval1) or is_melodic_dissonance(interval2):
                 illegal_intervals.append(i + 1)
         for i in illegal_intervals:
@@ -658,7 +655,7 @@ class MaxUni(Rule):
         for i in range(end_index):
             if cp_voice[i] is None:
                 continue
-            interval = Interval(cp_voice[i], cp_voice[i + 1])
+            interval = self.analysis.cp_melodic[i]
             if interval == Interval('P1'):
                 n_unisons += 1
                 if n_unisons > max_unisons:
@@ -676,12 +673,12 @@ class Max4th(Rule):
         max_fourths = self.analysis.settings['MAX_4TH']
         n_fourths = 0
         cp_voice = self.analysis.cp_voice
+        fourths = self.analysis.cp_melodic.is_fourth()
         end_index = len(cp_voice) - 1
         for i in range(end_index):
             if cp_voice[i] is None:
                 continue
-            interval = Interval(cp_voice[i], cp_voice[i + 1])
-            if interval.is_fourth():
+            if fourths[i]:
                 n_fourths += 1
                 if n_fourths > max_fourths:
                     illegal_intervals.append(i)
@@ -699,12 +696,12 @@ class Max5th(Rule):
         max_fifths = self.analysis.settings['MAX_5TH']
         n_fifths = 0
         cp_voice = self.analysis.cp_voice
+        fifths = self.analysis.cp_melodic.is_fifth()
         end_index = len(cp_voice) - 1
         for i in range(end_index):
             if cp_voice[i] is None:
                 continue
-            interval = Interval(cp_voice[i], cp_voice[i + 1])
-            if interval.is_fifth():
+            if fifths[i]:
                 n_fifths += 1
                 if n_fifths > max_fifths:
                     illegal_intervals.append(i)
@@ -721,12 +718,12 @@ class Max6th(Rule):
         max_sixths = self.analysis.settings['MAX_6TH']
         n_sixths = 0
         cp_voice = self.analysis.cp_voice
+        sixths = self.analysis.cp_melodic.is_sixth()
         end_index = len(cp_voice) - 1
         for i in range(end_index):
             if cp_voice[i] is None:
                 continue
-            interval = Interval(cp_voice[i], cp_voice[i + 1])
-            if interval.is_sixth():
+            if sixths[i]:
                 n_sixths += 1
                 if n_sixths > max_sixths:
                     illegal_intervals.append(i)
@@ -744,12 +741,12 @@ class Max7th(Rule):
         max_sevenths = self.analysis.settings['MAX_7TH']
         n_sevenths = 0
         cp_voice = self.analysis.cp_voice
+        sevenths = self.analysis.cp_melodic.is_seventh()
         end_index = len(cp_voice) - 1
         for i in range(end_index):
             if cp_voice[i] is None:
                 continue
-            interval = Interval(cp_voice[i], cp_voice[i + 1])
-            if interval.is_seventh():
+            if sevenths[i]:
                 n_sevenths += 1
                 if n_sevenths > max_sevenths:
                     illegal_intervals.append(i)
@@ -767,12 +764,12 @@ class Max8va(Rule):
         max_octaves = self.analysis.settings['MAX_8VA']
         n_octaves = 0
         cp_voice = self.analysis.cp_voice
+        octaves = self.analysis.cp_melodic.is_octave()
         end_index = len(cp_voice) - 1
         for i in range(end_index):
             if cp_voice[i] is None:
                 continue
-            interval = Interval(cp_voice[i], cp_voice[i + 1])
-            if interval.is_octave():
+            if octaves[i]:
                 n_octaves += 1
                 if n_octaves > max_octaves:
                     illegal_intervals.append(i)
@@ -794,8 +791,7 @@ class MaxLrg(Rule):
         for i in range(end_index):
             if cp_voice[i] is None:
                 continue
-            interval = Interval(cp_voice[i], cp_voice[i + 1])
-            if is_large(interval):
+            if is_large(self.analysis.cp_melodic[i]):
                 n_larges += 1
                 if n_larges > max_larges:
                     illegal_intervals.append(i)
@@ -825,9 +821,11 @@ class MaxConsecLeap(Rule):
             cf = self.analysis.upper_voice
             cp = self.analysis.lower_voice
             cp_dur = self.analysis.lower_dur
+        cf_melodic = self.analysis.cf_melodic
+        cp_melodic = self.analysis.cp_melodic
         end_index = len(cf) - 1
         for i in range(end_index):
-            interval = Interval(cf[i], cf[i + 1])
+            interval = cf_melodic[i]
             if is_leap(interval):
                 consec_leaps += 1
                 if consec_leaps > max_consec_leaps:
@@ -837,7 +835,7 @@ class MaxConsecLeap(Rule):
         for i in range(end_index):
             if cp[i] is None:
                 continue
-            interval = Interval(cp[i], cp[i + 1])
+            interval = cp_melodic[i]
             if is_leap(interval):
                 consec_leaps += 1
                 if consec_leaps > max_consec_leaps:
@@ -869,12 +867,12 @@ class MaxSameDir(Rule):
             cf = self.analysis.upper_voice
             cp = self.analysis.lower_voice
             cp_dur = self.analysis.lower_dur
+        cp_signs = self.analysis.cp_melodic.signs
         if species == 1:
+            cf_signs = self.analysis.cf_melodic.signs
             end_index = len(cf) - 1
             for i in range(1, end_index):
-                interval1 = Interval(cp[i - 1], cp[i])
-                interval2 = Interval(cp[i], cp[i + 1])
-                if interval1.sign == interval2.sign:
+                if cp_signs[i - 1] == cp_signs[i]:
                     consec_dir += 1
                     if consec_dir > max_samedir:
                         illegal_intervals.append(i + 1)
@@ -882,9 +880,7 @@ class MaxSameDir(Rule):
                     consec_dir = 1
             consec_dir = 1
             for i in range(1, end_index):
-                interval1 = Interval(cf[i - 1], cf[i])
-                interval2 = Interval(cf[i], cf[i + 1])
-                if interval1.sign == interval2.sign:
+                if cf_signs[i - 1] == cf_signs[i]:
                     consec_dir += 1
                     if consec_dir > max_samedir:
                         if i + 1 not in illegal_intervals:
@@ -896,21 +892,18 @@ class MaxSameDir(Rule):
             for i in range(1, end_index):
                 if cp[i - 1] is None:
                     continue
-                interval1 = Interval(cp[i - 1], cp[i])
-                interval2 = Interval(cp[i], cp[i + 1])
-                if interval1.sign == interval2.sign:
+                if cp_signs[i - 1] == cp_signs[i]:
                     consec_dir += 1
                     if consec_dir > max_samedir:
                         if i + 1 not in illegal_intervals:
                             illegal_intervals.append(i + 1)
                 else:
                     consec_dir = 1
+            cf_signs = self.analysis.cf_melodic2.signs
             end_index = len(cf) - 2
             consec_dir = 1
             for i in range(2, end_index, 2):
-                interval1 = Interval(cf[i - 2], cf[i])
-                interval2 = Interval(cf[i], cf[i + 2])
-                if interval1.sign == interval2.sign:
+                if cf_signs[i - 2] == cf_signs[i]:
                     consec_dir += 1
                     if consec_dir > max_samedir:
                         if i + 2 not in illegal_intervals:
@@ -929,16 +922,17 @@ class StepRecovery(Rule):
         max_leap = self.analysis.settings['STEP_THRESHOLD'] - 1
         cf_voice = self.analysis.cf_voice
         cp_voice = self.analysis.cp_voice
+        cp_melodic = self.analysis.cp_melodic
         end_index = len(cf_voice) - 1
         for i in range(end_index):
             if cp_voice[i] is None:
                 continue
-            interval = Interval(cp_voice[i], cp_voice[i + 1])
+            interval = cp_melodic[i]
             if interval.span >= max_leap:
                 if i == end_index - 1:
                     illegal_intervals.append(i)
                 else:
-                    interval2 = Interval(cp_voice[i + 1], cp_voice[i + 2])
+                    interval2 = cp_melodic[i + 1]
                     if not interval2.is_second() or interval2.sign == interval.sign:
                         illegal_intervals.append(i)
 
@@ -964,24 +958,23 @@ class CompoundInterval(Rule):
             cf = self.analysis.upper_voice
             cp = self.analysis.lower_voice
             cp_dur = self.analysis.lower_dur
+        cp_compound = self.analysis.cp_melodic.is_compound()
         if species == 1:
+            cf_compound = self.analysis.cf_melodic.is_compound()
             end_index = len(cf) - 1
             for i in range(end_index):
-                interval1 = Interval(cf[i], cf[i + 1])
-                interval2 = Interval(cp[i], cp[i + 1])
-                if interval1.is_compound() or interval2.is_compound():
+                if cf_compound[i] or cp_compound[i]:
                     illegal_intervals.append(i)
         else:
+            cf_compound = self.analysis.cf_melodic2.is_compound()
             end_index = len(cf) - 2
             for i in range(end_index):
                 if cp[i] is not None:
-                    interval = Interval(cp[i], cp[i + 1])
-                    if interval.is_compound() and cp_dur[i] != Ratio(1, 1):
+                    if cp_compound[i] and cp_dur[i] != Ratio(1, 1):
                         if i + 1 not in illegal_intervals:
                             illegal_intervals.append(i + 1)
                 if i % 2 == 0:
-                    interval = Interval(cf[i], cf[i + 2])
-                    if interval.is_compound():
+                    if cf_compound[i]:
                         illegal_intervals.append(i + 2)
         for i in illegal_intervals:
             self.analysis.results.append(f'At #{i + 1}: forbidden compound melodic interval')
@@ -1059,7 +1052,6 @@ class SpeciesAnalysis(Analysis):
         self.upper_voice = []
         self.lower_dur = []
         self.upper_dur = []
-        self.intervals = []
         self.partids = [key[: 2] for key in list(self.tps[0].nmap.keys())]
 
         for tp in self.tps:
@@ -1078,10 +1070,6 @@ class SpeciesAnalysis(Analysis):
                 self.upper_voice.append(None)
             else:
                 self.upper_voice.append(upper_note.pitch)
-            if not isinstance(upper_note, Rest) and not isinstance(lower_note, Rest):
-                self.intervals.append(Interval(lower_note.pitch, upper_note.pitch))
-            else:
-                self.intervals.append(None)
 
         if self.score.get_part(self.partids[0]).name == 'CF':
             self.cflow = False
@@ -1096,6 +1084,16 @@ class SpeciesAnalysis(Analysis):
             self.cp_voice = self.upper_voice
             self.cp_dur = self.upper_dur
 
+        # The harmonic intervals between the voices and the melodic intervals
+        # within each voice (None at rests) are computed once for the rules.
+        self.intervals = IntervalArray(self.lower_voice, self.upper_voice)
+        self.lower_melodic = IntervalArray.melodic(self.lower_voice)
+        self.upper_melodic = IntervalArray.melodic(self.upper_voice)
+        self.cf_melodic = self.lower_melodic if self.cflow else self.upper_melodic
+        self.cp_melodic = self.upper_melodic if self.cflow else self.lower_melodic
+        # in species 2 each cantus firmus note spans two timepoints
+        self.cf_melodic2 = IntervalArray.melodic(self.cf_voice, 2)
+
     ## This function is given to you, it returns your analysis results
     # for the autograder to check.  You can also use this function as
     # a top level call for testing. Just make sure that it always returns
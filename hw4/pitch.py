@@ -12,6 +12,9 @@ from math import pow
 
 
 class Pitch:
+    ## A Pitch is immutable and stores only two integers, see pos() and keynum().
+    __slots__ = ('_pos', '_keynum')
+
     letters = [chr(ord('C') + i) for i in range(5)] + ['A', 'B']
     accidentals = ['bb', 'b', '', '#', '##']
     octaves = ['00'] + [str(i) for i in range(10)]
@@ -34,6 +37,7 @@ class Pitch:
         9: 'A',
         11: 'B'
     }
+    letter_pcs = [0, 2, 4, 5, 7, 9, 11]
     accidental_to_pc = {accidental: i - 2 for i, accidental in enumerate(accidentals)}
     default_to_safe_accidental = {
         'bb': 'ff',
@@ -56,6 +60,15 @@ class Pitch:
     #  the letter and accidental indexes: (letter << 4) + accidental.
     pnums = IntEnum('Pnum', [((letter + accidental), (i << 4) + j) for (i, letter) in enumerate(letters) for (j, accidental) in enumerate(['ff', 'f', '', 's', 'ss'])])
 
+    ## The shared instances of every legal pitch, indexed by every name
+    #  spelling that the parser accepts, by (letter, accidental, octave)
+    #  index tuple, and by (keynum, accidental) as accepted by from_keynum().
+    #  The tables, and the shared empty pitch, are filled in by _build_tables().
+    _names = {}
+    _indexes = {}
+    _keynums = {}
+    _empty = None
+
     ## Creates a Pitch from a string or list, if neither is provided
     #  an empty Pitch is returned.
     #  * Pitch(string) - creates a Pitch from a pitch name string.
@@ -92,14 +105,36 @@ class Pitch:
     #
     # Examples: Pitch('C4'), Pitch('F##2'), Pitch('Gs8'), Pitch('Bb3'), Pitch("Df00"),
     # Pitch([0,3,6]), Pitch()
+    #
+    # Pitches are immutable, so every legal pitch exists only once: the
+    # constructor returns the shared instance from the pitch tables (see
+    # _build_tables()) and only runs the parser below for input missing from
+    # the tables, which is always invalid and raises the appropriate error.
+    def __new__(cls, ref=None):
+        if cls is Pitch:
+            if type(ref) is str:
+                pitch = Pitch._names.get(ref)
+            elif type(ref) is list:
+                pitch = Pitch._indexes.get(tuple(ref)) if all(type(i) is int for i in ref) else None
+            elif ref is None:
+                pitch = Pitch._empty
+            else:
+                pitch = None
+            if pitch is not None:
+                return pitch
+        return super().__new__(cls)
 
     def __init__(self, ref=None):
+        # shared instances are already initialized
+        if hasattr(self, '_keynum'):
+            return
+
         if isinstance(ref, str):
             i = 0
             
             try:
                 if ref[i].capitalize() in Pitch.letters:
-                    self.letter = ref[i].capitalize()
+                    letter = Pitch.letters.index(ref[i].capitalize())
                     i += 1
                 else:
                     raise ValueError("Invalid letter")
@@ -108,41 +143,37 @@ class Pitch:
             
             try:
                 if ref[i : i + 2] == 'bb' or ref[i : i + 2] == 'ff':
-                    self.accidental = 'bb'
+                    accidental = 0
                     i += 2
                 elif ref[i] == 'b' or ref[i] == 'f':
-                    self.accidental = 'b'
+                    accidental = 1
                     i += 1
                 elif ref[i : i + 2] == '##' or ref[i : i + 2] == 'ss':
-                    self.accidental = '##'
+                    accidental = 4
                     i += 2
                 elif ref[i] == '#' or ref[i] == 's':
-                    self.accidental = '#'
+                    accidental = 3
                     i += 1
                 elif ref[i] == 'n':
-                    self.accidental = ''
+                    accidental = 2
                     i += 1
                 else:
-                    self.accidental = ''
+                    accidental = 2
             except:
                 raise ValueError("Invalid accidental")
             
             try:
                 if ref[i] >= '0' and ref[i] <= '9':
-                    self.octave = ref[i]
+                    octave = int(ref[i]) + 1
                     i += 1
                 else:
                     raise ValueError("Invalid octave")
             except:
                 raise ValueError("Octave cannot be empty")
             
-            if self.octave == '0':
-                try:
-                    if ref[i] == '0':
-                        self.octave += '0'
-                        i += 1
-                except:
-                    pass
+            if octave == 1 and ref[i : i + 1] == '0':
+                octave = 0
+                i += 1
             
             if i != len(ref):
                 raise ValueError("Octave should be the end of input")
@@ -152,7 +183,7 @@ class Pitch:
             
             if isinstance(ref[0], int):
                 if ref[0] >= 0 and ref[0] < len(Pitch.letters):
-                    self.letter = Pitch.letters[ref[0]]
+                    letter = ref[0]
                 else:
                     raise ValueError("Invalid letter index")
             else:
@@ -160,7 +191,7 @@ class Pitch:
             
             if isinstance(ref[1], int):
                 if ref[1] >= 0 and ref[1] < len(Pitch.accidentals):
-                    self.accidental = Pitch.accidentals[ref[1]]
+                    accidental = ref[1]
                 else:
                     raise ValueError("Invalid accidental index")
             else:
@@ -168,28 +199,41 @@ class Pitch:
                
             if isinstance(ref[2], int):
                 if ref[2] >= 0 and ref[2] < len(Pitch.octaves):
-                    self.octave = Pitch.octaves[ref[2]]
+                    octave = ref[2]
                 else:
                     raise ValueError("Invalid octave index")
             else:
                 raise TypeError("Octave index is not int")
         elif ref == None:
-            self.letter = None
-            self.accidental = None
-            self.octave = None
+            self._pos = None
+            self._keynum = None
+            return
         else:
             raise TypeError("Argument is not string, list, or None")
-        
-        if not self.is_empty():
-            if self.keynum() < 0 or self.keynum() > 127:
-                raise ValueError("Pitch does not have valid keynum")
 
-        ## A letter index 0-6.
-        # self.letter = None
-        ## An accidental index 0-4.
-        # self.accidental = None
-        ## An octave index 0-10.
-        # self.octave = None
+        keynum = octave * 12 + Pitch.letter_pcs[letter] + accidental - 2
+        if keynum < 0 or keynum > 127:
+            raise ValueError("Keynum is out of range")
+
+        ## The packed octave, letter and accidental indexes, see pos().
+        self._pos = (int(octave) << 8) + (int(letter) << 4) + int(accidental)
+        ## The midi key number, see keynum().
+        self._keynum = int(keynum)
+
+    ## The pitch's letter name 'C' to 'B', or None if the pitch is empty.
+    @property
+    def letter(self):
+        return None if self._pos is None else Pitch.letters[(self._pos >> 4) & 15]
+
+    ## The pitch's accidental name 'bb' to '##', or None if the pitch is empty.
+    @property
+    def accidental(self):
+        return None if self._pos is None else Pitch.accidentals[self._pos & 15]
+
+    ## The pitch's octave name '00' to '9', or None if the pitch is empty.
+    @property
+    def octave(self):
+        return None if self._pos is None else Pitch.octaves[self._pos >> 8]
 
     ## Returns a string displaying information about the
     #  pitch within angle brackets. Information includes the
@@ -198,7 +242,7 @@ class Pitch:
     #  empty the string will show '<Pitch: empty 0x10f263b50>'.
     #  See also: string().
     def __str__(self):
-        return ''
+        return f'<Pitch: {self.string()} {hex(id(self))}>'
 
     ## Prints the external form of the Pitch that, if evaluated
     #  would create a Pitch with the same content as this pitch.
@@ -217,10 +261,9 @@ class Pitch:
     # two values to compare. See: pos().
     def __lt__(self, other):
         if isinstance(other, Pitch):
-            try:
-                return self.pos() < other.pos()
-            except:
+            if self._pos is None or other._pos is None:
                 raise ValueError("Pitch cannot be empty")
+            return self._pos < other._pos
         else:
             raise TypeError("Other is not pitch")
 
@@ -233,10 +276,9 @@ class Pitch:
     # values to compare. See: pos().
     def __le__(self, other):
         if isinstance(other, Pitch):
-            try:
-                return self.pos() <= other.pos()
-            except:
+            if self._pos is None or other._pos is None:
                 raise ValueError("Pitch cannot be empty")
+            return self._pos <= other._pos
         else:
             raise TypeError("Other is not pitch")
 
@@ -249,10 +291,7 @@ class Pitch:
     # values to compare. See: pos().
     def __eq__(self, other):
         if isinstance(other, Pitch):
-            try:
-                return self.pos() == other.pos()
-            except:
-                return False
+            return self._pos is not None and self._pos == other._pos
         else:
             raise TypeError("Other is not pitch")
 
@@ -265,10 +304,7 @@ class Pitch:
     # values to compare. See: pos().
     def __ne__(self, other):
         if isinstance(other, Pitch):
-            try:
-                return self.pos() != other.pos()
-            except:
-                return True
+            return self._pos is None or self._pos != other._pos
         else:
             raise TypeError("Other is not pitch")
 
@@ -281,10 +317,9 @@ class Pitch:
     # values to compare. See: pos().
     def __ge__(self, other):
         if isinstance(other, Pitch):
-            try:
-                return self.pos() >= other.pos()
-            except:
+            if self._pos is None or other._pos is None:
                 raise ValueError("Pitch cannot be empty")
+            return self._pos >= other._pos
         else:
             raise TypeError("Other is not pitch")
 
@@ -297,86 +332,80 @@ class Pitch:
     # values to compare. See: pos().
     def __gt__(self, other):
         if isinstance(other, Pitch):
-            try:
-                return self.pos() > other.pos()
-            except:
+            if self._pos is None or other._pos is None:
                 raise ValueError("Pitch cannot be empty")
+            return self._pos > other._pos
         else:
             raise TypeError("Other is not pitch")
 
+    ## Pickles a Pitch as its name so that unpickling returns the shared
+    # instance. See: Python's pickle module.
+    def __reduce__(self):
+        return (Pitch, () if self._pos is None else (self.string(),))
+
+    ## Returns the pitch itself, since pitches are immutable.
+    def __copy__(self):
+        return self
+
+    ## Returns the pitch itself, since pitches are immutable.
+    def __deepcopy__(self, memo):
+        return self
+
+    ## Returns a hash value for the Pitch, so that equal pitches can be
+    # used as dictionary keys and set members. See: pos().
+    def __hash__(self):
+        return hash(self._pos)
+
     ## Returns a unique integer representing this pitch's position in
     #  the octave-letter-accidental space. The expression to calculate
-    #  this value is (octave<<8) + (letter<<4) + accidental.
+    #  this value is (octave<<8) + (letter<<4) + accidental, where each
+    #  part is an index (see Pitch([l, a, o])). The value is computed once,
+    #  when the pitch is created.
     def pos(self):
-        if not self.is_empty():
-            octave = int(self.octave)
-            
-            if self.octave != '00':
-                octave += 1
-            
-            return (octave << 8) + (Pitch.letter_to_pc[self.letter] << 4) + Pitch.accidental_to_pc[self.accidental] + 2
-        else:
+        if self._pos is None:
             raise ValueError("Pitch cannot be empty")
+        return self._pos
 
     ## Returns true if the Pitch is empty. A pitch is empty if its
     # letter, accidental and octave attributes are None. Only one of
     # these attributes needs to be checked because __init__ will only
     # create a Pitch if all three are legal values or all three are None.
     def is_empty(self):
-        return self.letter == None or self.accidental == None or self.octave == None
+        return self._pos is None
 
     ## Returns a string containing the pitch name including the
     #  letter, accidental, and octave.  For example,
     #  Pitch("C#7").string() would return 'C#7'.
     def string(self):
-        if not self.is_empty():
-            return self.letter + self.accidental + self.octave
-        else:
+        if self._pos is None:
             return 'empty'
+        return self.letter + self.accidental + self.octave
 
     ## Returns the midi key number of the Pitch.
     def keynum(self):
-        if not self.is_empty():
-            midi = int(self.octave) * 12 + Pitch.letter_to_pc[self.letter] + Pitch.accidental_to_pc[self.accidental]
-            
-            if self.octave != '00':
-                midi += 12
-            
-            if midi < 0 or midi > 127:
-                raise ValueError("Keynum is out of range")
-            
-            return midi
-        else:
+        if self._pos is None:
             raise ValueError("Pitch cannot be empty")
+        return self._keynum
 
     ## Returns the pnum (pitch class enum) of the Pitch. Pnums enumerate
     #  and order the letter and accidental of a Pitch so they can be compared,
     #  e.g.: C < C# < Dbb. See also: pnums.
     def pnum(self):
-        if not self.is_empty():
-            return Pitch.pnums[self.letter + Pitch.default_to_safe_accidental[self.accidental]]
-        else:
+        if self._pos is None:
             raise ValueError("Pitch cannot be empty")
+        return Pitch.pnums(self._pos & 255)
 
     ## Returns the pitch class (0-11) of the Pitch.
     def pc(self):
-        if not self.is_empty():
-            pc = Pitch.letter_to_pc[self.letter] + Pitch.accidental_to_pc[self.accidental]
-            pc = (pc + 12) % 12
-            
-            return pc
-        else:
+        if self._pos is None:
             raise ValueError("Pitch cannot be empty")
+        return self._keynum % 12
 
     ## Returns the hertz value of the Pitch.
     def hertz(self):
-        if not self.is_empty():
-            try:
-                return 440.0 * 2 ** ((self.keynum() - 69) / 12)
-            except:
-                raise ValueError("Invalid keynum")
-        else:
+        if self._pos is None:
             raise ValueError("Pitch cannot be empty")
+        return 440.0 * 2 ** ((self._keynum - 69) / 12)
 
     ## A @classmethod that creates a Pitch for the specified
     #  midi key number.
@@ -390,6 +419,11 @@ class Pitch:
     #  accidental.
     @classmethod
     def from_keynum(cls, keynum, accidental=None):
+        if type(keynum) is int and type(accidental) in (str, type(None)):
+            pitch = Pitch._keynums.get((keynum, accidental))
+            if pitch is not None:
+                return pitch
+
         if not isinstance(keynum, int):
             raise TypeError("Keynum is not int")
         elif keynum < 0 or keynum > 127:
@@ -428,4 +462,33 @@ class Pitch:
             except:
                 raise ValueError("Pitch requested does not support the specified accidental")
         else:
-            raise TypeError("Accidental is not string")
\ No newline at end of file
+            raise TypeError("Accidental is not string")
+
+    ## A private @classmethod that creates every legal pitch once and fills
+    #  in the pitch tables. It is called once when this module is imported.
+    @classmethod
+    def _build_tables(cls):
+        spellings = [['bb', 'ff'], ['b', 'f'], ['', 'n'], ['#', 's'], ['##', 'ss']]
+        cls._empty = cls()
+        for l, letter in enumerate(cls.letters):
+            for a, accidental_names in enumerate(spellings):
+                for o, octave in enumerate(cls.octaves):
+                    try:
+                        pitch = cls(f'{letter}{accidental_names[0]}{octave}')
+                    except ValueError:
+                        continue
+                    cls._indexes[(l, a, o)] = pitch
+                    for accidental in accidental_names:
+                        cls._names[letter + accidental + octave] = pitch
+                        cls._names[letter.lower() + accidental + octave] = pitch
+        for keynum in range(128):
+            for accidental in [None] + cls.accidentals:
+                if accidental == '':
+                    continue
+                try:
+                    cls._keynums[(keynum, accidental)] = cls.from_keynum(keynum, accidental)
+                except ValueError:
+                    pass
+
+
+Pitch._build_tables()
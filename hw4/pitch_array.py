@@ -0,0 +1,208 @@
+##############################################################################
+## @file
+#  A columnar collection of pitches.
+#  A PitchArray stores the letter, accidental and octave indexes of many
+#  pitches (see Pitch([l, a, o])) in three signed byte columns (see Python's
+#  array module) and computes keynums, pitch classes, pnums, hertz values,
+#  positions, comparisons and statistics for the whole collection at once,
+#  without going through a Pitch object per note. Empty pitches (e.g. rests
+#  in a melody) are stored as -1 in every column.
+
+from array import array
+from math import nan
+
+from .pitch import Pitch
+
+
+## A class that implements an array of pitches.
+#
+# A PitchArray holds three attributes of equal length:
+# * letters  An array of letter indexes 0-6, or -1 for an empty pitch.
+# * accidentals  An array of accidental indexes 0-4, or -1.
+# * octaves  An array of octave indexes 0-10, or -1.
+class PitchArray:
+
+    ## Creates a PitchArray from an iterable of Pitches.
+    # @param pitches  The pitches to store, defaults to an empty array.
+    #
+    # The constructor should raise a TypeError if a value is not a Pitch.
+    def __init__(self, pitches=()):
+        self.letters = array('b')
+        self.accidentals = array('b')
+        self.octaves = array('b')
+        for pitch in pitches:
+            if not isinstance(pitch, Pitch):
+                raise TypeError(f"Invalid pitch: {pitch}.")
+            if pitch.is_empty():
+                self.letters.append(-1)
+                self.accidentals.append(-1)
+                self.octaves.append(-1)
+            else:
+                pos = pitch.pos()
+                self.letters.append((pos >> 4) & 15)
+                self.accidentals.append(pos & 15)
+                self.octaves.append(pos >> 8)
+
+    ## Private method that creates a PitchArray directly from three columns.
+    @classmethod
+    def _make(cls, letters, accidentals, octaves):
+        self = cls.__new__(cls)
+        self.letters = letters
+        self.accidentals = accidentals
+        self.octaves = octaves
+        return self
+
+    ## Returns a string showing the pitch names and the hex id of the array.
+    # Example: '<PitchArray: [C4, E4, empty, G4] 0x109877c50>'
+    def __str__(self):
+        return f'<PitchArray: [{", ".join(p.string() for p in self)}] {hex(id(self))}>'
+
+    ## Returns a string expression that will evaluate to this array.
+    # Example: 'PitchArray([Pitch("C4"), Pitch()])'
+    def __repr__(self):
+        return f'PitchArray([{", ".join(repr(p) for p in self)}])'
+
+    ## Returns the number of pitches in the array.
+    def __len__(self):
+        return len(self.letters)
+
+    ## Implements PitchArray iteration by returning an iterator of Pitches.
+    def __iter__(self):
+        return map(PitchArray._pitch, self.letters, self.accidentals, self.octaves)
+
+    ## Returns the Pitch at an integer index, or a new PitchArray for a slice.
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return PitchArray._make(self.letters[index], self.accidentals[index], self.octaves[index])
+        return PitchArray._pitch(self.letters[index], self.accidentals[index], self.octaves[index])
+
+    ## Private method that returns the (shared) Pitch for three indexes.
+    @staticmethod
+    def _pitch(letter, accidental, octave):
+        return Pitch() if letter < 0 else Pitch([letter, accidental, octave])
+
+    ## Returns a list of the array's pitches.
+    def to_pitches(self):
+        return list(self)
+
+    ## Returns an array of the positions of the pitches, see Pitch.pos(),
+    # with -1 for empty pitches.
+    def pos(self):
+        return array('h', [-1 if l < 0 else (o << 8) + (l << 4) + a
+                           for l, a, o in zip(self.letters, self.accidentals, self.octaves)])
+
+    ## Returns an array of the midi key numbers of the pitches, see
+    # Pitch.keynum(), with -1 for empty pitches.
+    def keynum(self):
+        pcs = Pitch.letter_pcs
+        return array('b', [-1 if l < 0 else o * 12 + pcs[l] + a - 2
+                           for l, a, o in zip(self.letters, self.accidentals, self.octaves)])
+
+    ## Returns an array of the pitch classes of the pitches, see Pitch.pc(),
+    # with -1 for empty pitches.
+    def pc(self):
+        pcs = Pitch.letter_pcs
+        return array('b', [-1 if l < 0 else (pcs[l] + a - 2) % 12
+                           for l, a in zip(self.letters, self.accidentals)])
+
+    ## Returns an array of the integer pnum values of the pitches, see
+    # Pitch.pnum() and Pitch.pnums, with -1 for empty pitches.
+    def pnum(self):
+        return array('b', [-1 if l < 0 else (l << 4) + a for l, a in zip(self.letters, self.accidentals)])
+
+    ## Returns an array of the hertz values of the pitches, see Pitch.hertz(),
+    # with NaN for empty pitches.
+    def hertz(self):
+        return array('d', [nan if k < 0 else 440.0 * 2 ** ((k - 69) / 12) for k in self.keynum()])
+
+    ## Returns an array of 0/1 flags, 1 where a pitch is empty.
+    def is_empty(self):
+        return array('b', [l < 0 for l in self.letters])
+
+    ## Private method that returns an array of 0/1 flags holding the
+    # element-wise result of test(a, b) on the positions of the pitches and
+    # other, a PitchArray of the same length or a single Pitch. Comparisons
+    # with an empty pitch are 0, except for != which is 1, as with Pitch.
+    #
+    # The method should raise a ValueError if other is a PitchArray of a
+    # different length, and a TypeError if other is not a PitchArray or Pitch.
+    def _compare(self, other, test, empty=0):
+        if isinstance(other, PitchArray):
+            if len(other) != len(self):
+                raise ValueError("PitchArrays have different lengths")
+            others = other.pos()
+        elif isinstance(other, Pitch):
+            others = [-1 if other.is_empty() else other.pos()] * len(self)
+        else:
+            raise TypeError("Other is not a PitchArray or Pitch")
+        return array('b', [empty if a < 0 or b < 0 else test(a, b) for a, b in zip(self.pos(), others)])
+
+    ## Implements element-wise PitchArray < other. See _compare().
+    # @returns An array of 0/1 flags, one per pitch.
+    def __lt__(self, other):
+        return self._compare(other, int.__lt__)
+
+    ## Implements element-wise PitchArray <= other. See _compare().
+    def __le__(self, other):
+        return self._compare(other, int.__le__)
+
+    ## Implements element-wise PitchArray == other. See _compare().
+    def __eq__(self, other):
+        return self._compare(other, int.__eq__)
+
+    ## Implements element-wise PitchArray != other. See _compare().
+    def __ne__(self, other):
+        return self._compare(other, int.__ne__, 1)
+
+    ## Implements element-wise PitchArray >= other. See _compare().
+    def __ge__(self, other):
+        return self._compare(other, int.__ge__)
+
+    ## Implements element-wise PitchArray > other. See _compare().
+    def __gt__(self, other):
+        return self._compare(other, int.__gt__)
+
+    __hash__ = None
+
+    ## Returns a list of the indexes that sort the pitches from lowest to
+    # highest. The sort is stable and empty pitches are placed last.
+    def argsort(self):
+        pos = self.pos()
+        return sorted(range(len(pos)), key=lambda i: (pos[i] < 0, pos[i]))
+
+    ## Returns the lowest Pitch in the array, ignoring empty pitches.
+    #
+    # The method should raise a ValueError if the array has no non-empty pitches.
+    def min(self):
+        pos = [p for p in self.pos() if p >= 0]
+        if not pos:
+            raise ValueError("PitchArray has no pitches")
+        pos = min(pos)
+        return Pitch([(pos >> 4) & 15, pos & 15, pos >> 8])
+
+    ## Returns the highest Pitch in the array, ignoring empty pitches.
+    #
+    # The method should raise a ValueError if the array has no non-empty pitches.
+    def max(self):
+        pos = [p for p in self.pos() if p >= 0]
+        if not pos:
+            raise ValueError("PitchArray has no pitches")
+        pos = max(pos)
+        return Pitch([(pos >> 4) & 15, pos & 15, pos >> 8])
+
+    ## Returns a sorted PitchArray of the distinct non-empty pitches.
+    # @param counts  If True also return a list with the number of
+    # occurrences of each distinct pitch. Defaults to False.
+    # @returns A PitchArray, or a (PitchArray, counts) tuple.
+    def unique(self, counts=False):
+        histogram = {}
+        for p in self.pos():
+            if p >= 0:
+                histogram[p] = histogram.get(p, 0) + 1
+        keys = sorted(histogram)
+        pitches = PitchArray._make(array('b', [(p >> 4) & 15 for p in keys]),
+                                   array('b', [p & 15 for p in keys]),
+                                   array('b', [p >> 8 for p in keys]))
+        if counts:
+            return pitches, [histogram[p] for p in keys]
+        return pitches
@@ -0,0 +1,149 @@
+##############################################################################
+## @file
+#  Memory and comparison benchmarks for the packed Pitch representation.
+#
+#  LegacyPitch below rebuilds the way Pitch used to store and compare its
+#  data: three strings in a per-instance __dict__, with pos() and keynum()
+#  re-deriving their values from those strings on every call. Both classes
+#  are measured on the same random pitch names.
+#
+#  The Pitch constructor returns shared instances, so creating pitches
+#  allocates nothing. The bytes/pitch row therefore measures UnsharedPitch,
+#  which has the same slots but skips the pitch tables, and the cost of the
+#  tables themselves is printed below the results.
+#
+#  Run the benchmarks from the repository root with:
+#  @code
+#  $ python3 -m hw4.pitch_bench
+#  @endcode
+
+import random
+import sys
+import timeit
+import tracemalloc
+
+from .pitch import Pitch
+
+
+## A copy of the data layout and comparison code of the original Pitch.
+class LegacyPitch:
+    def __init__(self, name):
+        pitch = Pitch(name)
+        self.letter = pitch.letter
+        self.accidental = pitch.accidental
+        self.octave = pitch.octave
+
+    def is_empty(self):
+        return self.letter == None or self.accidental == None or self.octave == None
+
+    def pos(self):
+        if not self.is_empty():
+            octave = int(self.octave)
+            if self.octave != '00':
+                octave += 1
+            return (octave << 8) + (Pitch.letter_to_pc[self.letter] << 4) + Pitch.accidental_to_pc[self.accidental] + 2
+        else:
+            raise ValueError("Pitch cannot be empty")
+
+    def keynum(self):
+        if not self.is_empty():
+            midi = int(self.octave) * 12 + Pitch.letter_to_pc[self.letter] + Pitch.accidental_to_pc[self.accidental]
+            if self.octave != '00':
+                midi += 12
+            if midi < 0 or midi > 127:
+                raise ValueError("Keynum is out of range")
+            return midi
+        else:
+            raise ValueError("Pitch cannot be empty")
+
+    def __lt__(self, other):
+        try:
+            return self.pos() < other.pos()
+        except:
+            raise ValueError("Pitch cannot be empty")
+
+    def __eq__(self, other):
+        try:
+            return self.pos() == other.pos()
+        except:
+            return False
+
+
+## A Pitch that is parsed on every construction instead of being looked up
+#  in the pitch tables, to measure the size of one instance.
+class UnsharedPitch(Pitch):
+    __slots__ = ()
+
+
+## Returns a list of count random legal pitch names.
+def sample_names(count, seed=105):
+    rng = random.Random(seed)
+    names = []
+    while len(names) < count:
+        name = rng.choice(Pitch.letters) + rng.choice(Pitch.accidentals) + rng.choice(Pitch.octaves)
+        try:
+            Pitch(name)
+        except ValueError:
+            continue
+        names.append(name)
+    return names
+
+
+## Returns the average number of bytes allocated per instance when cls
+#  creates one instance for every name.
+def bytes_per_instance(cls, names):
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    pitches = [cls(name) for name in names]
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+    # the list holding the pitches is not part of their cost
+    size = sum(stat.size_diff for stat in after.compare_to(before, 'filename')) - pitches.__sizeof__()
+    return size / len(pitches)
+
+
+## Returns the number of distinct shared pitches and the total bytes of the
+#  pitch tables: the dictionaries, their keys and the pitches themselves.
+def table_bytes():
+    tables = [Pitch._names, Pitch._indexes, Pitch._keynums]
+    pitches = {id(pitch): pitch for table in tables for pitch in table.values()}
+    pitches[id(Pitch._empty)] = Pitch._empty
+    size = sum(sys.getsizeof(table) + sum(sys.getsizeof(key) for key in table) for table in tables)
+    return len(pitches), size + sum(sys.getsizeof(pitch) for pitch in pitches.values())
+
+
+## Returns the best time in seconds of running function() number times.
+def best_time(function, number, repeat=3):
+    return min(timeit.repeat(function, number=number, repeat=repeat))
+
+
+## Runs every benchmark and returns a list of (name, legacy, current) results.
+def run(count=100000, number=1):
+    names = sample_names(count)
+    legacy = [LegacyPitch(name) for name in names]
+    current = [Pitch(name) for name in names]
+    legacy_pairs = list(zip(legacy, legacy[1:]))
+    current_pairs = list(zip(current, current[1:]))
+    return [
+        ('bytes/pitch', bytes_per_instance(LegacyPitch, names), bytes_per_instance(UnsharedPitch, names)),
+        ('compare < (s)', best_time(lambda: [a < b for a, b in legacy_pairs], number),
+         best_time(lambda: [a < b for a, b in current_pairs], number)),
+        ('compare == (s)', best_time(lambda: [a == b for a, b in legacy_pairs], number),
+         best_time(lambda: [a == b for a, b in current_pairs], number)),
+        ('sort (s)', best_time(lambda: sorted(legacy), number), best_time(lambda: sorted(current), number)),
+        ('keynum (s)', best_time(lambda: [p.keynum() for p in legacy], number),
+         best_time(lambda: [p.keynum() for p in current], number)),
+    ]
+
+
+## Prints a table of the benchmark results.
+def main():
+    print(f'{"benchmark":<16}{"legacy":>12}{"current":>12}{"ratio":>9}')
+    for name, legacy, current in run():
+        print(f'{name:<16}{legacy:>12.4f}{current:>12.4f}{legacy / current:>8.1f}x')
+    count, size = table_bytes()
+    print(f'pitch tables: {count} shared pitches, {size / 1024:.1f} KB')
+
+
+if __name__ == '__main__':
+    main()
@@ -2,6 +2,9 @@
 
 from .pitch import Pitch
 
+## The pitch class of each natural letter C-B.
+_letter_pcs = (0, 2, 4, 5, 7, 9, 11)
+
 ## A class that implements musical intervals.
 #
 #  An Interval measures the distance between two Pitches. Interval distance
@@ -25,6 +28,8 @@ from .pitch import Pitch
 
 class Interval:
 
+    __slots__ = ('span', 'qual', 'xoct', 'sign', '_steps', '_semitones', '_mask', '_string')
+
     ## Creates an Interval from a string, list, or two Pitches.
     #  * Interval(string) - creates an Interval from a pitch string.
     #  * Interval([s, q, x, s]) - creates a Pitch from a list of four
@@ -91,8 +96,64 @@ class Interval:
     imperfect_index = 6
     
     span_to_keynum = [0, 2, 4, 5, 7, 9, 11, 12]
-    
+
+    ## The shared Interval for every signed (diatonic steps, semitones)
+    #  distance between two legal pitches, see from_steps(). Filled in by
+    #  _build_tables().
+    _intervals = {}
+
+    ## The shared Interval for every legal interval name (e.g. 'M3', '-dd7'
+    #  or '+11') and for every [span, qual, xoct, sign] list. Filled in by
+    #  _build_tables().
+    _names = {}
+    _lists = {}
+
+    ## Classification flags combined in the mask of an interval, see mask().
+    #  Span flags:
+    UNISON, SECOND, THIRD, FOURTH, FIFTH, SIXTH, SEVENTH, OCTAVE = (1 << i for i in range(8))
+    #  Quality flags, of any degree of diminution or augmentation:
+    DIMINISHED, MINOR, PERFECT, MAJOR, AUGMENTED = (1 << i for i in range(8, 13))
+    #  Family, consonance, size and direction flags:
+    PERFECT_TYPE, IMPERFECT_TYPE, CONSONANT, DISSONANT = (1 << i for i in range(13, 17))
+    SIMPLE, COMPOUND, ASCENDING, DESCENDING = (1 << i for i in range(17, 21))
+
+    ## The span, quality, family and consonance flags of every (span, qual)
+    #  pair, indexed [span][qual]. Filled in by _build_tables().
+    _masks = []
+
+    ## The quality index of every quality symbol and letter accepted by the
+    #  is_unison() family of predicates. Filled in by _build_tables().
+    _qual_indexes = {}
+
+    ## Returns the shared Interval for a legal interval name, a list of four
+    #  legal indexes or two non-empty Pitches from the _names, _lists and
+    #  _intervals tables, so that constructing an interval costs a dictionary
+    #  lookup (plus two subtractions for Pitches). Intervals are immutable
+    #  (see __setattr__()) so the same instance can be handed out every time.
+    #  Input missing from the tables is always invalid, and is constructed
+    #  by __init__() to raise the appropriate error.
+    def __new__(cls, arg, other=None):
+        if cls is Interval:
+            interval = None
+            if type(arg) is str:
+                if other is None:
+                    interval = Interval._names.get(arg)
+            elif type(arg) is list:
+                if other is None and len(arg) == 4 and all(type(i) is int for i in arg):
+                    interval = Interval._lists.get(tuple(arg))
+            elif type(arg) is Pitch and type(other) is Pitch and not arg.is_empty() and not other.is_empty():
+                pos1, pos2 = arg.pos(), other.pos()
+                steps = (pos2 >> 8) * 7 + ((pos2 >> 4) & 15) - (pos1 >> 8) * 7 - ((pos1 >> 4) & 15)
+                interval = Interval._intervals.get((steps, other.keynum() - arg.keynum()))
+            if interval is not None:
+                return interval
+        return super().__new__(cls)
+
     def __init__(self, arg, other=None):
+        # shared instances are already initialized
+        if hasattr(self, 'sign'):
+            return
+
         if isinstance(arg, str):
             if other != None:
                 raise TypeError("Expected 1 string argument")
@@ -150,24 +211,30 @@ class Interval:
         elif sign != -1 and sign != 1:
             raise ValueError("Expected sign to be either 1 or -1")
 
-        self.span = span
-        self.qual = qual
-        self.xoct = xoct
-        self.sign = sign
-
-        if self.sign * self.semitones() < 0:
+        if span == 0 and xoct > 0:
+            span = 7
+            xoct -= 1
+
+        object.__setattr__(self, 'span', span)
+        object.__setattr__(self, 'qual', qual)
+        object.__setattr__(self, 'xoct', xoct)
+        object.__setattr__(self, 'sign', sign)
+        mask = Interval._masks[span][qual] | (Interval.COMPOUND if xoct else Interval.SIMPLE)
+        object.__setattr__(self, '_mask', mask | (Interval.ASCENDING if sign == 1 else Interval.DESCENDING))
+        semitones = (Interval.span_to_keynum[span] + self._to_iq() + xoct * 12) * sign
+        object.__setattr__(self, '_steps', (span + xoct * 7) * sign)
+        object.__setattr__(self, '_semitones', semitones)
+        object.__setattr__(self, '_string', f'{"-" if sign == -1 else ""}{Interval.qualities[qual]}{span + xoct * 7 + 1}')
+
+        if sign * semitones < 0:
             raise ValueError("Higher note has lower pitch")
-        elif abs(self.semitones()) < 0 or abs(self.semitones()) > 127:
+        elif abs(semitones) > 127:
             raise ValueError("Semitones of Interval instance not in range 0-127")
         elif Interval.span_names[self.span] != 'fifth' and Interval.qualities[self.qual] == 'ooooo':
             raise ValueError("Only the span of a fifth can be quintuply diminished")
         elif Interval.span_names[self.span] != 'fourth' and Interval.qualities[self.qual] == '+++++':
             raise ValueError("Only the span of a fourth can be quintuply augmented")
 
-        if self.span == 0 and self.xoct > 0:
-            self.span = 7
-            self.xoct -= 1
-
     ## A private method that accepts an interval string and parses it into four
     # integer values: span, qual, xoct, sign. If all four values can be parsed
     # from the string they should be passed to the _init_from_list() method to
@@ -223,54 +290,42 @@ class Interval:
         if not isinstance(pitch1, Pitch) or not isinstance(pitch2, Pitch):
             raise TypeError("Expected two Pitch objects")
 
-        span, qual, xoct, sign = (-1, -1, 0, 0)
+        pos1, pos2 = pitch1.pos(), pitch2.pos()
+        steps = (pos2 >> 8) * 7 + ((pos2 >> 4) & 15) - (pos1 >> 8) * 7 - ((pos1 >> 4) & 15)
+        self._init_from_list(Interval._steps_to_list(steps, pitch2.keynum() - pitch1.keynum()))
 
-        if pitch1 > pitch2:
-            if pitch1.keynum() < pitch2.keynum():
-                raise ValueError("High note has lower pitch")
-
-            value2, value1 = pitch1.pos(), pitch2.pos()
-            sign = -1
+    ## A private method that converts the signed distance between two pitches,
+    # measured in diatonic steps (lines and spaces) and semitones, into the
+    # [span, qual, xoct, sign] list of the interval between them. Going down
+    # in steps, or down in semitones on the same step, is descending.
+    #
+    # The method should raise a ValueError if the steps and semitones move
+    # in opposite directions or the semitones are too far from the span for
+    # any quality.
+    @staticmethod
+    def _steps_to_list(steps, semitones):
+        if steps < 0 or (steps == 0 and semitones < 0):
+            steps, semitones, sign = -steps, -semitones, -1
         else:
-            if pitch1.keynum() > pitch2.keynum():
-                raise ValueError("High note has lower pitch")
-
-            value1, value2 = pitch1.pos(), pitch2.pos()
             sign = 1
-        accidental1, accidental2 = value1 - (value1 >> 4 << 4), value2 - (value2 >> 4 << 4)
-        value1, value2 = value1 >> 4, value2 >> 4
-        letter1, letter2 = value1 - (value1 >> 4 << 4), value2 - (value2 >> 4 << 4)
-        value1, value2 = value1 >> 4, value2 >> 4
-        octave1, octave2 = value1, value2
+        if semitones < 0:
+            raise ValueError("High note has lower pitch")
 
-        span = (octave2 - octave1) * 7 + (letter2 - letter1)
-
-        if span % 7 == 0:
-            if span <= 7:
-                new_span = span
-                xoct = 0
-            else:
-                new_span = 7
-                xoct = span // 7 - 1
+        if steps % 7 == 0 and steps > 0:
+            span, xoct = 7, steps // 7 - 1
         else:
-            xoct = span // 7
-            new_span = span % 7
+            span, xoct = steps % 7, steps // 7
 
-        perfect = span % 7 in Interval.perfect_spans
-        if perfect:
-            index = Interval.perfect_index
+        qual = semitones - Interval.span_to_keynum[span] - xoct * 12
+        if span in Interval.perfect_spans:
+            qualities, qual = Interval.perfect_qualities, qual + Interval.perfect_index
         else:
-            index = Interval.imperfect_index
-
-        qual = abs(pitch2.keynum() - pitch1.keynum()) - Interval.span_to_keynum[new_span] - xoct * 12 + index
+            qualities, qual = Interval.imperfect_qualities, qual + Interval.imperfect_index
+        if qual < 0 or qual >= len(qualities):
+            raise ValueError("Pitches are too far apart for any quality")
 
-        if perfect:
-            qual = Interval.qualities.index(Interval.perfect_qualities[qual])
-        else:
-            qual = Interval.qualities.index(Interval.imperfect_qualities[qual])
+        return [span, Interval.qualities.index(qualities[qual]), xoct, sign]
 
-        self.__init__([new_span, qual, xoct, sign])
-        
     ## Returns a string displaying information about the
     #  Interval within angle brackets. Information includes the
     #  the class name, the interval text, the span, qual, xoct and sign
@@ -285,6 +340,31 @@ class Interval:
     def __repr__(self):
         return f'Interval("{self.string()}")'
 
+    ## Intervals are immutable, since Interval(pitch1, pitch2) shares one
+    #  instance between all pairs of pitches at the same distance.
+    #
+    #  The method always raises an AttributeError.
+    def __setattr__(self, name, value):
+        raise AttributeError("Interval is immutable")
+
+    ## Pickles an Interval as its list of values so that unpickling goes
+    #  through the constructor.
+    def __reduce__(self):
+        return (Interval, (self.to_list(),))
+
+    ## Returns the interval itself, since intervals are immutable.
+    def __copy__(self):
+        return self
+
+    ## Returns the interval itself, since intervals are immutable.
+    def __deepcopy__(self, memo):
+        return self
+
+    ## Returns a hash value for the Interval, so that equal intervals can be
+    #  used as dictionary keys and set members. See: pos().
+    def __hash__(self):
+        return hash(self.pos())
+
     ## Implements Interval < Interval.
     # @param other The interval to compare with this interval.
     # @returns True if this interval is less than the other.
@@ -377,14 +457,7 @@ class Interval:
     ## Returns a string containing the interval name.
     #  For example, Interval('-P5').string() would return '-P5'.
     def string(self):
-        if self.sign == -1:
-            string = '-'
-        else:
-            string = ''
-
-        string += f'{Interval.qualities[self.qual]}{self.span + self.xoct * 7 + 1}'
-
-        return string
+        return self._string
 
     ## Returns the full interval name, e.g. 'doubly-augmented third'
     #  or 'descending augmented sixth'
@@ -459,9 +532,9 @@ class Interval:
     # 'P', 'M' 'm' 'd' 'A' 'o' '+' and so on. See: _to_iq().
     def is_unison(self, qual=None):
         if qual == None:
-            return self.span == 0
+            return self._mask & Interval.UNISON != 0
         else:
-            return self.span == 0 and Interval.quality_letter_to_symbol.get(Interval.qualities[self.qual], Interval.qualities[self.qual]) == Interval.quality_letter_to_symbol.get(qual, qual)
+            return self.span == 0 and self.qual == Interval._qual_indexes.get(qual)
 
     ## Returns true if the interval is a second otherwise false.
     # @param qual If specified the predicate tests for that specific
@@ -469,9 +542,9 @@ class Interval:
     # 'P', 'M' 'm' 'd' 'A' 'o' '+' and so on. See: _to_iq().
     def is_second(self, qual=None):
         if qual == None:
-            return self.span == 1
+            return self._mask & Interval.SECOND != 0
         else:
-            return self.span == 1 and Interval.quality_letter_to_symbol.get(Interval.qualities[self.qual], Interval.qualities[self.qual]) == Interval.quality_letter_to_symbol.get(qual, qual)
+            return self.span == 1 and self.qual == Interval._qual_indexes.get(qual)
 
     ## Returns true if the interval is a third otherwise false.
     # @param qual If specified the predicate tests for that specific
@@ -479,9 +552,9 @@ class Interval:
     # 'P', 'M' 'm' 'd' 'A' 'o' '+' and so on. See: _to_iq().
     def is_third(self, qual=None):
         if qual == None:
-            return self.span == 2
+            return self._mask & Interval.THIRD != 0
         else:
-            return self.span == 2 and Interval.quality_letter_to_symbol.get(Interval.qualities[self.qual], Interval.qualities[self.qual]) == Interval.quality_letter_to_symbol.get(qual, qual)
+            return self.span == 2 and self.qual == Interval._qual_indexes.get(qual)
 
     ## Returns true if the interval is a fourth otherwise false.
     # @param qual If specified the predicate tests for that specific
@@ -489,9 +562,9 @@ class Interval:
     # 'P', 'M' 'm' 'd' 'A' 'o' '+' and so on. See: _to_iq().
     def is_fourth(self, qual=None):
         if qual == None:
-            return self.span == 3
+            return self._mask & Interval.FOURTH != 0
         else:
-            return self.span == 3 and Interval.quality_letter_to_symbol.get(Interval.qualities[self.qual], Interval.qualities[self.qual]) == Interval.quality_letter_to_symbol.get(qual, qual)
+            return self.span == 3 and self.qual == Interval._qual_indexes.get(qual)
 
     ## Returns true if the interval is a fifth otherwise false.
     # @param qual If specified the predicate tests for that specific
@@ -499,9 +572,9 @@ class Interval:
     # 'P', 'M' 'm' 'd' 'A' 'o' '+' and so on. See: _to_iq().
     def is_fifth(self, qual=None):
         if qual == None:
-            return self.span == 4
+            return self._mask & Interval.FIFTH != 0
         else:
-            return self.span == 4 and Interval.quality_letter_to_symbol.get(Interval.qualities[self.qual], Interval.qualities[self.qual]) == Interval.quality_letter_to_symbol.get(qual, qual)
+            return self.span == 4 and self.qual == Interval._qual_indexes.get(qual)
 
     ## Returns true if the interval is a sixth otherwise false.
     # @param qual If specified the predicate tests for that specific
@@ -509,9 +582,9 @@ class Interval:
     # 'P', 'M' 'm' 'd' 'A' 'o' '+' and so on. See: _to_iq().
     def is_sixth(self, qual=None):
         if qual == None:
-            return self.span == 5
+            return self._mask & Interval.SIXTH != 0
         else:
-            return self.span == 5 and Interval.quality_letter_to_symbol.get(Interval.qualities[self.qual], Interval.qualities[self.qual]) == Interval.quality_letter_to_symbol.get(qual, qual)
+            return self.span == 5 and self.qual == Interval._qual_indexes.get(qual)
 
     ## Returns true if the interval is a seventh otherwise false.
     # @param qual If specified the predicate tests for that specific
@@ -519,9 +592,9 @@ class Interval:
     # 'P', 'M' 'm' 'd' 'A' 'o' '+' and so on. See: _to_iq().
     def is_seventh(self, qual=None):
         if qual == None:
-            return self.span == 6
+            return self._mask & Interval.SEVENTH != 0
         else:
-            return self.span == 6 and Interval.quality_letter_to_symbol.get(Interval.qualities[self.qual], Interval.qualities[self.qual]) == Interval.quality_letter_to_symbol.get(qual, qual)
+            return self.span == 6 and self.qual == Interval._qual_indexes.get(qual)
 
     ## Returns true if the interval is an octave otherwise false.
     # @param qual If specified the predicate tests for that specific
@@ -529,90 +602,92 @@ class Interval:
     # 'P', 'M' 'm' 'd' 'A' 'o' '+' and so on. See: _to_iq().
     def is_octave(self, qual=None):
         if qual == None:
-            return self.span == 7
+            return self._mask & Interval.OCTAVE != 0
         else:
-            return self.span == 7 and Interval.quality_letter_to_symbol.get(Interval.qualities[self.qual], Interval.qualities[self.qual]) == Interval.quality_letter_to_symbol.get(qual, qual)
+            return self.span == 7 and self.qual == Interval._qual_indexes.get(qual)
 
     ## Returns a 'diminution count' 1-5 if the interval is diminished else False.
     # For example, if the interval is doubly-diminished then 2 is returned.
     # If the interval not diminished at all (e.g. is perfect, augmented, minor or
     # major) then False is returned.
     def is_diminished(self):
-        quality = Interval.qualities[self.qual]
-        if quality in Interval.diminishes:
-            return len(quality)
+        if self._mask & Interval.DIMINISHED:
+            return len(Interval.qualities[self.qual])
         else:
             return False
 
     ## Returns true if the interval is minor, otherwise false.
     def is_minor(self):
-        return Interval.qualities[self.qual] == 'm'
+        return self._mask & Interval.MINOR != 0
 
     ## Returns true if the interval is perfect, otherwise false.
     def is_perfect(self):
-        return Interval.qualities[self.qual] == 'P'
+        return self._mask & Interval.PERFECT != 0
 
     ## Returns true if the interval is major, otherwise false.
     def is_major(self):
-        return Interval.qualities[self.qual] == 'M'
+        return self._mask & Interval.MAJOR != 0
 
     ## Returns a 'augmentation count' 1-5 if the interval is augmented else False.
     # For example, if the interval is doubly-augmented then 2 is returned.
     # If the interval not augmented at all (e.g. is perfect, diminished, minor or
     # major) then False is returned.
     def is_augmented(self):
-        quality = Interval.qualities[self.qual]
-        if quality in Interval.augments:
-            return len(quality)
+        if self._mask & Interval.AUGMENTED:
+            return len(Interval.qualities[self.qual])
         else:
             return False
 
     ## Returns true if the interval belongs to the 'perfect interval'
     #  family, i.e. it is a Unison, 4th, 5th, or Octave.
     def is_perfect_type(self):
-        return self.span in Interval.perfect_spans
+        return self._mask & Interval.PERFECT_TYPE != 0
 
     ## Returns true if this interval belongs to the 'imperfect interval'
     #  family, i.e. it is a 2nd, 3rd, 6th, or 7th.
     def is_imperfect_type(self):
-        return self.span in Interval.imperfect_spans
+        return self._mask & Interval.IMPERFECT_TYPE != 0
 
     ## Returns true if this is a simple interval, i.e. its span is
     #  less-than-or-equal to an octave.
     def is_simple(self):
-        return self.xoct == 0
+        return self._mask & Interval.SIMPLE != 0
 
     ## Returns true if this is a compound interval, i.e. its span is
     #  more than an octave (an octave is a simple interval).
     def is_compound(self):
-        return self.xoct > 0
+        return self._mask & Interval.COMPOUND != 0
 
     ## Returns true if this interval's sign is 1.
     def is_ascending(self):
-        return self.sign == 1
+        return self._mask & Interval.ASCENDING != 0
 
     ## Returns true if this interval's sign is -1.
     def is_descending(self):
-        return self.sign == -1
+        return self._mask & Interval.DESCENDING != 0
 
     ## Returns true if the interval is a consonant interval. In this
     # context the perfect fourth should be considered consonant.
     def is_consonant(self):
-        if self.is_perfect_type():
-            return self.is_perfect()
-        else:
-            return self.is_third('m') or self.is_third('M') or self.is_sixth('m') or self.is_sixth('M')
+        return self._mask & Interval.CONSONANT != 0
 
     ## Returns true if the interval is not a consonant interval.
     def is_dissonant(self):
-        return not self.is_consonant()
+        return self._mask & Interval.DISSONANT != 0
 
     ##  Returns a complemented copy of the interval. To complement an interval
     # you invert its span and quality. To invert the span, subtract it from
     # the maximum span index (the octave index). To invert the  quality subtract
-    # it from the maximum quality index (quintuply augmented).
+    # it from the maximum quality index (quintuply augmented). In steps and
+    # semitones this subtracts the simple part of the interval from an octave.
     def complemented(self):
-        return Interval([7 - self.span, 12 - self.qual, self.xoct, self.sign])
+        if self.span == 7 and self.xoct == 0:
+            # the complement is a unison, whose direction its steps and
+            # semitones cannot carry
+            return Interval([0, 12 - self.qual, 0, self.sign])
+        steps = 7 - self.span + self.xoct * 7
+        semitones = 12 - abs(self._semitones) + self.xoct * 24
+        return Interval.from_steps(steps * self.sign, semitones * self.sign)
 
     ## Returns the number of semitones in the interval. It is possible
     # to determine the number of semitones by looking at the span and
@@ -623,81 +698,168 @@ class Interval:
     #
     # This value will be negative for descending intervals otherwise positive.
     def semitones(self):
-        return (Interval.span_to_keynum[self.span] + self._to_iq() + self.xoct * 12) * self.sign
+        return self._semitones
+
+    ## Returns the number of diatonic steps (lines and spaces) the interval
+    # moves, including its extra octaves, e.g. a M10 moves 9 steps.
+    #
+    # This value will be negative for descending intervals otherwise positive.
+    def steps(self):
+        return self._steps
+
+    ## Returns the interval's classification flags as an integer bitmask,
+    # e.g. Interval('-P12').mask() has the FIFTH, PERFECT, PERFECT_TYPE,
+    # CONSONANT, COMPOUND and DESCENDING flags set. Testing a mask with
+    # the & operator answers the is_fifth() family of predicates, and
+    # several flags can be tested at once, e.g.
+    # interval.mask() & (Interval.FIFTH | Interval.OCTAVE).
+    def mask(self):
+        return self._mask
+
+    ## Returns the shared Interval that moves a signed number of diatonic
+    # steps and semitones, e.g. Interval.from_steps(-2, -4) returns the
+    # descending major third. See: steps() and semitones().
+    # @param steps  The number of diatonic steps.
+    # @param semitones  The number of semitones.
+    #
+    # A TypeError should be raised if steps or semitones is not an int and a
+    # ValueError if they do not form a legal interval.
+    @classmethod
+    def from_steps(cls, steps, semitones):
+        if not isinstance(steps, int) or not isinstance(semitones, int):
+            raise TypeError("Expected steps and semitones to be ints")
+        interval = Interval._intervals.get((steps, semitones))
+        if interval is None:
+            interval = Interval(Interval._steps_to_list(steps, semitones))
+        return interval
 
     ## Adds a specified interval to this interval.
     #  @return  a new interval expressing the total span of both intervals.
     #  @param other the interval to add to this one.
     #
-    # A TypeError should be raised if other is not an interval. A
-    # NotImplementedError if either intervals are descending.
+    # Descending intervals add as negative distances, e.g. M3 plus -P5 is
+    # -m3. A TypeError should be raised if other is not an interval and a
+    # ValueError if the sum is not a legal interval.
     def add(self, other):
-        # Do NOT implement this method yet.
         if not isinstance(other, Interval):
             raise TypeError("Other is not an instance of Interval")
-        elif self.is_descending() or other.is_descending():
-            raise NotImplementedError("Either intervals are descending")
-        new_self = Interval([self.span, self.qual, self.xoct, self.sign])
-
-        new_self.span += other.span
-        if new_self.span > 7:
-            new_self.span -= 7
-            new_self.xoct += 1
-
-        new_self.xoct += other.xoct
+        return Interval.from_steps(self._steps + other._steps, self._semitones + other._semitones)
 
-        new_self.sign = 1
-
-        new_self.qual = 0
-        new_self.qual = self.semitones() + other.semitones() - new_self.xoct * 12 - Interval.span_to_keynum[new_self.span]
-
-        if new_self.span in Interval.perfect_spans:
-            new_self.qual = Interval.qualities.index(Interval.perfect_qualities[new_self.qual + Interval.perfect_index])
-        else:
-            new_self.qual = Interval.qualities.index(Interval.imperfect_qualities[new_self.qual + Interval.imperfect_index])
-
-        return new_self
+    ## Subtracts a specified interval from this interval.
+    #  @return  a new interval expressing the distance left, e.g. P5
+    #  minus M3 is m3 and M3 minus P5 is -m3.
+    #  @param other the interval to subtract from this one.
+    #
+    # A TypeError should be raised if other is not an interval and a
+    # ValueError if the difference is not a legal interval.
+    def subtract(self, other):
+        if not isinstance(other, Interval):
+            raise TypeError("Other is not an instance of Interval")
+        return Interval.from_steps(self._steps - other._steps, self._semitones - other._semitones)
 
     # Transposes a Pitch or Pnum by the interval. Pnum transposition
     #  has no direction so if the interval is negative its complement
     #  should be used.
     #  @param pref  The Pitch or Pnum to transpose.
     #  @return The transposed Pitch or Pnum.
+    #
+    # A ValueError is raised if the result would need more than two
+    # accidentals or lies outside the pitch range.
     def transpose(self, pref):
-        # Do NOT implement this method yet.
         if isinstance(pref, Pitch):
-            new_pitch = pref
-            value = pref.pos()
-            accidental = value - (value >> 4 << 4)
-            value = value >> 4
-            letter = value - (value >> 4 << 4)
-            value = value >> 4
-            octave = value
-
-            letter += self.span * self.sign
-            if letter >= 7 or letter < 0:
-                letter = (letter + 7) % 7
-                octave += self.sign
-
-            octave += self.xoct * self.sign
-
-            accidental += pref.keynum() + self.semitones() - Pitch([letter, accidental, octave]).keynum()
-
-            return Pitch([letter, accidental, octave])
+            pos = pref.pos()
+            octave, letter = divmod((pos >> 8) * 7 + ((pos >> 4) & 15) + self._steps, 7)
+            keynum = pref.keynum() + self._semitones
+            return Pitch([letter, keynum - octave * 12 - _letter_pcs[letter] + 2, octave])
         elif isinstance(pref, Pitch.pnums):
-            if self.is_descending():
-                self = self.complemented()
-            value = pref.value
-            accidental = value - (value >> 4 << 4)
-            value = value >> 4
-            letter = value
-
-            new_letter = letter + self.span
-            if new_letter >= 7:
-                new_letter = letter % 7
-
-            accidental += Pitch([letter, accidental, 0]).keynum() + self.semitones() - Pitch([new_letter, accidental, 0]).keynum()
-
-            return Pitch.pnums((new_letter << 4) + accidental)
+            letter = pref.value >> 4
+            new_letter = (letter + self._steps) % 7
+            # the alteration of the new letter, folded into -6 to 5 semitones
+            alteration = (_letter_pcs[letter] + (pref.value & 15) + self._semitones - _letter_pcs[new_letter] + 4) % 12 - 6
+            if alteration < -2 or alteration > 2:
+                raise ValueError("Transposed pnum needs more than two accidentals")
+            return Pitch.pnums((new_letter << 4) + alteration + 2)
         else:
             raise TypeError("Pref is not an instance of Pitch or Pnum")
+
+    ## Transposes a sequence of Pitches by the interval, e.g. all the
+    #  notes of a voice. Each distinct pitch is transposed once. Empty
+    #  pitches and None values (rests) are kept as they are. Pitches are
+    #  not hashable, so they are remembered by their pos().
+    #  @param prefs  An iterable of Pitches, Pnums or None.
+    #  @return A list of the transposed values. See: transpose().
+    def transpose_many(self, prefs):
+        pitches, pnums = {}, {}
+        result = []
+        for pref in prefs:
+            if pref is None or (type(pref) is Pitch and pref.is_empty()):
+                result.append(pref)
+                continue
+            if isinstance(pref, Pitch):
+                transposed, key = pitches, pref.pos()
+            else:
+                transposed, key = pnums, pref
+            value = transposed.get(key)
+            if value is None:
+                value = transposed[key] = self.transpose(pref)
+            result.append(value)
+        return result
+
+    ## Private class method that fills in the _masks and _qual_indexes
+    #  tables, the _intervals table with every interval that two legal
+    #  pitches can form, and the _lists and _names tables with every legal
+    #  interval.
+    @classmethod
+    def _build_tables(cls):
+        cls._qual_indexes.update({symbol: i for i, symbol in enumerate(cls.qualities)})
+        cls._qual_indexes.update({letter: cls.qualities.index(symbol)
+                                  for letter, symbol in cls.quality_letter_to_symbol.items()})
+        span_flags = [cls.UNISON, cls.SECOND, cls.THIRD, cls.FOURTH, cls.FIFTH, cls.SIXTH, cls.SEVENTH, cls.OCTAVE]
+        quality_flags = [cls.DIMINISHED] * 5 + [cls.MINOR, cls.PERFECT, cls.MAJOR] + [cls.AUGMENTED] * 5
+        for span in range(8):
+            masks = []
+            for qual in range(13):
+                mask = span_flags[span] | quality_flags[qual]
+                if span in cls.perfect_spans:
+                    mask |= cls.PERFECT_TYPE
+                    consonant = quality_flags[qual] == cls.PERFECT
+                else:
+                    mask |= cls.IMPERFECT_TYPE
+                    consonant = span in (2, 5) and quality_flags[qual] in (cls.MINOR, cls.MAJOR)
+                masks.append(mask | (cls.CONSONANT if consonant else cls.DISSONANT))
+            cls._masks.append(masks)
+
+        for steps in range(-76, 77):
+            octaves, span = divmod(abs(steps), 7)
+            semitones = octaves * 12 + cls.span_to_keynum[span]
+            for offset in range(-6, 7):
+                distance = offset if steps == 0 else (semitones + offset) * (1 if steps > 0 else -1)
+                try:
+                    interval = cls(cls._steps_to_list(steps, distance))
+                except ValueError:
+                    continue
+                cls._intervals[(steps, distance)] = interval
+
+        # every legal list of indexes, sharing the instances above except for
+        # the descending unison, whose steps and semitones are those of P1
+        spellings = {symbol: [symbol] for symbol in cls.qualities}
+        for letters, symbol in cls.quality_letter_to_symbol.items():
+            spellings[symbol].append(letters)
+        for span in range(8):
+            for qual in range(13):
+                for xoct in range(11):
+                    for sign in (1, -1):
+                        try:
+                            interval = cls([span, qual, xoct, sign])
+                        except ValueError:
+                            continue
+                        shared = cls._intervals.get((interval._steps, interval._semitones))
+                        if shared is not None and shared.sign == interval.sign:
+                            interval = shared
+                        cls._lists[(span, qual, xoct, sign)] = interval
+                        for quality in spellings[cls.qualities[qual]]:
+                            name = f'{"-" if sign == -1 else ""}{quality}{span + xoct * 7 + 1}'
+                            cls._names.setdefault(name, interval)
+
+
+Interval._build_tables()
@@ -0,0 +1,182 @@
+##############################################################################
+## @file
+#  A columnar collection of intervals.
+#  An IntervalArray stores the span, qual, xoct and sign of the intervals
+#  between two aligned pitch sequences (see Interval(pitch1, pitch2)) in
+#  signed byte columns (see Python's array module), together with their
+#  semitones and classification masks (see Interval.mask()), and answers
+#  predicates such as is_fifth() or is_consonant() for the whole collection
+#  at once with one bit test per interval. The harmonic intervals of two voices,
+#  or the melodic intervals of one voice, are computed once for a whole
+#  piece. Where either pitch is missing (e.g. a rest) the interval is empty
+#  and stored as -1 in the span, qual and xoct columns and 0 in the sign,
+#  semitones and masks columns.
+
+from array import array
+
+from .interval import Interval
+from .pitch import Pitch
+
+
+## A class that implements an array of intervals.
+#
+# An IntervalArray holds six attributes of equal length:
+# * spans  An array of span indexes 0-7, or -1 for an empty interval.
+# * quals  An array of quality indexes 0-12, or -1.
+# * xocts  An array of extra octaves 0-10, or -1.
+# * signs  An array of signs 1 or -1, or 0.
+# * semitones  An array of signed semitones, or 0.
+# * masks  An array of classification masks, or 0.
+#
+# The Intervals themselves are kept as well, so indexing and iteration
+# return them (or None) without constructing new ones.
+class IntervalArray:
+
+    ## Creates an IntervalArray from two aligned sequences of pitches. The
+    # interval at index i goes from lower[i] to upper[i].
+    # @param lower  An iterable of Pitches, empty Pitches or None values.
+    # @param upper  An iterable of the same length as lower.
+    #
+    # The constructor should raise a ValueError if the sequences have
+    # different lengths and a TypeError if a value is not a Pitch or None.
+    def __init__(self, lower=(), upper=()):
+        lower, upper = list(lower), list(upper)
+        if len(lower) != len(upper):
+            raise ValueError("Pitch sequences have different lengths")
+        self.spans = array('b')
+        self.quals = array('b')
+        self.xocts = array('b')
+        self.signs = array('b')
+        self.semitones = array('b')
+        self.masks = array('l')
+        self._intervals = []
+        for pitch1, pitch2 in zip(lower, upper):
+            for pitch in (pitch1, pitch2):
+                if pitch is not None and not isinstance(pitch, Pitch):
+                    raise TypeError(f"Invalid pitch: {pitch}.")
+            if pitch1 is None or pitch2 is None or pitch1.is_empty() or pitch2.is_empty():
+                self._append(None)
+            else:
+                self._append(Interval(pitch1, pitch2))
+
+    ## Creates an IntervalArray of the melodic intervals of a voice, the
+    # interval at index i going from voice[i] to voice[i + distance].
+    # @param voice  A sequence of Pitches, empty Pitches or None values.
+    # @param distance  The number of notes between the two pitches of each
+    # interval. Defaults to 1, the intervals between adjacent notes.
+    @classmethod
+    def melodic(cls, voice, distance=1):
+        voice = list(voice)
+        return cls(voice[:-distance], voice[distance:])
+
+    ## Private method that appends an Interval, or None for an empty
+    # interval, to the array.
+    def _append(self, interval):
+        self._intervals.append(interval)
+        if interval is None:
+            self.spans.append(-1)
+            self.quals.append(-1)
+            self.xocts.append(-1)
+            self.signs.append(0)
+            self.semitones.append(0)
+            self.masks.append(0)
+        else:
+            self.spans.append(interval.span)
+            self.quals.append(interval.qual)
+            self.xocts.append(interval.xoct)
+            self.signs.append(interval.sign)
+            self.semitones.append(interval.semitones())
+            self.masks.append(interval.mask())
+
+    ## Returns a string showing the interval names and the hex id of the array.
+    # Example: '<IntervalArray: [M3, empty, -P5] 0x109877c50>'
+    def __str__(self):
+        names = ', '.join('empty' if i is None else i.string() for i in self)
+        return f'<IntervalArray: [{names}] {hex(id(self))}>'
+
+    ## Returns the number of intervals in the array.
+    def __len__(self):
+        return len(self.spans)
+
+    ## Implements IntervalArray iteration by returning an iterator of
+    # Intervals, with None for empty intervals.
+    def __iter__(self):
+        return iter(self._intervals)
+
+    ## Returns the Interval (or None) at an integer index, or a new
+    # IntervalArray for a slice.
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            intervals = IntervalArray()
+            for interval in self._intervals[index]:
+                intervals._append(interval)
+            return intervals
+        return self._intervals[index]
+
+    ## Returns a list of the array's intervals, with None for empty intervals.
+    def to_intervals(self):
+        return list(self._intervals)
+
+    ## Returns an array of 0/1 flags, 1 where an interval is empty.
+    def is_empty(self):
+        return array('b', [s < 0 for s in self.spans])
+
+    ## Returns an array of 0/1 flags, 1 where the mask of an interval has
+    # every flag in flags, e.g. has_flags(Interval.FIFTH | Interval.PERFECT)
+    # finds the perfect fifths. Empty intervals are 0.
+    # @param flags  An integer of Interval flags, see Interval.mask().
+    # @param every  If False, 1 where the mask has any flag in flags.
+    # Defaults to True.
+    def has_flags(self, flags, every=True):
+        if every:
+            return array('b', [m & flags == flags for m in self.masks])
+        return array('b', [m & flags != 0 for m in self.masks])
+
+    ## Returns an array of 0/1 flags, 1 where an interval is a unison.
+    def is_unison(self):
+        return self.has_flags(Interval.UNISON)
+
+    ## Returns an array of 0/1 flags, 1 where an interval is a second.
+    def is_second(self):
+        return self.has_flags(Interval.SECOND)
+
+    ## Returns an array of 0/1 flags, 1 where an interval is a third.
+    def is_third(self):
+        return self.has_flags(Interval.THIRD)
+
+    ## Returns an array of 0/1 flags, 1 where an interval is a fourth.
+    def is_fourth(self):
+        return self.has_flags(Interval.FOURTH)
+
+    ## Returns an array of 0/1 flags, 1 where an interval is a fifth.
+    def is_fifth(self):
+        return self.has_flags(Interval.FIFTH)
+
+    ## Returns an array of 0/1 flags, 1 where an interval is a sixth.
+    def is_sixth(self):
+        return self.has_flags(Interval.SIXTH)
+
+    ## Returns an array of 0/1 flags, 1 where an interval is a seventh.
+    def is_seventh(self):
+        return self.has_flags(Interval.SEVENTH)
+
+    ## Returns an array of 0/1 flags, 1 where an interval is an octave.
+    def is_octave(self):
+        return self.has_flags(Interval.OCTAVE)
+
+    ## Returns an array of 0/1 flags, 1 where an interval is consonant,
+    # see Interval.is_consonant(). Empty intervals are 0.
+    def is_consonant(self):
+        return self.has_flags(Interval.CONSONANT)
+
+    ## Returns an array of 0/1 flags, 1 where an interval is compound.
+    def is_compound(self):
+        return self.has_flags(Interval.COMPOUND)
+
+    ## Returns an array of 0/1 flags, 1 where an interval is ascending.
+    def is_ascending(self):
+        return self.has_flags(Interval.ASCENDING)
+
+    ## Returns an array of 0/1 flags, 1 where an interval is descending.
+    def is_descending(self):
+        return self.has_flags(Interval.DESCENDING)
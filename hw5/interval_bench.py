@@ -0,0 +1,161 @@
+##############################################################################
+## @file
+#  Benchmarks for the shared Interval tables.
+#
+#  LegacyInterval below rebuilds the way Interval used to be created from
+#  two Pitches: slicing both positions into octave, letter and accidental
+#  fields, looking the quality up in the quality lists and validating the
+#  result again through __init__(). The workload mimics the final project's
+#  species analysis: the vertical interval of every timepoint is built once
+#  and the melodic intervals of both voices are rebuilt by each rule. The
+#  legacy transpose() built up to three Pitches per note where the current
+#  one adds the interval's diatonic steps and semitones to the pitch; both
+#  transpose every note one at a time. The 'transpose_many' row measures
+#  transpose_many() instead, which also transposes each distinct pitch of
+#  the sequence only once, against the same legacy per-note loop.
+#
+#  Run the benchmarks from the repository root with:
+#  @code
+#  $ python3 -m hw5.interval_bench
+#  @endcode
+
+import random
+import timeit
+
+from .interval import Interval
+from .pitch import Pitch
+
+
+## A copy of the original Interval(pitch1, pitch2) construction, Pitch
+#  transposition and string() code. Being a subclass, LegacyInterval also
+#  skips the shared instance tables and parses every name it is given.
+class LegacyInterval(Interval):
+    def _init_from_pitches(self, pitch1, pitch2):
+        if pitch1 > pitch2:
+            if pitch1.keynum() < pitch2.keynum():
+                raise ValueError("High note has lower pitch")
+            value2, value1 = pitch1.pos(), pitch2.pos()
+            sign = -1
+        else:
+            if pitch1.keynum() > pitch2.keynum():
+                raise ValueError("High note has lower pitch")
+            value1, value2 = pitch1.pos(), pitch2.pos()
+            sign = 1
+        accidental1, accidental2 = value1 - (value1 >> 4 << 4), value2 - (value2 >> 4 << 4)
+        value1, value2 = value1 >> 4, value2 >> 4
+        letter1, letter2 = value1 - (value1 >> 4 << 4), value2 - (value2 >> 4 << 4)
+        octave1, octave2 = value1 >> 4, value2 >> 4
+
+        span = (octave2 - octave1) * 7 + (letter2 - letter1)
+        if span % 7 == 0:
+            if span <= 7:
+                new_span, xoct = span, 0
+            else:
+                new_span, xoct = 7, span // 7 - 1
+        else:
+            new_span, xoct = span % 7, span // 7
+
+        perfect = span % 7 in Interval.perfect_spans
+        index = Interval.perfect_index if perfect else Interval.imperfect_index
+        qual = abs(pitch2.keynum() - pitch1.keynum()) - Interval.span_to_keynum[new_span] - xoct * 12 + index
+        if perfect:
+            qual = Interval.qualities.index(Interval.perfect_qualities[qual])
+        else:
+            qual = Interval.qualities.index(Interval.imperfect_qualities[qual])
+
+        self.__init__([new_span, qual, xoct, sign])
+
+    def transpose(self, pref):
+        value = pref.pos()
+        accidental = value - (value >> 4 << 4)
+        value = value >> 4
+        letter = value - (value >> 4 << 4)
+        octave = value >> 4
+
+        letter += self.span * self.sign
+        if letter >= 7 or letter < 0:
+            letter = (letter + 7) % 7
+            octave += self.sign
+        octave += self.xoct * self.sign
+        accidental += pref.keynum() + self.semitones() - Pitch([letter, accidental, octave]).keynum()
+        return Pitch([letter, accidental, octave])
+
+    def string(self):
+        if self.sign == -1:
+            string = '-'
+        else:
+            string = ''
+        string += f'{Interval.qualities[self.qual]}{self.span + self.xoct * 7 + 1}'
+        return string
+
+
+## Returns count random two-voice exercises, each a (cantus firmus,
+#  counterpoint) pair of length Pitch lists moving mostly by step in C major
+#  with the counterpoint a third to a tenth above.
+def sample_exercises(count, length=11, seed=105):
+    rng = random.Random(seed)
+    scale = [Pitch([letter, 2, octave]) for octave in range(3, 7) for letter in range(7)]
+    exercises = []
+    for _ in range(count):
+        cf, cp = [7], [rng.randint(9, 16)]
+        for _ in range(length - 1):
+            cf.append(min(max(cf[-1] + rng.choice([-2, -1, -1, 1, 1, 2]), 3), 13))
+            cp.append(min(max(cp[-1] + rng.choice([-3, -1, -1, 1, 1, 3]), cf[-1] + 2), cf[-1] + 9))
+        exercises.append(([scale[i] for i in cf], [scale[i] for i in cp]))
+    return exercises
+
+
+## Runs the species workload with an interval class: one vertical interval
+#  per timepoint and, for each of rules rules, the melodic intervals of both
+#  voices. Returns the number of intervals built.
+def species_workload(cls, exercises, rules=15):
+    count = 0
+    for cf, cp in exercises:
+        verticals = [cls(lower, upper) for lower, upper in zip(cf, cp)]
+        count += len(verticals)
+        for _ in range(rules):
+            for voice in (cf, cp):
+                melodic = [cls(voice[i], voice[i + 1]) for i in range(len(voice) - 1)]
+                count += len(melodic)
+    return count
+
+
+## Returns the best time in seconds of running function() number times.
+def best_time(function, number, repeat=3):
+    return min(timeit.repeat(function, number=number, repeat=repeat))
+
+
+## Runs every benchmark and returns a list of (name, legacy, current) results.
+def run(count=2000, number=1):
+    exercises = sample_exercises(count)
+    pitches = [pitch for cf, cp in exercises for pitch in cf + cp]
+    pairs = list(zip(pitches, pitches[1:]))
+    legacy, current = LegacyInterval('M2'), Interval('M2')
+    names = [Interval(a, b).string() for a, b in pairs]
+    legacy_intervals = [LegacyInterval(name) for name in names]
+    current_intervals = [Interval(name) for name in names]
+    return [
+        ('pairs (s)', best_time(lambda: [LegacyInterval(a, b) for a, b in pairs], number),
+         best_time(lambda: [Interval(a, b) for a, b in pairs], number)),
+        ('species (s)', best_time(lambda: species_workload(LegacyInterval, exercises), number),
+         best_time(lambda: species_workload(Interval, exercises), number)),
+        ('transpose (s)', best_time(lambda: [legacy.transpose(p) for p in pitches], number),
+         best_time(lambda: [current.transpose(p) for p in pitches], number)),
+        ('transpose_many (s)', best_time(lambda: [legacy.transpose(p) for p in pitches], number),
+         best_time(lambda: current.transpose_many(pitches), number)),
+        ('parse (s)', best_time(lambda: [LegacyInterval(name) for name in names], number),
+         best_time(lambda: [Interval(name) for name in names], number)),
+        ('string (s)', best_time(lambda: [i.string() for i in legacy_intervals], number),
+         best_time(lambda: [i.string() for i in current_intervals], number)),
+    ]
+
+
+## Prints a table of the benchmark results.
+def main():
+    print(f'{"benchmark":<20}{"legacy":>12}{"current":>12}{"ratio":>9}')
+    for name, legacy, current in run():
+        print(f'{name:<20}{legacy:>12.4f}{current:>12.4f}{legacy / current:>8.1f}x')
+
+
+if __name__ == '__main__':
+    main()
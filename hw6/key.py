@@ -12,6 +12,14 @@ from .interval import Interval
 # representing their tonic note and diatonic scale degrees.
 # See: https://en.wikipedia.org/wiki/Key_(music)
 class Key:
+
+    ## The shared Key for every (signum, Mode) pair. Filled in by
+    #  _build_tables().
+    _keys = {}
+
+    ## The pitch class of each letter C-B.
+    _letter_pcs = (0, 2, 4, 5, 7, 9, 11)
+
     ## Creates a Key from an integer key signature identifier and mode.
     #  @param signum  A value -7 to 7 representing the number of flats
     #  (negative) or sharps (positive).
@@ -20,24 +28,71 @@ class Key:
     #  The constructor should raise a TypeError if signum is not an integer
     #  or if mode is not a Mode or string. The constructor should raise a
     #  ValueError if the signum integer or the mode string is invalid.
+    #
+    #  Keys are immutable, so every legal key exists only once: the
+    #  constructor returns the shared instance from the _keys table (see
+    #  _build_tables()) and only runs the checks below for input missing from
+    #  the table, which is always invalid and raises the appropriate error.
+    def __new__(cls, signum, mode):
+        if cls is Key and type(signum) is int:
+            if isinstance(mode, str):
+                mode = Mode.__members__.get(mode.upper())
+            key = Key._keys.get((signum, mode)) if isinstance(mode, Mode) else None
+            if key is not None:
+                return key
+        return super().__new__(cls)
+
     def __init__(self, signum, mode):
+        # shared instances are already initialized
+        if hasattr(self, '_scale'):
+            return
+
         if not isinstance(signum, int):
             raise TypeError("signum is not an integer")
         elif abs(signum) > 7:
             raise ValueError("signum integer is invalid")
-        else:
-            self.signum = signum
 
         if isinstance(mode, Mode):
-            self.mode = mode
+            pass
         elif isinstance(mode, str):
             try:
-                self.mode = Mode[mode.upper()]
+                mode = Mode[mode.upper()]
             except:
                 raise ValueError("mode string is invalid")
         else:
             raise TypeError("mode is not a Mode or string")
 
+        object.__setattr__(self, 'signum', signum)
+        object.__setattr__(self, 'mode', mode)
+        scale = tuple(self._build_scale())
+        object.__setattr__(self, '_scale', scale)
+        object.__setattr__(self, '_degrees', {pnum: degree for degree, pnum in enumerate(scale)})
+        mask = 0
+        for pnum in scale:
+            mask |= 1 << (Key._letter_pcs[pnum.value >> 4] + (pnum.value & 15) - 2) % 12
+        object.__setattr__(self, '_mask', mask)
+        object.__setattr__(self, '_string', f'{scale[0].name}-{mode.name.capitalize()}')
+
+    ## Keys are immutable, since Key(signum, mode) shares one instance
+    #  between all its callers.
+    #
+    #  The method always raises an AttributeError.
+    def __setattr__(self, name, value):
+        raise AttributeError("Key is immutable")
+
+    ## Pickles a Key as its signum and mode so that unpickling returns the
+    #  shared instance.
+    def __reduce__(self):
+        return (Key, (self.signum, self.mode))
+
+    ## Returns the key itself, since keys are immutable.
+    def __copy__(self):
+        return self
+
+    ## Returns the key itself, since keys are immutable.
+    def __deepcopy__(self, memo):
+        return self
+
     ## Returns the print representation of the key. The string should
     # include the class name, tonic, mode, number of sharps or flats,
     # and the instance id.
@@ -81,7 +136,7 @@ class Key:
     #
     # Examples: Fs-Dorian, Bf-Phrygian, B-Major
     def string(self):
-        return f'{self.tonic()}-{self.mode.name.capitalize()}'
+        return self._string
 
     ## Returns a Pnum representing the key's tonic. The tonic can
     # be calculated by transposing the Major tonic (Pnum) by the
@@ -95,11 +150,49 @@ class Key:
     # Key(2, "dorian").tonic() is Pnum E.
     # Key(-6, "phrygian").tonic() is Pnum Bf.
     def tonic(self):
-        return self.scale()[0]
+        return self._scale[0]
 
     ## Returns a list of Pnums representing the unique pitches of the key's
     # diatonic scale. The octave completion should NOT be included in the list.
+    # The list is a copy of the key's precomputed scale.
     def scale(self):
+        return list(self._scale)
+
+    ## Returns a 12-bit integer with bit pc set for every pitch class 0-11
+    # in the key's diatonic scale, e.g. 0b101010110101 for C major.
+    def pc_mask(self):
+        return self._mask
+
+    ## Returns True if a pitch belongs to the key's diatonic scale. Pitches
+    # and Pnums must be spelled as in the scale (F# is diatonic in G major,
+    # Gb is not), integer pitch classes are tested against pc_mask().
+    # @param pref  A Pitch, Pnum or integer pitch class 0-11.
+    #
+    # The method should raise a TypeError if pref is none of these and a
+    # ValueError if pref is an empty Pitch.
+    def is_diatonic(self, pref):
+        if isinstance(pref, int) and not isinstance(pref, Pitch.pnums):
+            return self._mask >> (pref % 12) & 1 == 1
+        return self.degree_of(pref) is not None
+
+    ## Returns the scale degree index 0-6 of a pitch in the key's diatonic
+    # scale, 0 being the tonic, or None if the pitch is not diatonic.
+    # @param pref  A Pitch or Pnum.
+    #
+    # The method should raise a TypeError if pref is not a Pitch or Pnum
+    # and a ValueError if pref is an empty Pitch.
+    def degree_of(self, pref):
+        if isinstance(pref, Pitch):
+            if pref.is_empty():
+                raise ValueError("Pitch cannot be empty")
+            pref = pref.pnum()
+        elif not isinstance(pref, Pitch.pnums):
+            raise TypeError("Pref is not an instance of Pitch or Pnum")
+        return self._degrees.get(pref)
+
+    ## Private method that builds the list of Pnums of the key's diatonic
+    # scale, starting on its tonic.
+    def _build_scale(self):
         pnum_names = ['C', 'D', 'E', 'F', 'G', 'A', 'B']
 
         for i in range(0, self.signum):
@@ -115,4 +208,15 @@ class Key:
         if rotate == 0:
             return scale
         else:
-            return scale[rotate:] + scale[:rotate]
\ No newline at end of file
+            return scale[rotate:] + scale[:rotate]
+
+    ## A private @classmethod that creates every legal key once and fills
+    #  in the _keys table. It is called once when this module is imported.
+    @classmethod
+    def _build_tables(cls):
+        for signum in range(-7, 8):
+            for mode in Mode:
+                cls._keys[(signum, mode)] = cls(signum, mode)
+
+
+Key._build_tables()
@@ -0,0 +1,170 @@
+###############################################################################
+
+import operator
+from array import array
+from functools import reduce
+
+from .ratio import Ratio
+from .meter import Meter
+
+
+## A class that precomputes the metric grid of a meter: the exact position
+# and metric level of every beat and beat subdivision in a measure. The
+# grid divides the measure into ticks, eight per beat of a simple meter and
+# twelve per beat of a compound meter, and holds the level of each tick in a
+# table, so that classifying an onset costs a few integer operations.
+#
+# Metric levels, strongest first:
+# * DOWNBEAT  The first beat of the measure.
+# * STRONG_BEAT  The middle beat of a quadruple meter, e.g. beat 3 of 4/4.
+# * WEAK_BEAT  Any other beat.
+# * DIVISION  The first division of a beat, halves in simple meters and
+#   thirds in compound ones. DIVISION + 1 and DIVISION + 2 are the next two
+#   subdivisions, each halving the one before.
+# * OFF_GRID  An onset between the ticks of the grid, e.g. a triplet.
+#
+# Grids are immutable and shared: MetricGrid(meter, pickup) returns the
+# same instance for every meter with the same num and den and the same
+# pickup. A MetricGrid holds the following attributes:
+# * num, den  The meter's numerator and denominator.
+# * pickup  The Ratio duration of the pickup measure, 0/1 if there is none.
+# * beats  A list of the Ratio beat onsets in a measure.
+# * positions  A list of the Ratio onsets of every tick in a measure.
+# * levels  An array with the metric level of every tick in a measure.
+class MetricGrid:
+
+    DOWNBEAT, STRONG_BEAT, WEAK_BEAT, DIVISION = range(4)
+    OFF_GRID = DIVISION + 3
+
+    ## The shared MetricGrid for every (num, den, pickup num, pickup den).
+    _grids = {}
+
+    ## Returns the shared MetricGrid of a meter and pickup if it has been
+    # built before, see __init__().
+    def __new__(cls, meter, pickup=0):
+        if cls is MetricGrid and isinstance(meter, Meter) and isinstance(pickup, (Ratio, int)):
+            grid = MetricGrid._grids.get((meter.num, meter.den) + MetricGrid._pair(pickup))
+            if grid is not None:
+                return grid
+        return super().__new__(cls)
+
+    ## Initializes a MetricGrid and adds it to the shared grids.
+    # @param meter  A simple or compound Meter, see Meter.beat().
+    # @param pickup  A Ratio or int duration of the pickup (partial first)
+    # measure. Defaults to 0, no pickup.
+    #
+    # The constructor should raise a TypeError if meter is not a Meter or
+    # pickup is not a Ratio or int, a ValueError if pickup is negative or
+    # not shorter than a measure, and a NotImplementedError if the meter is
+    # not simple or compound.
+    def __init__(self, meter, pickup=0):
+        # shared grids are already initialized
+        if hasattr(self, 'levels'):
+            return
+        if not isinstance(meter, Meter):
+            raise TypeError("meter is not a Meter")
+        num, den = MetricGrid._pair(pickup)
+        beat = meter.beat()
+        if meter.is_compound():
+            divisions = [3, 2, 2]
+        else:
+            divisions = [2, 2, 2]
+        per_beat = reduce(operator.mul, divisions)
+        self.num, self.den = meter.num, meter.den
+        # ticks per whole note and per measure
+        self._whole = per_beat * beat.den // beat.num
+        self._measure = per_beat * (meter.num * beat.den) // (meter.den * beat.num)
+        if num < 0 or num * self._whole >= self._measure * den:
+            raise ValueError("pickup is negative or not shorter than a measure")
+        self.pickup = Ratio(num, den)
+        self._pickup = (num, den)
+
+        beats = self._measure // per_beat
+        levels = array('b', [MetricGrid.OFF_GRID] * self._measure)
+        step = per_beat
+        for i, division in enumerate(divisions):
+            step //= division
+            for tick in range(0, self._measure, step):
+                if levels[tick] == MetricGrid.OFF_GRID:
+                    levels[tick] = MetricGrid.DIVISION + i
+        for b in range(beats):
+            levels[b * per_beat] = MetricGrid.WEAK_BEAT
+        if beats == 4:
+            levels[2 * per_beat] = MetricGrid.STRONG_BEAT
+        levels[0] = MetricGrid.DOWNBEAT
+        self.levels = levels
+        self._per_beat = per_beat
+        self.beats = [Ratio(b * per_beat, self._whole) for b in range(beats)]
+        self.positions = [Ratio(tick, self._whole) for tick in range(self._measure)]
+        MetricGrid._grids[(meter.num, meter.den, num, den)] = self
+
+    ## Private method that returns the (num, den) pair of a Ratio or int.
+    @staticmethod
+    def _pair(value):
+        if isinstance(value, Ratio):
+            return value.num, value.den
+        if isinstance(value, int):
+            return value, 1
+        raise TypeError(f"Invalid duration: {value}.")
+
+    ## Returns a string showing the meter, the pickup and the hex id of the grid.
+    # Example: '<MetricGrid: 3/4 pickup 1/4 0x109877c50>'
+    def __str__(self):
+        return f'<MetricGrid: {self.num}/{self.den} pickup {self.pickup.string()} {hex(id(self))}>'
+
+    ## Pickles a MetricGrid as its meter and pickup so that unpickling
+    # returns the shared grid.
+    def __reduce__(self):
+        return (MetricGrid, (Meter(self.num, self.den), self.pickup))
+
+    ## Returns the grid itself, since grids are immutable.
+    def __copy__(self):
+        return self
+
+    ## Returns the grid itself, since grids are immutable.
+    def __deepcopy__(self, memo):
+        return self
+
+    ## Returns the (bar, beat, level) of an onset. Onsets are measured from
+    # the start of the music, so with a pickup bar 0 is the pickup measure
+    # and bar 1 starts at the pickup's duration. beat is the index of the
+    # beat sounding at the onset within its measure.
+    # @param onset  A Ratio or int onset.
+    def classify_one(self, onset):
+        bars, beats, levels = self.classify([onset])
+        return bars[0], beats[0], levels[0]
+
+    ## Classifies a whole sequence of onsets in one call.
+    # @param onsets  An iterable of Ratio or int onsets, or an Onsets (any
+    # object with integer ticks over a common den), whose ticks are used
+    # directly without building a Ratio per onset.
+    # @returns A (bars, beats, levels) tuple of arrays, one entry per onset.
+    #
+    # The method should raise a TypeError if an onset is not a Ratio or int.
+    def classify(self, onsets):
+        if hasattr(onsets, 'ticks') and hasattr(onsets, 'den'):
+            pairs = [(tick, onsets.den) for tick in onsets.ticks[:-1]]
+        else:
+            pairs = [MetricGrid._pair(onset) for onset in onsets]
+        whole, measure, levels, per_beat = self._whole, self._measure, self.levels, self._per_beat
+        pnum, pden = self._pickup
+        shift = (measure * pden - pnum * whole) if pnum else 0
+        bars, beats, classes = array('l'), array('l'), array('b')
+        for num, den in pairs:
+            # ticks from the start of bar 0, times pden to stay exact
+            scaled = num * whole * pden + shift * den
+            tick, rest = divmod(scaled, den * pden)
+            bar, position = divmod(tick, measure)
+            bars.append(bar)
+            beats.append(position // per_beat)
+            classes.append(levels[position] if rest == 0 else MetricGrid.OFF_GRID)
+        return bars, beats, classes
+
+    ## Returns an array of 0/1 flags, 1 where an onset falls on a metric
+    # level at least as strong as level, e.g. is_strong(onsets) finds the
+    # onsets on a downbeat or a strong beat.
+    # @param onsets  See classify().
+    # @param level  The weakest level that counts as strong. Defaults to
+    # STRONG_BEAT.
+    def is_strong(self, onsets, level=STRONG_BEAT):
+        return array('b', [l <= level for l in self.classify(onsets)[2]])
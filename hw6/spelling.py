@@ -0,0 +1,160 @@
+###############################################################################
+
+from functools import lru_cache
+
+from .pitch import Pitch
+from .key import Key
+
+## The cost of each accidental a spelling adds to (or removes from) the key
+# signature, e.g. F# in C major costs 1 and Fb in G major costs 2.
+ACCIDENTAL_COST = 2.0
+
+## The extra cost of a spelling that uses a double sharp or double flat.
+DOUBLE_ACCIDENTAL_COST = 2.0
+
+## The cost of a melodic interval that is not diatonic, i.e. any augmented
+# or diminished interval other than the tritone, e.g. C-D# or C#-C.
+INTERVAL_COST = 1.5
+
+## The cost of a chromatically raised note that moves down next, or a lowered
+# note that moves up, e.g. C# C instead of Db C. Chromatic notes are spelled
+# in the direction they lead.
+RESOLUTION_COST = 0.5
+
+## The pitch class of each natural letter C-B.
+_letter_pcs = (0, 2, 4, 5, 7, 9, 11)
+
+## The semitones of the diatonic (major, minor and perfect) simple intervals
+# for each letter distance 0-6, plus the tritone which is diatonic as both
+# an augmented 4th and a diminished 5th.
+_diatonic_semitones = [{0}, {1, 2}, {3, 4}, {5, 6}, {6, 7}, {8, 9}, {10, 11}]
+
+
+## Returns a tuple with the candidate spellings of every midi key number
+# 0-127 in a key. Each entry is a tuple of (pitch, step, alteration, cost)
+# candidates sorted by cost, where step is the pitch's diatonic step number
+# (octave * 7 + letter), alteration the number of semitones the pitch is
+# raised (positive) or lowered (negative) from the key signature and cost
+# its accidental cost. Tables are built once per key signature and mode.
+# @param key  A Key.
+#
+# The function should raise a TypeError if key is not a Key.
+def spelling_table(key):
+    if not isinstance(key, Key):
+        raise TypeError("key is not a Key")
+    return _spelling_table(key.signum, key.mode)
+
+
+## Private function that builds the spelling table of a key signature and
+# mode, see spelling_table().
+@lru_cache(maxsize=None)
+def _spelling_table(signum, mode):
+    # the accidental index used by the key signature for each letter
+    signature = [pnum.value & 15 for pnum in sorted(Key(signum, mode).scale(), key=lambda p: p.value >> 4)]
+    table = []
+    for keynum in range(128):
+        candidates = []
+        for letter in range(7):
+            for accidental in range(5):
+                octave, rest = divmod(keynum - _letter_pcs[letter] - accidental + 2, 12)
+                if rest != 0 or not 0 <= octave <= 10:
+                    continue
+                alteration = accidental - signature[letter]
+                cost = abs(alteration) * ACCIDENTAL_COST
+                if accidental in (0, 4):
+                    cost += DOUBLE_ACCIDENTAL_COST
+                candidates.append((Pitch([letter, accidental, octave]), octave * 7 + letter, alteration, cost))
+        candidates.sort(key=lambda candidate: candidate[3])
+        table.append(tuple(candidates))
+    return tuple(table)
+
+
+## Returns the cost of moving between two spellings: INTERVAL_COST if the
+# melodic interval they form is not diatonic, plus RESOLUTION_COST if the
+# first spelling is altered against the direction of the motion.
+# @param candidate1  The (pitch, step, alteration, cost) of the first note.
+# @param keynum1  The key number of the first note.
+# @param candidate2  The (pitch, step, alteration, cost) of the second note.
+# @param keynum2  The key number of the second note.
+def transition_cost(candidate1, keynum1, candidate2, keynum2):
+    steps, semitones = candidate2[1] - candidate1[1], keynum2 - keynum1
+    cost = 0.0
+    if (candidate1[2] > 0 and semitones < 0) or (candidate1[2] < 0 and semitones > 0):
+        cost += RESOLUTION_COST
+    if steps < 0 or (steps == 0 and semitones < 0):
+        steps, semitones = -steps, -semitones
+    octaves, letters = divmod(steps, 7)
+    if semitones - octaves * 12 not in _diatonic_semitones[letters]:
+        cost += INTERVAL_COST
+    return cost
+
+
+## Spells a sequence of midi key numbers as Pitches in a key. The spelling
+# minimizes the total accidental cost of the notes (see spelling_table())
+# plus the cost of their melodic motion (see transition_cost()). The minimum
+# is found by dynamic programming (Viterbi) over windows of notes: each
+# window is solved together with a short lookahead, only its own notes are
+# kept, and the last kept spelling starts the next window. This runs in linear time and constant memory per window.
+# @param keynums  An iterable of midi key numbers 0-127. A None value (e.g.
+# a rest) becomes an empty Pitch and does not constrain its neighbors.
+# @param key  The Key to spell in.
+# @param window  The number of notes kept from each window. Defaults to 32.
+# @param lookahead  The number of notes after each window considered
+# when spelling it. Defaults to 8.
+# @returns A list of Pitches, one per key number.
+#
+# The function should raise a TypeError if key is not a Key and a ValueError
+# if a key number is invalid, window is not a positive integer or lookahead
+# is not a non-negative integer.
+def spell(keynums, key, window=32, lookahead=8):
+    table = spelling_table(key)
+    if not isinstance(window, int) or window <= 0:
+        raise ValueError("window is not a positive integer")
+    if not isinstance(lookahead, int) or lookahead < 0:
+        raise ValueError("lookahead is not a non-negative integer")
+    keynums = list(keynums)
+    for keynum in keynums:
+        if keynum is not None and (not isinstance(keynum, int) or keynum < 0 or keynum > 127):
+            raise ValueError(f"Invalid keynum: {keynum}.")
+
+    pitches = []
+    previous = None
+    for start in range(0, len(keynums), window):
+        stop = min(start + window, len(keynums))
+        path = _best_path(table, keynums[start:stop + lookahead], previous)
+        pitches.extend(path[:stop - start])
+        previous = (keynums[stop - 1], path[stop - start - 1])
+    return [Pitch() if candidate is None else candidate[0] for candidate in pitches]
+
+
+## Private function that returns the lowest cost list of candidates (or None
+# for rests) spelling keynums. previous is the (keynum, candidate) before the
+# first note, or None.
+def _best_path(table, keynums, previous):
+    # each state is (total cost, candidate, keynum, index of the previous state)
+    columns = []
+    states = [(0.0, previous[1], previous[0], None)] if previous and previous[1] else [(0.0, None, None, None)]
+    for keynum in keynums:
+        if keynum is None:
+            best = min(range(len(states)), key=lambda i: states[i][0])
+            column = [(states[best][0], None, None, best)]
+        else:
+            column = []
+            for candidate in table[keynum]:
+                choices = []
+                for i, (cost, last, last_keynum, _) in enumerate(states):
+                    if last is not None:
+                        cost += transition_cost(last, last_keynum, candidate, keynum)
+                    choices.append((cost, i))
+                cost, i = min(choices)
+                column.append((cost + candidate[3], candidate, keynum, i))
+        columns.append(column)
+        states = column
+
+    path = []
+    i = min(range(len(states)), key=lambda i: states[i][0])
+    for column in reversed(columns):
+        path.append(column[i][1])
+        i = column[i][3]
+    path.reverse()
+    return path
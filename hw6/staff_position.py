@@ -0,0 +1,108 @@
+###############################################################################
+
+from array import array
+from functools import lru_cache
+
+from .pitch import Pitch
+from .clef import Clef, BOTTOM_LINE, TOP_LINE
+
+## The staff step of an empty pitch (e.g. a rest) in staff_positions().
+EMPTY_STEP = -128
+
+## The diatonic step number (octave index * 7 + letter index, see
+# Pitch.pos()) of the pitch each clef names at its attachment line before
+# transposition: G4 for the G clefs, C4 for the C clefs and F3 for the F
+# clefs. The percussion clef names no pitch.
+_clef_pitch_steps = {
+    Clef.TREBLE: 39, Clef.TREBLE_8VA: 39, Clef.TREBLE_15MA: 39, Clef.TENOR_TREBLE: 39, Clef.FRENCH_VIOLIN: 39,
+    Clef.SOPRANO: 35, Clef.MEZZO_SOPRANO: 35, Clef.ALTO: 35, Clef.TENOR: 35, Clef.BARITONE: 35,
+    Clef.BASS: 31, Clef.BASS_8VA: 31, Clef.BASS_15MA: 31, Clef.BARITONE_F: 31, Clef.SUB_BASS: 31,
+}
+
+## The diatonic steps a clef's transposition value moves its pitches.
+_transposition_steps = {0: 0, 8: 7, -8: -7, 15: 14, -15: -14}
+
+
+## Returns the staff position tables of a clef as a (steps, ledgers) tuple of
+# arrays indexed by diatonic step number 0-76 (octave index * 7 + letter
+# index), covering every legal pitch. steps holds the staff position of the
+# pitch in line-space units (see clef.py), 0 being the bottom line and 8 the
+# top line, and ledgers the number of ledger lines the pitch needs above or
+# below the staff. Pitches are sounding pitches, so a transposing clef such
+# as TREBLE_8VA shows G5 on its second line. Tables are built once per clef.
+# @param clef  A Clef.
+#
+# The function should raise a TypeError if clef is not a Clef and a
+# ValueError for the percussion clef, which has no pitch positions.
+def staff_table(clef):
+    if not isinstance(clef, Clef):
+        raise TypeError("clef is not a Clef")
+    if clef not in _clef_pitch_steps:
+        raise ValueError(f"{clef.name.capitalize()} clef has no pitch positions")
+    return _staff_table(clef)
+
+
+## Private function that builds the staff position tables of a clef, see
+# staff_table().
+@lru_cache(maxsize=None)
+def _staff_table(clef):
+    base = _clef_pitch_steps[clef] + _transposition_steps[clef.transposition()] - clef.linespace()
+    steps = array('b', [step - base for step in range(77)])
+    ledgers = array('b', [max(BOTTOM_LINE - s, s - TOP_LINE, 0) // 2 for s in steps])
+    return steps, ledgers
+
+
+## Returns the staff position of a Pitch in line-space units, see staff_table().
+# @param pitch  A non-empty Pitch.
+# @param clef  A Clef.
+#
+# The function should raise a ValueError if the pitch is empty.
+def staff_step(pitch, clef):
+    return staff_table(clef)[0][_diatonic_step(pitch)]
+
+
+## Returns the number of ledger lines a Pitch needs on a clef's staff, see
+# staff_table().
+# @param pitch  A non-empty Pitch.
+# @param clef  A Clef.
+#
+# The function should raise a ValueError if the pitch is empty.
+def ledger_lines(pitch, clef):
+    return staff_table(clef)[1][_diatonic_step(pitch)]
+
+
+## Private function that returns the diatonic step number of a Pitch.
+def _diatonic_step(pitch):
+    if pitch.is_empty():
+        raise ValueError("Pitch cannot be empty")
+    pos = pitch.pos()
+    return (pos >> 8) * 7 + ((pos >> 4) & 15)
+
+
+## Maps a whole sequence of pitches to staff positions in one call.
+# @param pitches  A PitchArray (any object with letters and octaves index
+# columns, -1 for empty pitches), whose columns are used directly, or an
+# iterable of Pitches, Notes (anything with a pitch attribute) and None
+# values, e.g. a Voice. Empty pitches, None values and anything else
+# without a single pitch (rests and chords) are empty.
+# @param clef  A Clef.
+# @returns A (steps, ledgers) tuple of arrays, one entry per pitch, with
+# EMPTY_STEP steps and -1 ledger lines for empty entries.
+#
+# The function should raise a TypeError if clef is not a Clef and a
+# ValueError for the percussion clef.
+def staff_positions(pitches, clef):
+    table, ledger_table = staff_table(clef)
+    if hasattr(pitches, 'letters') and hasattr(pitches, 'octaves'):
+        indexes = [-1 if l < 0 else o * 7 + l for l, o in zip(pitches.letters, pitches.octaves)]
+    else:
+        indexes = []
+        for pitch in pitches:
+            pitch = getattr(pitch, 'pitch', pitch)
+            if not isinstance(pitch, Pitch) or pitch.is_empty():
+                indexes.append(-1)
+            else:
+                indexes.append(_diatonic_step(pitch))
+    steps = array('b', [EMPTY_STEP if i < 0 else table[i] for i in indexes])
+    ledgers = array('b', [-1 if i < 0 else ledger_table[i] for i in indexes])
+    return steps, ledgers
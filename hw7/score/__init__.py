@@ -8,6 +8,7 @@ __all__ = [
     'clef',
     'mark',
     'durational',
+    'onsets',
     'rest',
     'note',
     'chord',
@@ -16,7 +17,10 @@ __all__ = [
     'bar',
     'staff',
     'part',
+    'score_index',
     'score',
+    'transpose',
+    'key_finder',
     'mxml'
 ]
 
@@ -29,6 +33,7 @@ from .key import *
 from .clef import *
 from .mark import *
 from .durational import *
+from .onsets import *
 from .rest import *
 from .note import *
 from .chord import *
@@ -37,6 +42,9 @@ from .barline import *
 from .bar import *
 from .staff import *
 from .part import *
+from .score_index import *
 from .score import *
+from .transpose import *
+from .key_finder import *
 from .mxml import *
 
@@ -1,5 +1,6 @@
 ###############################################################################
 
+from .ratio import Ratio
 from .voice import Voice
 
 
@@ -70,15 +71,25 @@ class Bar:
         return iter(self.voices)
 
     ## Appends a Voice to the bars's voice list and assigns
-    # itself to the voice's bar attribute.
+    # itself to the voice's bar attribute. If the bar belongs to a score
+    # the voice is added to the score's index, see ScoreIndex.
     # @param voice The Voice to append to the bar's voice list.
     # The method should raise a TypeError if voice is not a Voice instance.
     def add_voice(self, voice):
         if isinstance(voice, Voice):
             self.voices.append(voice)
+            voice.bar = self
+            index = self._index()
+            if index is not None:
+                index.add_voice(voice, self)
         else:
             raise TypeError("voice is not a Voice instance")
 
+    ## Private method that returns the ScoreIndex of the bar's score, or
+    # None if the bar is not in a score.
+    def _index(self):
+        return None if self.staff is None else self.staff._index()
+
     ## Returns the bar's voice identifiers in the same order
     # that they occur in the voices list.
     def voice_ids(self):
@@ -88,3 +99,15 @@ class Bar:
     def num_voices(self):
         return len(self.voices)
 
+    ## Returns a beat Ratio representing the duration of the bar's longest
+    # voice, or 0 if the bar has no voices.
+    def dur(self):
+        return max([voice.dur() for voice in self.voices], default=Ratio(0, 1))
+
+    ## Returns a list holding the note, chord or rest sounding in each
+    # of the bar's voices at a beat offset from the start of the bar.
+    # Voices with no note sounding at offset contribute None.
+    # @param offset  A Ratio or int beat offset.
+    def notes_at(self, offset):
+        return [voice.note_at(offset) for voice in self.voices]
+
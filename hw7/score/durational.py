@@ -22,7 +22,7 @@ class Durational:
 
     ## Returns the 'part and voice' identifier for this object.
     # Should only by called on subclass instances that already 
-    # have their 'voice' attribute already set.
+    # have their 'voice' attribute already set. See: Voice.get_pvid().
     def get_pvid(self):
-        return self.voice.bar.staff.part.id + "." + str(self.voice.id)
+        return self.voice.get_pvid()
 
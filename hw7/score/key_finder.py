@@ -0,0 +1,208 @@
+###############################################################################
+
+import math
+from collections import deque
+from itertools import groupby
+
+from .mode import Mode
+from .key import Key
+from .note import Note
+from .chord import Chord
+
+## The Krumhansl-Kessler probe tone profile of the major mode, indexed by
+# semitones above the tonic.
+MAJOR_PROFILE = (6.35, 2.23, 3.48, 2.33, 4.38, 4.09, 2.52, 5.19, 2.39, 3.66, 2.29, 2.88)
+
+## The Krumhansl-Kessler probe tone profile of the minor mode, indexed by
+# semitones above the tonic.
+MINOR_PROFILE = (6.33, 2.68, 3.52, 5.38, 2.60, 3.53, 2.54, 4.75, 3.98, 2.69, 3.34, 3.17)
+
+## The pitch class of each letter C-B, i.e. of each mode's tonic in the
+# white-key scale.
+_letter_pcs = (0, 2, 4, 5, 7, 9, 11)
+
+
+## Returns a duration-weighted pitch-class histogram of a sequence of notes,
+# chords and rests: entry pc holds the total beats sounded by pitch class pc.
+# Rests and empty pitches are ignored.
+# @param notes  An iterable of Notes, Chords and Rests, e.g. a Voice.
+# @returns A list of 12 floats.
+def pc_histogram(notes):
+    histogram = [0.0] * 12
+    for note in notes:
+        for pc, weight in _pcs_and_weights(note):
+            histogram[pc] += weight
+    return histogram
+
+
+## Returns a list of (onset, pc, weight) tuples for every pitch in a score,
+# sorted by onset. Onsets are float beats from the start of the score and
+# weights are float durations. Every staff of every part is read in parallel,
+# a bar starting where the previous bar of its staff ended (see Bar.dur()).
+# @param score  A Score.
+def score_events(score):
+    events = []
+    for part in score.parts:
+        for staff in part.staffs:
+            start = 0.0
+            for bar in staff.bars:
+                for voice in bar.voices:
+                    ticks, den = voice.onsets().ticks, voice.onsets().den
+                    for i, note in enumerate(voice.notes):
+                        onset = start + ticks[i] / den
+                        for pc, weight in _pcs_and_weights(note):
+                            events.append((onset, pc, weight))
+                start += bar.dur().float()
+    events.sort(key=lambda event: event[0])
+    return events
+
+
+## Private function that returns the (pc, weight) pairs sounded by a note,
+# chord or rest.
+def _pcs_and_weights(note):
+    if isinstance(note, Note):
+        notes = [note]
+    elif isinstance(note, Chord):
+        notes = note.notes
+    else:
+        return []
+    weight = note.dur.float()
+    return [(n.pitch.pc(), weight) for n in notes if not n.pitch.is_empty()]
+
+
+## Returns the Key of a mode whose tonic has pitch class pc, choosing the
+# signature with the fewest sharps or flats (flats for six of either).
+# @param pc  A pitch class 0-11.
+# @param mode  A Mode.
+def key_of_tonic(pc, mode):
+    major = (pc - _letter_pcs[mode.value]) % 12
+    signum = min((s for s in range(-7, 8) if s * 7 % 12 == major), key=lambda s: (abs(s), s))
+    return Key(signum, mode)
+
+
+## A class that finds the key of music by correlating its duration-weighted
+# pitch-class histogram with a profile of every candidate key, in the style
+# of the Krumhansl-Schmuckler algorithm. Each profile is rotated to all
+# twelve tonics, mean-centered and scaled to unit length once, so that the
+# correlation of a histogram with a key is a single dot product divided by
+# the spread of the histogram.
+#
+# A KeyFinder holds two attributes of equal length:
+# * keys  The candidate Keys, twelve per mode.
+# * profiles  The normalized profile of each key, indexed by pitch class.
+class KeyFinder:
+    ## Initializes a KeyFinder.
+    # @param profiles  A dictionary from Mode to a 12-element profile indexed
+    # by semitones above the tonic. Defaults to the major and minor profiles,
+    # giving 24 keys. Other modes can be added with their own profiles.
+    #
+    # The constructor should raise a TypeError if a key of profiles is not a
+    # Mode and a ValueError if a profile does not have 12 values or is flat.
+    def __init__(self, profiles=None):
+        if profiles is None:
+            profiles = {Mode.MAJOR: MAJOR_PROFILE, Mode.MINOR: MINOR_PROFILE}
+        self.keys = []
+        self.profiles = []
+        for mode, profile in profiles.items():
+            if not isinstance(mode, Mode):
+                raise TypeError(f"Invalid mode: {mode}.")
+            if len(profile) != 12:
+                raise ValueError("Profile does not have 12 values")
+            mean = sum(profile) / 12
+            norm = math.sqrt(sum((p - mean) ** 2 for p in profile))
+            if norm == 0:
+                raise ValueError("Profile has no variance")
+            centered = [(p - mean) / norm for p in profile]
+            for tonic in range(12):
+                self.keys.append(key_of_tonic(tonic, mode))
+                self.profiles.append(tuple(centered[(pc - tonic) % 12] for pc in range(12)))
+
+    ## Returns a string showing the number of candidate keys and the hex id
+    # of the instance.
+    # Example: '<KeyFinder: 24 keys 0x109877c50>'
+    def __str__(self):
+        return f'<KeyFinder: {len(self.keys)} keys {hex(id(self))}>'
+
+    ## Returns a list with the correlation -1 to 1 of a histogram with each
+    # candidate key, in the order of self.keys. A histogram whose entries
+    # are all equal (e.g. no notes) correlates 0 with every key.
+    # @param histogram  A 12-element pitch-class histogram, see pc_histogram().
+    #
+    # The method should raise a ValueError if histogram does not have 12 values.
+    def correlations(self, histogram):
+        if len(histogram) != 12:
+            raise ValueError("Histogram does not have 12 values")
+        total = sum(histogram)
+        spread = math.sqrt(max(sum(h * h for h in histogram) - total * total / 12, 0.0))
+        if spread == 0:
+            return [0.0] * len(self.keys)
+        return [sum(h * p for h, p in zip(histogram, profile)) / spread for profile in self.profiles]
+
+    ## Returns the (Key, correlation) of the candidate key that best fits a
+    # histogram, or None if the histogram is flat.
+    # @param histogram  A 12-element pitch-class histogram, see pc_histogram().
+    def find(self, histogram):
+        correlations = self.correlations(histogram)
+        best = max(range(len(correlations)), key=correlations.__getitem__)
+        return None if correlations[best] == 0 else (self.keys[best], correlations[best])
+
+    ## Returns the Key that best fits all the notes of a score, or None if
+    # the score has no pitches.
+    # @param score  A Score.
+    def find_key(self, score):
+        histogram = [0.0] * 12
+        for _, pc, weight in score_events(score):
+            histogram[pc] += weight
+        found = self.find(histogram)
+        return None if found is None else found[0]
+
+    ## A generator that follows the key of a stream of notes through a
+    # sliding window and yields an (onset, Key, correlation) tuple at the
+    # first onset and at every onset where the best key changes. Changes are
+    # reported per onset, not per note: all the notes that start at an onset
+    # (e.g. the notes of a chord) enter the window before the best key is
+    # chosen. The window holds the notes whose onsets lie within window
+    # beats of the current onset. Each note updates the histogram, its sums
+    # and the dot product of every key in O(1) (per key) as it enters and
+    # leaves the window, so long scores are never rescanned.
+    # @param events  An iterable of (onset, pc, weight) tuples sorted by
+    # onset, see score_events().
+    # @param window  The length of the window in beats, defaults to 16.
+    #
+    # The method should raise a ValueError if window is not positive.
+    def key_changes(self, events, window=16):
+        if window <= 0:
+            raise ValueError("Window is not positive")
+        inside = deque()
+        histogram = [0.0] * 12
+        dots = [0.0] * len(self.keys)
+        total = squares = 0.0
+        current = None
+        for onset, group in groupby(events, key=lambda event: event[0]):
+            while inside and inside[0][0] <= onset - window:
+                _, old_pc, old_weight = inside.popleft()
+                total, squares = self._update(histogram, dots, total, squares, old_pc, -old_weight)
+            if not inside:
+                # start over from zero to drop any accumulated rounding error
+                histogram, dots, total, squares = [0.0] * 12, [0.0] * len(self.keys), 0.0, 0.0
+            # add every note of the onset before choosing the best key
+            for event in group:
+                inside.append(event)
+                total, squares = self._update(histogram, dots, total, squares, event[1], event[2])
+            spread = squares - total * total / 12
+            if spread <= 0:
+                continue
+            best = max(range(len(dots)), key=dots.__getitem__)
+            if self.keys[best] is not current:
+                current = self.keys[best]
+                yield onset, current, dots[best] / math.sqrt(spread)
+
+    ## Private method that adds weight to entry pc of a sliding histogram and
+    # updates the dot products in place. Returns the new (total, squares)
+    # sums of the histogram and its squares.
+    def _update(self, histogram, dots, total, squares, pc, weight):
+        old = histogram[pc]
+        histogram[pc] = old + weight
+        for i, profile in enumerate(self.profiles):
+            dots[i] += weight * profile[pc]
+        return total + weight, squares + (old + weight) ** 2 - old * old
@@ -0,0 +1,104 @@
+###############################################################################
+
+import math
+from array import array
+from bisect import bisect_right
+
+from .ratio import Ratio
+
+
+## A class that computes the exact onsets of a sequence of durations.
+# All durations are rescaled to one common denominator (the least common
+# multiple of their denominators) so that the onsets become integer prefix
+# sums ('ticks'). Building an Onsets costs O(n) integer operations and
+# every onset, the total duration, and the index of the duration sounding
+# at any offset can then be read back without any further Ratio arithmetic.
+class Onsets:
+    ## Initializes an Onsets from a sequence of durations.
+    # @param durs  An iterable of Ratio or int durations.
+    # @param start  A Ratio or int onset of the first duration. Defaults to 0.
+    #
+    # The attribute self.den holds the common denominator and self.ticks
+    # holds len(durs) + 1 integer prefix sums, the last being the end time.
+    # The constructor should raise a TypeError if a duration or start is
+    # not a Ratio or int.
+    def __init__(self, durs, start=0):
+        pairs = [Onsets._pair(dur) for dur in durs]
+        start = Onsets._pair(start)
+        den = start[1]
+        for _, d in pairs:
+            den = den * d // math.gcd(den, d)
+        ticks = [start[0] * (den // start[1])]
+        for n, d in pairs:
+            ticks.append(ticks[-1] + n * (den // d))
+        try:
+            ticks = array('q', ticks)
+        except OverflowError:
+            pass
+        self.den = den
+        self.ticks = ticks
+
+    ## Private method that returns the (num, den) pair of a Ratio or int.
+    @staticmethod
+    def _pair(value):
+        if isinstance(value, Ratio):
+            return value.num, value.den
+        if isinstance(value, int):
+            return value, 1
+        raise TypeError(f"Invalid duration: {value}.")
+
+    ## Returns a string showing the number of durations, the total
+    # duration and the hex id of the instance.
+    # Example: '<Onsets: 4 3/2 0x109877c50>'
+    def __str__(self):
+        return f'<Onsets: {len(self)} {self.end().string()} {hex(id(self))}>'
+
+    ## Define __repr__ to be the same as __str__ except there is
+    # no hex id included.
+    # Example: '<Onsets: 4 3/2>'
+    def __repr__(self):
+        return f'<Onsets: {len(self)} {self.end().string()}>'
+
+    ## Returns the number of durations.
+    def __len__(self):
+        return len(self.ticks) - 1
+
+    ## Returns the onset of the duration at index as a Ratio.
+    def __getitem__(self, index):
+        return Ratio(self.ticks[range(len(self))[index]], self.den)
+
+    ## Implements Onsets iteration by returning an iterator of onset Ratios.
+    def __iter__(self):
+        return iter(self.onsets())
+
+    ## Returns a list of the onsets of every duration as Ratios.
+    def onsets(self):
+        return [Ratio(tick, self.den) for tick in self.ticks[:-1]]
+
+    ## Returns a list of the offsets (onset plus duration) of every
+    # duration as Ratios.
+    def offsets(self):
+        return [Ratio(tick, self.den) for tick in self.ticks[1:]]
+
+    ## Returns the onset of the first duration as a Ratio.
+    def start(self):
+        return Ratio(self.ticks[0], self.den)
+
+    ## Returns the offset of the last duration as a Ratio.
+    def end(self):
+        return Ratio(self.ticks[-1], self.den)
+
+    ## Returns the sum of the durations as a Ratio.
+    def dur(self):
+        return Ratio(self.ticks[-1] - self.ticks[0], self.den)
+
+    ## Returns the index of the duration sounding at offset, i.e. the last
+    # duration whose onset is at or before offset, using a binary search.
+    # Returns None if offset is before the start or at or after the end.
+    # @param offset  A Ratio or int time point.
+    def index_at(self, offset):
+        num, den = Onsets._pair(offset)
+        tick = (num * self.den) // den
+        if num * self.den < self.ticks[0] * den or tick >= self.ticks[-1]:
+            return None
+        return bisect_right(self.ticks, tick, 0, len(self.ticks) - 1) - 1
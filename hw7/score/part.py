@@ -41,19 +41,29 @@ class Part:
         return iter(self.staffs)
 
     ## Appends a Staff to the part's staff list and assigns
-    # itself to the staff's part attribute.
+    # itself to the staff's part attribute. If the part belongs to a score
+    # the staff is added to the score's index, see ScoreIndex.
     # @param staff The staff to append to the parts's staff list.
     # The method should raise a TypeError if part is not a Part instance.
     def add_staff(self, staff):
         if isinstance(staff, Staff):
             self.staffs.append(staff)
+            staff.part = self
+            index = self._index()
+            if index is not None:
+                index.add_staff(staff, self)
         else:
             raise TypeError("part is not a Part instance")
 
+    ## Private method that returns the ScoreIndex of the part's score, or
+    # None if the part is not in a score.
+    def _index(self):
+        return None if self.score is None else getattr(self.score, 'index', None)
+
     ## Returns the part's staff identifiers.
     def staff_ids(self):
         return [staff.id for staff in self.staffs]
 
     ## Returns the number of staffs in the part.
     def num_staffs(self):
-        return len(self.staffs)
\ No newline at end of file
+        return len(self.staffs)
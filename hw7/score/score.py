@@ -2,10 +2,12 @@
 
 from .ratio import Ratio
 from .part import Part
+from .score_index import ScoreIndex
 
 
 ## A class representing a complete musical score. A score has two attributes:
-#  self.metadata and self.parts.
+#  self.metadata and self.parts, and keeps a ScoreIndex of its objects in
+#  self.index.
 #
 #  Example: To load a score from a MusicXml file and iterate all its
 #  objects you can do something like this:
@@ -35,9 +37,16 @@ class Score:
     # The method should raise a TypeError If metadata is not a dictionary.
     # If parts are specified they should be added to the score by calling
     # add_part(). See also: Part.
-    def __init__(self, metadata={}, parts=[]):
+    def __init__(self, metadata=None, parts=None):
+        if metadata is None:
+            metadata = {}
+        elif not isinstance(metadata, dict):
+            raise TypeError("metadata is not a dictionary")
         self.metadata = metadata
-        self.parts = parts
+        self.parts = []
+        self.index = ScoreIndex(self)
+        for part in parts or []:
+            self.add_part(part)
 
     ## Returns a string showing the score's title and the unique
     # id of the instance printed in hex. To find the score title
@@ -79,12 +88,15 @@ class Score:
         return value
 
     ## Appends a Part to the score's part list and assigns
-    # itself to the part's score attribute.
+    # itself to the part's score attribute. The part and everything
+    # beneath it are added to the score's index, see ScoreIndex.
     # @param part The part to append to the Score's part list.
     # The method should raise a TypeError if part is not a Part instance.
     def add_part(self, part):
         if isinstance(part, Part):
             self.parts.append(part)
+            part.score = self
+            self.index.add_part(part)
         else:
             raise TypeError("part is not a Part instance")
 
@@ -98,14 +110,11 @@ class Score:
         return len(self.parts)
 
     ## Returns the score part with the specified id or None if it cannot be found.
+    # The part is looked up in the score's index, see ScoreIndex.
     # @param pid  The id of the part to return.
     # @return The part if it is found else None.
     def get_part(self, pid):
-        for part in self.parts:
-            if part.id == pid:
-                return part
-
-        return None
+        return self.index.get_part(pid)
 
     ## Returns a list of indented repr() strings. Every string in the list represents
     # one Score/Part/Staff/Bar/Voice/Note/Rest/Chord instance's repr() string
@@ -0,0 +1,136 @@
+###############################################################################
+
+
+## A class that indexes the objects of a Score by their identifiers so that
+# analyses can look them up in O(1) instead of walking the hierarchy. A
+# ScoreIndex holds the following dictionaries:
+# * parts  Part id to Part.
+# * staffs  (part id, staff id) to Staff.
+# * bars  (part id, staff id, bar id) to Bar.
+# * voices  'Part and voice' identifier (see Voice.get_pvid()) to the list of
+#   the Voices with that identifier, one per bar, in the order they were added.
+#
+# Every Note, Chord and Rest is also mapped to its (part id, staff id, bar id,
+# voice id, ordinal) coordinates, ordinal being its index in its voice. The
+# notes of a chord share the chord's coordinates. When two objects have the
+# same identifiers the first one added is kept, as a linear search would.
+#
+# A Score keeps its index current as its add_part(), Part.add_staff(),
+# Staff.add_bar(), Bar.add_voice() and Voice.add_note() methods are called,
+# in any order: attaching an object indexes everything already beneath it.
+# Objects appended to the lists directly are not seen until rebuild().
+class ScoreIndex:
+    ## Initializes a ScoreIndex and indexes the parts of a score.
+    # @param score  The Score to index. Defaults to None, an empty index.
+    def __init__(self, score=None):
+        self.score = score
+        self.rebuild()
+
+    ## Returns a string showing the number of parts, bars and notes indexed
+    # and the hex id of the instance.
+    # Example: '<ScoreIndex: 2 parts 24 bars 96 notes 0x109877c50>'
+    def __str__(self):
+        return f'<ScoreIndex: {len(self.parts)} parts {len(self.bars)} bars {len(self._notes)} notes {hex(id(self))}>'
+
+    ## Clears the index and indexes the score's parts again.
+    def rebuild(self):
+        self.parts = {}
+        self.staffs = {}
+        self.bars = {}
+        self.voices = {}
+        self._bar_voices = {}
+        self._notes = {}
+        if self.score is not None:
+            for part in self.score.parts:
+                self.add_part(part)
+
+    ## Indexes a Part and everything beneath it.
+    def add_part(self, part):
+        self.parts.setdefault(part.id, part)
+        for staff in part.staffs:
+            self.add_staff(staff, part)
+
+    ## Indexes a Staff of a Part and everything beneath it.
+    # @param staff  The Staff to index.
+    # @param part  The staff's Part. Defaults to staff.part.
+    def add_staff(self, staff, part=None):
+        part = staff.part if part is None else part
+        self.staffs.setdefault((part.id, staff.id), staff)
+        for bar in staff.bars:
+            self.add_bar(bar, staff, part)
+
+    ## Indexes a Bar of a Staff and everything beneath it.
+    # @param bar  The Bar to index.
+    # @param staff  The bar's Staff. Defaults to bar.staff.
+    # @param part  The staff's Part. Defaults to staff.part.
+    def add_bar(self, bar, staff=None, part=None):
+        staff = bar.staff if staff is None else staff
+        part = staff.part if part is None else part
+        self.bars.setdefault((part.id, staff.id, bar.id), bar)
+        for voice in bar.voices:
+            self.add_voice(voice, bar, staff, part)
+
+    ## Indexes a Voice of a Bar and all its notes.
+    # @param voice  The Voice to index.
+    # @param bar  The voice's Bar. Defaults to voice.bar.
+    # @param staff  The bar's Staff. Defaults to bar.staff.
+    # @param part  The staff's Part. Defaults to staff.part.
+    def add_voice(self, voice, bar=None, staff=None, part=None):
+        bar = voice.bar if bar is None else bar
+        staff = bar.staff if staff is None else staff
+        part = staff.part if part is None else part
+        self._bar_voices.setdefault((part.id, staff.id, bar.id, voice.id), voice)
+        self.voices.setdefault(f'{part.id}.{voice.id}', []).append(voice)
+        for ordinal, note in enumerate(voice.notes):
+            self._add_note(note, (part.id, staff.id, bar.id, voice.id, ordinal))
+
+    ## Indexes the last Note, Chord or Rest of a voice, see Voice.add_note().
+    # @param note  The Note, Chord or Rest to index.
+    # @param voice  The note's Voice. Defaults to note.voice.
+    def add_note(self, note, voice=None):
+        voice = note.voice if voice is None else voice
+        bar = voice.bar
+        self._add_note(note, (bar.staff.part.id, bar.staff.id, bar.id, voice.id, len(voice.notes) - 1))
+
+    ## Private method that maps a note, and the notes of a chord, to its
+    # coordinates. Notes are not hashable, so they are keyed by id().
+    def _add_note(self, note, coordinates):
+        self._notes[id(note)] = (note, coordinates)
+        for member in getattr(note, 'notes', ()):
+            self._notes[id(member)] = (member, coordinates)
+
+    ## Returns the Part with an id, or None.
+    def get_part(self, pid):
+        return self.parts.get(pid)
+
+    ## Returns the Staff with an id in a part, or None.
+    def get_staff(self, pid, sid):
+        return self.staffs.get((pid, sid))
+
+    ## Returns the Bar with an id in a staff, or None.
+    def get_bar(self, pid, sid, bid):
+        return self.bars.get((pid, sid, bid))
+
+    ## Returns the Voice with an id in a bar, or None.
+    def get_voice(self, pid, sid, bid, vid):
+        return self._bar_voices.get((pid, sid, bid, vid))
+
+    ## Returns the list of Voices with a 'part and voice' identifier, one per
+    # bar, or an empty list.
+    # @param pvid  A string PARTID.VOICEID, e.g. 'P1.1'.
+    def get_voices(self, pvid):
+        return self.voices.get(pvid, [])
+
+    ## Returns the (part id, staff id, bar id, voice id, ordinal) coordinates
+    # of a Note, Chord or Rest, or None if it is not indexed.
+    def coordinates(self, note):
+        entry = self._notes.get(id(note))
+        return None if entry is None or entry[0] is not note else entry[1]
+
+    ## Returns the Note, Chord or Rest at (part id, staff id, bar id, voice id,
+    # ordinal) coordinates, or None.
+    def get_note(self, pid, sid, bid, vid, ordinal):
+        voice = self.get_voice(pid, sid, bid, vid)
+        if voice is None or not 0 <= ordinal < len(voice.notes):
+            return None
+        return voice.notes[ordinal]
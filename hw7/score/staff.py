@@ -34,15 +34,25 @@ class Staff:
         return iter(self.bars)
 
     ## Appends a Bar to the staff's bar list and assigns
-    # itself to the bar's staff attribute.
+    # itself to the bar's staff attribute. If the staff belongs to a score
+    # the bar is added to the score's index, see ScoreIndex.
     # @param bar The Bar to append to the staff's bar list.
     # The method should raise a TypeError if bar is not a Bar instance.
     def add_bar(self, bar):
         if isinstance(bar, Bar):
             self.bars.append(bar)
+            bar.staff = self
+            index = self._index()
+            if index is not None:
+                index.add_bar(bar, self, self.part)
         else:
             raise TypeError("bar is not a Bar instance")
 
+    ## Private method that returns the ScoreIndex of the staff's score, or
+    # None if the staff is not in a score.
+    def _index(self):
+        return None if self.part is None else self.part._index()
+
     ## Returns a list of the staffs's bar identifiers in the same order
     # that they occur in the bars list.
     def bar_ids(self):
@@ -50,4 +60,4 @@ class Staff:
 
     ## Returns the number of bars in the staff.
     def num_bars(self):
-        return len(self.bars)
\ No newline at end of file
+        return len(self.bars)
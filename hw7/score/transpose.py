@@ -0,0 +1,231 @@
+###############################################################################
+
+import copy
+from functools import lru_cache
+
+from .pitch import Pitch
+from .interval import Interval
+from .key import Key
+from .note import Note
+from .chord import Chord
+from .score import Score
+from .score_index import ScoreIndex
+
+## The pitch class of each letter C-B.
+_letter_pcs = (0, 2, 4, 5, 7, 9, 11)
+
+## The quality strings of an Interval, diminished to augmented.
+_qualities = ('ooooo', 'oooo', 'ooo', 'oo', 'o', 'm', 'P', 'M', '+', '++', '+++', '++++', '+++++')
+
+
+## Returns a dictionary that maps the integer value of every Pnum (see
+# Pitch.pnums) to its transposition by an interval, as a (letter,
+# accidental, octave shift) tuple, or to None if the transposed pnum would
+# need more than two accidentals. The table is built once per interval and
+# transposes a Pitch with a single lookup, see transpose_pitch().
+# @param interval  An Interval.
+#
+# The function should raise a TypeError if interval is not an Interval.
+def transposition_table(interval):
+    if not isinstance(interval, Interval):
+        raise TypeError("interval is not an Interval")
+    return _transposition_table((interval.span + interval.xoct * 7) * interval.sign, interval.semitones())
+
+
+## Private function that builds the transposition table of an interval of
+# steps diatonic steps and semitones semitones, see transposition_table().
+@lru_cache(maxsize=None)
+def _transposition_table(steps, semitones):
+    table = {}
+    for letter in range(7):
+        shift, new_letter = divmod(letter + steps, 7)
+        for accidental in range(5):
+            alteration = _letter_pcs[letter] + accidental - 2 + semitones - shift * 12 - _letter_pcs[new_letter]
+            if -2 <= alteration <= 2:
+                table[(letter << 4) + accidental] = (new_letter, alteration + 2, shift)
+            else:
+                table[(letter << 4) + accidental] = None
+    return table
+
+
+## Returns the number of fifths (positive) or fourths (negative) that an
+# interval moves a key signature, e.g. 1 for P5, -3 for m3 and 7 for A1.
+# A fifth is 4 diatonic steps and 7 semitones, so an interval of steps
+# steps and semitones semitones moves 7 * semitones - 12 * steps fifths.
+# @param interval  An Interval.
+def fifths(interval):
+    return interval.semitones() * 7 - (interval.span + interval.xoct * 7) * interval.sign * 12
+
+
+## Transposes a Pitch by an interval using a transposition table.
+# @param pitch  The Pitch to transpose. Empty pitches are returned as is.
+# @param table  A transposition table, see transposition_table().
+#
+# The function should raise a ValueError if the transposed pitch needs
+# more than two accidentals or is out of range.
+def transpose_pitch(pitch, table):
+    if pitch.is_empty():
+        return pitch
+    pos = pitch.pos()
+    entry = table[pos & 255]
+    if entry is None:
+        raise ValueError(f"Transposed {pitch.string()} needs more than two accidentals")
+    return Pitch([entry[0], entry[1], (pos >> 8) + entry[2]])
+
+
+## Transposes a Key by an interval, keeping its mode.
+# @param key  The Key to transpose.
+# @param interval  An Interval.
+#
+# The function should raise a ValueError if the transposed key needs more
+# than 7 sharps or flats.
+def transpose_key(key, interval):
+    signum = key.signum + fifths(interval)
+    if abs(signum) > 7:
+        raise ValueError("Transposed key needs more than 7 sharps or flats")
+    return Key(signum, key.mode)
+
+
+## Returns a transposed copy of a score. The transposition table of the
+# interval is built once and every Note and Chord pitch and every Key (in
+# the bars and in the 'main_key' metadata) is rewritten in one pass over
+# the score. The copy shares everything the transposition leaves
+# unchanged with the original: durations, onsets, marks, clefs, meters
+# and barlines.
+# @param score  The Score to transpose.
+# @param interval  An Interval to transpose by, ascending or descending.
+# @returns A new Score.
+#
+# The function should raise a TypeError if score is not a Score or interval
+# is not an Interval, and a ValueError if a pitch or key cannot be
+# transposed, see transpose_pitch() and transpose_key().
+def transpose_score(score, interval):
+    if not isinstance(score, Score):
+        raise TypeError("score is not a Score")
+    table = transposition_table(interval)
+    pitches, keys = {}, {}
+
+    def pitch_of(pitch):
+        new = pitches.get(pitch.pos()) if not pitch.is_empty() else pitch
+        if new is None:
+            new = pitches[pitch.pos()] = transpose_pitch(pitch, table)
+        return new
+
+    def key_of(key):
+        if not isinstance(key, Key):
+            return key
+        new = keys.get((key.signum, key.mode))
+        if new is None:
+            new = keys[(key.signum, key.mode)] = transpose_key(key, interval)
+        return new
+
+    def note_of(note, voice):
+        new = copy.copy(note)
+        new.pitch = pitch_of(note.pitch)
+        new.voice = voice
+        return new
+
+    new_score = copy.copy(score)
+    new_score.metadata = dict(score.metadata)
+    if 'main_key' in new_score.metadata:
+        new_score.metadata['main_key'] = key_of(new_score.metadata['main_key'])
+    new_score.parts = []
+    for part in score.parts:
+        new_part = copy.copy(part)
+        new_part.score = new_score
+        new_part.staffs = []
+        new_score.parts.append(new_part)
+        for staff in part.staffs:
+            new_staff = copy.copy(staff)
+            new_staff.part = new_part
+            new_staff.bars = []
+            new_part.staffs.append(new_staff)
+            for bar in staff.bars:
+                new_bar = copy.copy(bar)
+                new_bar.staff = new_staff
+                new_bar.key = key_of(bar.key)
+                new_bar.voices = []
+                new_staff.bars.append(new_bar)
+                for voice in bar.voices:
+                    new_voice = copy.copy(voice)
+                    new_voice.bar = new_bar
+                    new_voice.notes = []
+                    new_bar.voices.append(new_voice)
+                    for note in voice.notes:
+                        if isinstance(note, Note):
+                            note = note_of(note, new_voice)
+                        elif isinstance(note, Chord):
+                            chord = copy.copy(note)
+                            chord.notes = [note_of(n, new_voice) for n in note.notes]
+                            chord.voice = new_voice
+                            note = chord
+                        else:
+                            note = copy.copy(note)
+                            note.voice = new_voice
+                        new_voice.notes.append(note)
+    new_score.index = ScoreIndex(new_score)
+    return new_score
+
+
+## Returns the transpositions of a score into all twelve keys. Each
+# chromatic distance from lowest to lowest + 11 semitones is spelled by the
+# simple interval that gives the score's first key the fewest sharps or
+# flats (and, for equal signatures, moves it the fewest fifths), skipping
+# spellings whose pitches would need more than two accidentals. All the
+# transpositions share the score's rhythm objects, see transpose_score().
+# @param score  The Score to transpose.
+# @param lowest  The semitones of the first transposition. Defaults to -5,
+# so that the scores lie within a tritone of the original.
+# @returns A list of twelve (Interval, Score) tuples, with semitones
+# lowest to lowest + 11.
+#
+# The function should raise a ValueError if a distance has no spelling
+# that fits the score.
+def transpositions(score, lowest=-5):
+    key = _first_key(score)
+    signum = 0 if key is None else key.signum
+    results = []
+    for semitones in range(lowest, lowest + 12):
+        candidates = sorted(_simple_intervals(semitones),
+                            key=lambda i: (abs(signum + fifths(i)), abs(fifths(i))))
+        for interval in candidates:
+            try:
+                results.append((interval, transpose_score(score, interval)))
+            except ValueError:
+                continue
+            break
+        else:
+            raise ValueError(f"Score cannot be transposed by {semitones} semitones")
+    return results
+
+
+## Private function that returns the key of the first bar that has one, or
+# the score's 'main_key', or None.
+def _first_key(score):
+    for part in score.parts:
+        for staff in part.staffs:
+            for bar in staff.bars:
+                if isinstance(bar.key, Key):
+                    return bar.key
+    key = score.metadata.get('main_key')
+    return key if isinstance(key, Key) else None
+
+
+## Private function that returns the simple Intervals spanning a number of
+# semitones, descending if semitones is negative. Candidates are built from
+# interval strings, e.g. '-M2', with every quality and span 1-8.
+@lru_cache(maxsize=None)
+def _simple_intervals(semitones):
+    if semitones == 0:
+        return (Interval('P1'),)
+    sign = '' if semitones > 0 else '-'
+    intervals = []
+    for span in range(1, 9):
+        for quality in _qualities:
+            try:
+                interval = Interval(f'{sign}{quality}{span}')
+            except ValueError:
+                continue
+            if interval.semitones() == semitones:
+                intervals.append(interval)
+    return tuple(intervals)
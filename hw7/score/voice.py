@@ -2,6 +2,7 @@
 
 from .ratio import Ratio
 from .durational import Durational
+from .onsets import Onsets
 
 
 ## A class that represents a musical Voice in a Bar. One voice holds a
@@ -18,6 +19,8 @@ class Voice:
         self.id = voiceid
         self.notes = []
         self.bar = None
+        self._onsets = None
+        self._pvid = None
 
     ## Returns a string showing the voices's unique id and the
     # hex id of the instance.
@@ -37,23 +40,61 @@ class Voice:
         return iter(self.notes)
 
     ## Appends a Note, Chord or Rest to the voice's note list and assigns
-    # itself to that object's voice attribute.
+    # itself to that object's voice attribute. If the voice belongs to a
+    # score the note is added to the score's index, see ScoreIndex.
     # @param note The note, chord, or rest to append to the note list.
     #
     # The method should raise a TypeError if object supplied is not a Durational.
     def add_note(self, note):
         if isinstance(note, Durational):
             self.notes.append(note)
+            note.voice = self
+            self._onsets = None
+            index = self._index()
+            if index is not None:
+                index.add_note(note, self)
         else:
             raise TypeError("object supplied is not an instance of Durational")
 
     ## Returns a beat Ratio representing the total duration of the notes
     # in the voice.
     def dur(self):
-        return sum([note.dur for note in self.notes])
+        return self.onsets().dur()
+
+    ## Returns the Onsets of the voice's notes, see: Onsets. The result is
+    # built once and cached until add_note() or invalidate_onsets() is
+    # called.
+    def onsets(self):
+        if self._onsets is None:
+            self._onsets = Onsets([note.dur for note in self.notes])
+        return self._onsets
+
+    ## Discards the cached Onsets of the voice. Call this after replacing,
+    # removing or reordering notes in self.notes directly, or changing the
+    # dur of a note, so that dur(), onsets() and note_at() see the change.
+    def invalidate_onsets(self):
+        self._onsets = None
+
+    ## Returns the note, chord or rest sounding at a beat offset from the
+    # start of the voice, or None if no note sounds at that offset.
+    # @param offset  A Ratio or int beat offset.
+    def note_at(self, offset):
+        index = self.onsets().index_at(offset)
+        return None if index is None else self.notes[index]
 
     ## Returns the 'part and voice' identifier of the voice, a string
     # concatenation of the part's id with the voice's id: PARTID.VOICEID
     # Example: 'P1.1'
+    #
+    # The identifier is built once, the first time it is requested after the
+    # voice has been added to a part. Voices that are not in a part yet
+    # raise an AttributeError, as Durational.get_pvid() always has.
     def get_pvid(self):
-        return f'P1.{self.id}'
+        if self._pvid is None:
+            self._pvid = f'{self.bar.staff.part.id}.{self.id}'
+        return self._pvid
+
+    ## Private method that returns the ScoreIndex of the voice's score, or
+    # None if the voice is not in a score.
+    def _index(self):
+        return None if self.bar is None else self.bar._index()
@@ -119,6 +119,18 @@ def to_direction(interval):
     else:
         return interval.sign
 
+## Returns the number of diatonic steps an interval moves, ignoring its
+# direction, e.g. a M10 moves 9 steps.
+def to_steps(interval):
+    return interval.span + interval.xoct * 7
+
+## Returns the span index (0-7) of a leap of a number of diatonic steps, as
+# Interval does, e.g. 10 steps (an 11th) returns 3 (a 4th).
+def to_span(steps):
+    if steps > 0 and steps % 7 == 0:
+        return 7
+    return steps % 7
+
 # Here is an example of a rule. You can define as many rules as you want.
 # The purpose of running a rule is to perform some analytical check(s) and
 # then update the self.analysis.results dictionary with its findings.
@@ -329,36 +341,35 @@ class LeapRecovery(Rule):
         super().__init__(analysis, "Leap of 4th must reverse direction, leap of 5th or more must reverse by step.")
 
     def apply(self):
-        total_leap = Interval('P1')
-        current_direction = to_direction(total_leap)
+        # the leap is accumulated as a number of diatonic steps
+        total_leap = 0
+        current_direction = 0
         illegal_intervals = []
 
         for i, interval in enumerate(self.analysis.intervals):
-            if total_leap.is_fourth():
+            span = to_span(total_leap)
+            if span == 3:
                 if to_direction(interval) != -1 * current_direction:
                     illegal_intervals.append(i + 1)
-            elif total_leap.span >= 4:
+            elif span >= 4:
                 if not interval.is_second():
                     illegal_intervals.append(-i - 1)
                 elif to_direction(interval) != -1 * current_direction:
                     illegal_intervals.append(-i - 1)
 
             if interval.is_unison() or interval.is_second():
-                total_leap = Interval('P1')
+                total_leap = 0
             elif to_direction(interval) == -1 * current_direction:
-                new_interval = Interval(interval.string())
-                new_interval.sign = 1
-                total_leap = new_interval
+                total_leap = to_steps(interval)
             else:
-                new_interval = Interval(interval.string())
-                new_interval.sign = 1
-                total_leap = total_leap.add(new_interval)
+                total_leap += to_steps(interval)
 
             current_direction = to_direction(interval)
 
-        if total_leap.is_fourth():
+        span = to_span(total_leap)
+        if span == 3:
             illegal_intervals.append(len(self.analysis.intervals) + 1)
-        elif total_leap.span >= 4:
+        elif span >= 4:
             illegal_intervals.append(-len(self.analysis.intervals) - 1)
 
         if not illegal_intervals:
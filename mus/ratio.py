@@ -7,12 +7,31 @@
 #  Ratios are compared and combined using the standard math operators.
 
 import math
+import threading
 from decimal import Decimal
-from collections import namedtuple
+from collections import namedtuple, OrderedDict
 
 RatioBase = namedtuple('RatioBase', 'num den')
 
+## The intern table statistics returned by Ratio.cache_info(): the number of
+#  lookups that found an existing instance (hits), the number that had to
+#  create one (misses), the number of instances dropped to keep the table
+#  within its bound (evictions), and the table's current and maximum size.
+RatioCacheInfo = namedtuple('RatioCacheInfo', 'hits misses evictions size maxsize')
+
 class Ratio(RatioBase):
+    __slots__ = ()
+
+    ## The intern (flyweight) table. Every Ratio is immutable, so all ratios
+    #  with the same reduced (num, den) pair can share a single instance. The
+    #  table is bounded and evicts its least recently used entries, and all
+    #  access to it is serialized by _intern_lock.
+    _interned = OrderedDict()
+    _intern_lock = threading.Lock()
+    _intern_maxsize = 4096
+    _intern_hits = 0
+    _intern_misses = 0
+    _intern_evictions = 0
 
     ## Creates a Ratio from integers, a floating point number, or a string name.
     #  * Ratio(int, int) - creates a ratio from an integer numerator and denominator.
@@ -41,7 +60,7 @@ class Ratio(RatioBase):
 
             if isinstance(d, int):
                 den = d
-            elif den == None:
+            elif d == None:
                 den = 1
             else:
                 raise TypeError("Denominator is not an integer")
@@ -57,46 +76,7 @@ class Ratio(RatioBase):
                 raise TypeError("Denominator should be None when numerator is float")
             num, den = Decimal(str(n)).as_integer_ratio()
         elif isinstance(n, str):
-            length = len(n)
-            num = ''
-            den = ''
-            i = 0
-            has_slash = False
-
-            if length > 0 and n[i] == '-':
-                num += '-'
-                i += 1
-
-            while i < length:
-                if n[i] >= '0' and n[i] <= '9':
-                    num += n[i]
-                    i += 1
-                elif n[i] == '/':
-                    has_slash = True
-                    i += 1
-                    break
-                else:
-                    raise TypeError("Numerator is not an integer")
-
-            if has_slash:
-                if length > 0 and n[i] == '-':
-                    num += '-'
-                    i += 1
-
-                while i < length:
-                    if n[i] >= '0' and n[i] <= '9':
-                        den += n[i]
-                        i += 1
-                    else:
-                        raise TypeError("Denominator is not an integer")
-
-                try:
-                    num = int(num)
-                    den = int(den)
-                except:
-                    raise ValueError("Denominator cannot be empty")
-            else:
-                raise ValueError("Denominator cannot be empty")
+            num, den = cls._parse(n)
 
         if den == 0:
             raise ZeroDivisionError("Denominator is 0")
@@ -108,11 +88,156 @@ class Ratio(RatioBase):
             num = -abs(num)
             den = abs(den)
         gcd = math.gcd(num, den)
-        num, den = num // gcd, den // gcd
 
-        self = super(Ratio, cls).__new__(cls, num, den)
+        return cls._intern(num // gcd, den // gcd)
 
-        return self
+    ## Returns the shared Ratio for an already reduced numerator and
+    #  denominator, skipping all of the argument parsing and validation
+    #  done by the constructor.
+    #  @param num  An integer numerator.
+    #  @param den  A positive integer denominator with gcd(num, den) == 1.
+    #  @returns The interned Ratio num/den.
+    #
+    #  The caller is responsible for passing a reduced pair, use Ratio(num, den)
+    #  for anything else.
+    @classmethod
+    def from_reduced(cls, num, den):
+        return cls._intern(num, den)
+
+    ## Private method that splits a string 'num/den' into its integer
+    #  numerator and denominator. Both parts may start with a '-' sign and
+    #  must otherwise contain only the digits 0-9.
+    #  @returns An unreduced (num, den) pair of ints.
+    #
+    #  The method should raise a TypeError if either part contains any other
+    #  character and a ValueError if the string has no '/' or if either part
+    #  holds no digits.
+    @staticmethod
+    def _parse(string):
+        num, slash, den = string.partition('/')
+        digits = num[1:] if num[:1] == '-' else num
+        if digits and not (digits.isascii() and digits.isdigit()):
+            raise TypeError("Numerator is not an integer")
+        if not slash:
+            raise ValueError("Denominator cannot be empty")
+        den_digits = den[1:] if den[:1] == '-' else den
+        if den_digits and not (den_digits.isascii() and den_digits.isdigit()):
+            raise TypeError("Denominator is not an integer")
+        if not digits or not den_digits:
+            raise ValueError("Denominator cannot be empty")
+        return int(num), int(den)
+
+    ## Creates a list of Ratios from an iterable of 'num/den' strings.
+    #  @param strings  An iterable of strings, see Ratio(string).
+    #  @returns A list of Ratios in the same order as strings.
+    #
+    #  Repeated strings are only parsed once. Every entry is checked before
+    #  reporting errors: the method should raise a ValueError listing the
+    #  index and value of every entry that is not a valid ratio string.
+    @classmethod
+    def parse_many(cls, strings):
+        parse, intern, gcd = cls._parse, cls._intern, math.gcd
+        cache, ratios, errors = {}, [], []
+        for i, string in enumerate(strings):
+            ratio = cache.get(string) if type(string) is str else None
+            if ratio is None:
+                try:
+                    num, den = parse(string)
+                    if den == 0:
+                        raise ZeroDivisionError("Denominator is 0")
+                except (TypeError, ValueError, AttributeError, ZeroDivisionError):
+                    errors.append(f'{i}: {string!r}')
+                    continue
+                if den < 0:
+                    num, den = -num, -den
+                g = gcd(num, den)
+                ratio = cache[string] = intern(num // g, den // g)
+            ratios.append(ratio)
+        if errors:
+            raise ValueError(f"Invalid ratios at index {', '.join(errors)}")
+        return ratios
+
+    ## Creates a list of note durations from MusicXML <duration> values.
+    #  MusicXML measures durations in divisions of a quarter note, so a
+    #  duration d is the ratio d / (4 * divisions) of a whole note.
+    #  @param durations  An iterable of non-negative integer durations.
+    #  @param divisions  The positive integer <divisions> count.
+    #  @returns A list of Ratios in the same order as durations.
+    #
+    #  The method should raise a ValueError if divisions is not a positive
+    #  integer, and a ValueError listing the index and value of every
+    #  duration that is not a non-negative integer.
+    @classmethod
+    def from_divisions(cls, durations, divisions):
+        if not isinstance(divisions, int) or divisions <= 0:
+            raise ValueError("Divisions is not a positive integer")
+
+        whole = divisions * 4
+        cache, ratios, errors = {}, [], []
+        for i, duration in enumerate(durations):
+            ratio = cache.get(duration) if type(duration) is int else None
+            if ratio is None:
+                if not isinstance(duration, int) or isinstance(duration, bool) or duration < 0:
+                    errors.append(f'{i}: {duration!r}')
+                    continue
+                gcd = math.gcd(duration, whole)
+                ratio = cache[duration] = cls._intern(duration // gcd, whole // gcd)
+            ratios.append(ratio)
+        if errors:
+            raise ValueError(f"Invalid durations at index {', '.join(errors)}")
+        return ratios
+
+    ## Private method that returns the interned instance for a reduced
+    #  (num, den) pair, creating it (and evicting the least recently used
+    #  entry if the table is full) when it does not exist yet.
+    @classmethod
+    def _intern(cls, num, den):
+        key = (num, den)
+        with cls._intern_lock:
+            table = cls._interned
+            self = table.get(key)
+            if self is not None:
+                table.move_to_end(key)
+                cls._intern_hits += 1
+                return self
+            cls._intern_misses += 1
+            self = tuple.__new__(cls, key)
+            table[key] = self
+            if len(table) > cls._intern_maxsize:
+                table.popitem(last=False)
+                cls._intern_evictions += 1
+            return self
+
+    ## Returns a RatioCacheInfo with the intern table's hit, miss and
+    #  eviction counters and its current and maximum size.
+    @classmethod
+    def cache_info(cls):
+        with cls._intern_lock:
+            return RatioCacheInfo(cls._intern_hits, cls._intern_misses, cls._intern_evictions,
+                                  len(cls._interned), cls._intern_maxsize)
+
+    ## Empties the intern table and resets its counters.
+    @classmethod
+    def cache_clear(cls):
+        with cls._intern_lock:
+            cls._interned.clear()
+            cls._intern_hits = cls._intern_misses = cls._intern_evictions = 0
+
+    ## Sets the maximum number of interned ratios, evicting the least
+    #  recently used entries if the table is currently larger.
+    #  @param maxsize  A positive integer bound for the table.
+    #
+    #  The method should raise a ValueError if maxsize is not a positive integer.
+    @classmethod
+    def set_cache_size(cls, maxsize):
+        if not isinstance(maxsize, int) or maxsize <= 0:
+            raise ValueError("Maxsize is not a positive integer")
+
+        with cls._intern_lock:
+            cls._intern_maxsize = maxsize
+            while len(cls._interned) > maxsize:
+                cls._interned.popitem(last=False)
+                cls._intern_evictions += 1
 
     ## Returns a string showing the ratio's fraction and the hex
     #  hex value of the ratio's memory address.
@@ -129,19 +254,24 @@ class Ratio(RatioBase):
     # @returns A Ratio if other is a Ratio or an int, otherwise a float.
     #
     # A TypeError should be raised if other is not a Ratio, int or float.
+    #
+    # Both operands are already reduced so their factors are cancelled
+    # crosswise before multiplying, which leaves the product reduced
+    # and lets it skip the constructor's validation. See: from_reduced().
     def __mul__(self, other):
-        if isinstance(other, float):
-            return self.num / self.den * other
-        elif isinstance(other, Ratio):
-            num, den = self.num * other.num, self.den * other.den
+        if isinstance(other, Ratio):
+            g1 = math.gcd(self.num, other.den)
+            g2 = math.gcd(other.num, self.den)
+            return Ratio._intern((self.num // g1) * (other.num // g2),
+                                 (self.den // g2) * (other.den // g1))
         elif isinstance(other, int):
-            num, den = self.num * other, self.den
+            gcd = math.gcd(other, self.den)
+            return Ratio._intern(self.num * (other // gcd), self.den // gcd)
+        elif isinstance(other, float):
+            return self.num / self.den * other
         else:
             raise TypeError("Other is not a Ratio, int or float")
 
-        gcd = math.gcd(num, den)    
-        return Ratio(num // gcd, den // gcd)
-
     ## Implements right side multiplication by calling __mul__
     #__rmul__ = __mul__
     def __rmul__(self, other):
@@ -153,9 +283,9 @@ class Ratio(RatioBase):
         if self.num == 0:
             raise ZeroDivisionError("Numerator is 0")
         elif self.num > 0:
-            return Ratio(self.den, self.num)
+            return Ratio._intern(self.den, self.num)
         else:
-            return Ratio(-self.den, -self.num)
+            return Ratio._intern(-self.den, -self.num)
     
     ## Implements Ratio/Ratio, Ratio/int and Ratio/float.
     # @param other A Ratio, int or float.
@@ -164,15 +294,16 @@ class Ratio(RatioBase):
     # A TypeError should be raised if other is not a Ratio, int or float.
     def __truediv__(self, other):
         if isinstance(other, Ratio):
-            return self * other.__invert__()
+            if other.num == 0:
+                raise ZeroDivisionError("Numerator is 0")
+            g1 = math.gcd(self.num, other.num)
+            g2 = math.gcd(self.den, other.den)
+            num, den = (self.num // g1) * (other.den // g2), (self.den // g2) * (other.num // g1)
         elif isinstance(other, int):
             if other == 0:
                 raise ZeroDivisionError("Other is 0")
-            else:
-                num, den = self.num, self.den * other
-
-            gcd = math.gcd(num, den)
-            return Ratio(num // gcd, den // gcd)
+            gcd = math.gcd(self.num, other)
+            num, den = self.num // gcd, self.den * (other // gcd)
         elif isinstance(other, float):
             if other == 0:
                 raise ZeroDivisionError("Other is 0")
@@ -181,6 +312,10 @@ class Ratio(RatioBase):
         else:
             raise TypeError("Other is not a Ratio, int or float")
 
+        if den < 0:
+            return Ratio._intern(-num, -den)
+        return Ratio._intern(num, den)
+
     ## Implements int / Ratio or float / Ratio (right side division).
     #  @returns A new Ratio.
     def __rtruediv__(self, other):
@@ -202,17 +337,33 @@ class Ratio(RatioBase):
     #  add two ratios their denominators must be converted to the
     #  least common multiple of the current denominator. See: lcm().
     #  @returns A new Ratio.
+    #
+    #  Both operands are already reduced, so the sum is computed over the
+    #  lcm and only the common factor of the denominators has to be
+    #  checked again, see _add().
     def __add__(self, other):
         if isinstance(other, Ratio):
-            lcm = Ratio.lcm(self.den, other.den)
-            return Ratio(self.num * lcm // self.den + other.num * lcm // other.den, lcm)
+            return Ratio._add(self.num, self.den, other.num, other.den)
         elif isinstance(other, int):
-            return Ratio(self.num + other * self.den, self.den)
+            return Ratio._intern(self.num + other * self.den, self.den)
         elif isinstance(other, float):
             return self.num / self.den + other
         else:
             raise TypeError("Other is not a Ratio, int or float")
 
+    ## Private static method that returns the reduced sum of the reduced
+    #  ratios n1/d1 and n2/d2. If the denominators share no factor the
+    #  sum is already reduced, otherwise only gcd(d1, d2) can divide
+    #  into the new numerator.
+    @staticmethod
+    def _add(n1, d1, n2, d2):
+        gcd = math.gcd(d1, d2)
+        if gcd == 1:
+            return Ratio._intern(n1 * d2 + n2 * d1, d1 * d2)
+        num = n1 * (d2 // gcd) + n2 * (d1 // gcd)
+        gcd2 = math.gcd(num, gcd)
+        return Ratio._intern(num // gcd2, (d1 // gcd) * (d2 // gcd2))
+
     ## Implements right side addition by calling __add__.
     #  @returns A new Ratio.
     #__radd__ = __add__
@@ -222,18 +373,30 @@ class Ratio(RatioBase):
     ## Implements -ratio (negation).
     #  @returns A new Ratio.
     def __neg__(self):
-        return Ratio(self.num * -1, self.den)
+        return Ratio._intern(-self.num, self.den)
 
     ## Implements ratio - ratio, ratio - int and ratio - float.
     #  @returns A new Ratio.
     def __sub__(self, other):
-        return self + -other
+        if isinstance(other, Ratio):
+            return Ratio._add(self.num, self.den, -other.num, other.den)
+        elif isinstance(other, int):
+            return Ratio._intern(self.num - other * self.den, self.den)
+        elif isinstance(other, float):
+            return self.num / self.den - other
+        else:
+            raise TypeError("Other is not a Ratio, int or float")
 
     ## Implements int - ratio and float-ratio (right side subtraction).
     #  @returns A new Ratio.
     def __rsub__(self, other):
         # other is the LEFT side non-ratio operand.
-        return -self + other
+        if isinstance(other, int):
+            return Ratio._intern(other * self.den - self.num, self.den)
+        elif isinstance(other, float):
+            return other - self.num / self.den
+        else:
+            raise TypeError("Other is not a Ratio, int or float")
 
     ## Implements ratio % ratio.
     #  @returns A new Ratio.
@@ -267,10 +430,7 @@ class Ratio(RatioBase):
                 to_return = to_return.__invert__()
                 other = -other
 
-            to_return.num = to_return.num ** other
-            to_return.den = to_return.den ** other
-
-            return to_return
+            return Ratio._intern(to_return.num ** other, to_return.den ** other)
         elif isinstance(other, (Ratio, float)):
             return (1.0 * self) ** (1.0 * other)
         else:
@@ -288,29 +448,38 @@ class Ratio(RatioBase):
             raise TypeError("Other is not a int or float")
 
     ## Implements Ratio < Ratio, Ratio < int, Ratio < float. See: compare().
+    #  Ratios and ints are compared by cross-multiplication, no intermediate
+    #  Ratio is created. Denominators are always positive.
     def __lt__(self, other):
-        if isinstance(other, (Ratio, int)):
-            return (self - other).num < 0
+        if isinstance(other, Ratio):
+            return self.num * other.den < other.num * self.den
+        elif isinstance(other, int):
+            return self.num < other * self.den
         elif isinstance(other, float):
-            return self - other < 0
+            return self.num / self.den < other
         else:
             raise TypeError("Other is not a Ratio, int or float")
 
     ## Implements Ratio <= Ratio, Ratio <= int, Ratio <= float. See: compare().
     def __le__(self, other):
-        if isinstance(other, (Ratio, int)):
-            return (self - other).num <= 0
+        if isinstance(other, Ratio):
+            return self.num * other.den <= other.num * self.den
+        elif isinstance(other, int):
+            return self.num <= other * self.den
         elif isinstance(other, float):
-            return self - other <= 0
+            return self.num / self.den <= other
         else:
             raise TypeError("Other is not a Ratio, int or float")
 
     ## Implements Ratio <= Ratio, Ratio <= int, Ratio <= float. See: compare().
+    #  Reduced ratios are equal only if their numerators and denominators are.
     def __eq__(self, other):
-        if isinstance(other, (Ratio, int)):
-            return (self - other).num == 0
+        if isinstance(other, Ratio):
+            return self.num == other.num and self.den == other.den
+        elif isinstance(other, int):
+            return self.den == 1 and self.num == other
         elif isinstance(other, float):
-            return self - other == 0
+            return self.num / self.den == other
         else:
             return False
 
@@ -320,25 +489,29 @@ class Ratio(RatioBase):
 
     ## Implements Ratio >= Ratio, Ratio >= int, Ratio >= float. See: compare().
     def __ge__(self, other):
-        if isinstance(other, (Ratio, int)):
-            return (self - other).num >= 0
+        if isinstance(other, Ratio):
+            return self.num * other.den >= other.num * self.den
+        elif isinstance(other, int):
+            return self.num >= other * self.den
         elif isinstance(other, float):
-            return self - other >= 0
+            return self.num / self.den >= other
         else:
             raise TypeError("Other is not a Ratio, int or float")
 
     ## Implements Ratio>Ratio, Ratio > int, Ratio > float. See: compare().
     def __gt__(self, other):
-        if isinstance(other, (Ratio, int)):
-            return (self - other).num > 0
+        if isinstance(other, Ratio):
+            return self.num * other.den > other.num * self.den
+        elif isinstance(other, int):
+            return self.num > other * self.den
         elif isinstance(other, float):
-            return self - other > 0
+            return self.num / self.den > other
         else:
             raise TypeError("Other is not a Ratio, int or float")
 
-    ## Returns a single integer hash value for the ratio: (num<<16 + den)
+    ## Returns a single integer hash value for the ratio: (num<<16) + den
     def __hash__(self):
-        return self.num << 16 + self.den
+        return (self.num << 16) + self.den
 
     ## Helper method implements ratio comparison. Returns 0 if the ratios are equal,
     # a negative value if self is less than other and a positive value if self is
@@ -0,0 +1,321 @@
+###############################################################################
+## @file
+#  A columnar array of exact fractional numbers.
+#  A RatioArray stores the numerators and denominators of many ratios in two
+#  parallel int64 columns (see Python's array module) and implements the
+#  Ratio operators element-wise over whole columns, so durations and onsets
+#  for thousands of notes can be combined without creating a Ratio object
+#  per value. If a result does not fit in 64 bits the affected column falls
+#  back to a list of Python ints so arithmetic always stays exact.
+
+import math
+from array import array
+
+from .ratio import Ratio
+
+
+## Private function that returns an int64 array holding values, or a list of
+#  Python ints if any value overflows 64 bits.
+def _column(values):
+    values = list(values)
+    try:
+        return array('q', values)
+    except OverflowError:
+        return list(values)
+
+
+## Private function that reduces each num/den pair to its simplest form with
+#  a positive denominator and returns the two new columns.
+#
+#  The function should raise a ZeroDivisionError if any denominator is 0.
+def _reduced(nums, dens):
+    new_nums, new_dens = [], []
+    for num, den in zip(nums, dens):
+        if den == 0:
+            raise ZeroDivisionError("Denominator is 0")
+        if den < 0:
+            num, den = -num, -den
+        gcd = math.gcd(num, den)
+        new_nums.append(num // gcd)
+        new_dens.append(den // gcd)
+    return _column(new_nums), _column(new_dens)
+
+
+## A class that implements an array of fractional numbers.
+#
+#  A RatioArray holds two attributes of equal length:
+#  * nums  The numerators, an int64 array (or a list of ints on overflow).
+#  * dens  The positive denominators, an int64 array (or a list of ints).
+#
+#  Every value is kept in its reduced form, just like a Ratio. Arithmetic
+#  and comparison operators work element-wise against another RatioArray
+#  of the same length or broadcast a single Ratio or int to every element.
+class RatioArray:
+
+    ## Creates a RatioArray from an iterable of Ratios or ints.
+    #  @param ratios  The values to store, defaults to an empty array.
+    #
+    #  The constructor should raise a TypeError if a value is not a Ratio
+    #  or an int.
+    def __init__(self, ratios=()):
+        nums, dens = [], []
+        for ratio in ratios:
+            if isinstance(ratio, Ratio):
+                nums.append(ratio.num)
+                dens.append(ratio.den)
+            elif isinstance(ratio, int):
+                nums.append(ratio)
+                dens.append(1)
+            else:
+                raise TypeError(f"Invalid ratio: {ratio}.")
+        self.nums = _column(nums)
+        self.dens = _column(dens)
+
+    ## Creates a RatioArray from parallel numerator and denominator
+    #  columns, reducing every pair.
+    #  @param nums  An iterable of integer numerators.
+    #  @param dens  An iterable of non-zero integer denominators.
+    #  @returns A new RatioArray.
+    #
+    #  The method should raise a ValueError if the columns have different
+    #  lengths and a ZeroDivisionError if a denominator is 0.
+    @classmethod
+    def from_columns(cls, nums, dens):
+        nums, dens = list(nums), list(dens)
+        if len(nums) != len(dens):
+            raise ValueError("Columns have different lengths")
+        return cls._make(*_reduced(nums, dens))
+
+    ## Private method that creates a RatioArray directly from two already
+    #  reduced columns.
+    @classmethod
+    def _make(cls, nums, dens):
+        self = cls.__new__(cls)
+        self.nums = nums
+        self.dens = dens
+        return self
+
+    ## Returns a string showing the array's values and the hex value of
+    #  its memory address.
+    #  Example: <RatioArray: [1/4, 3/8] 0x10610d2b0>
+    def __str__(self):
+        return f'<RatioArray: [{", ".join(self.strings())}] {hex(id(self))}>'
+
+    ## Returns a string expression that will evaluate to this array.
+    def __repr__(self):
+        return f'RatioArray([{", ".join(repr(r) for r in self)}])'
+
+    ## Returns the number of values in the array.
+    def __len__(self):
+        return len(self.nums)
+
+    ## Implements RatioArray iteration by returning an iterator of Ratios.
+    def __iter__(self):
+        return map(Ratio.from_reduced, self.nums, self.dens)
+
+    ## Returns the Ratio at an integer index, or a new RatioArray for a slice.
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return RatioArray._make(self.nums[index], self.dens[index])
+        return Ratio.from_reduced(self.nums[index], self.dens[index])
+
+    ## Returns a list of the array's values as Ratios.
+    def to_ratios(self):
+        return list(self)
+
+    ## Returns a list of the string names 'num/den' of the array's values.
+    def strings(self):
+        return [f'{num}/{den}' for num, den in zip(self.nums, self.dens)]
+
+    ## Private method that returns the numerator and denominator columns of
+    #  other as iterables matching the length of this array. A Ratio or int
+    #  is repeated for every element.
+    #
+    #  The method should raise a ValueError if other is a RatioArray of a
+    #  different length, and a TypeError if other is not a RatioArray,
+    #  Ratio or int.
+    def _operands(self, other):
+        if isinstance(other, RatioArray):
+            if len(other) != len(self):
+                raise ValueError("RatioArrays have different lengths")
+            return other.nums, other.dens
+        elif isinstance(other, Ratio):
+            return [other.num] * len(self), [other.den] * len(self)
+        elif isinstance(other, int):
+            return [other] * len(self), [1] * len(self)
+        else:
+            raise TypeError("Other is not a RatioArray, Ratio or int")
+
+    ## Implements element-wise RatioArray + RatioArray, RatioArray + Ratio
+    #  and RatioArray + int.
+    #  @returns A new RatioArray.
+    def __add__(self, other):
+        nums, dens = self._operands(other)
+        return RatioArray._make(*_reduced([n1 * d2 + n2 * d1 for n1, d1, n2, d2 in zip(self.nums, self.dens, nums, dens)],
+                                          [d1 * d2 for d1, d2 in zip(self.dens, dens)]))
+
+    ## Implements right side addition by calling __add__.
+    def __radd__(self, other):
+        return self + other
+
+    ## Implements element-wise -RatioArray (negation).
+    #  @returns A new RatioArray.
+    def __neg__(self):
+        return RatioArray._make(_column([-num for num in self.nums]), self.dens)
+
+    ## Implements element-wise subtraction, see __add__().
+    #  @returns A new RatioArray.
+    def __sub__(self, other):
+        nums, dens = self._operands(other)
+        return RatioArray._make(*_reduced([n1 * d2 - n2 * d1 for n1, d1, n2, d2 in zip(self.nums, self.dens, nums, dens)],
+                                          [d1 * d2 for d1, d2 in zip(self.dens, dens)]))
+
+    ## Implements int - RatioArray (right side subtraction).
+    def __rsub__(self, other):
+        return -self + other
+
+    ## Implements element-wise multiplication, see __add__().
+    #  @returns A new RatioArray.
+    def __mul__(self, other):
+        nums, dens = self._operands(other)
+        return RatioArray._make(*_reduced([n1 * n2 for n1, n2 in zip(self.nums, nums)],
+                                          [d1 * d2 for d1, d2 in zip(self.dens, dens)]))
+
+    ## Implements right side multiplication by calling __mul__.
+    def __rmul__(self, other):
+        return self * other
+
+    ## Implements element-wise division, see __add__().
+    #  @returns A new RatioArray.
+    #
+    #  A ZeroDivisionError should be raised if any divisor is 0.
+    def __truediv__(self, other):
+        nums, dens = self._operands(other)
+        return RatioArray._make(*_reduced([n1 * d2 for n1, d2 in zip(self.nums, dens)],
+                                          [d1 * n2 for d1, n2 in zip(self.dens, nums)]))
+
+    ## Implements int / RatioArray (right side division).
+    def __rtruediv__(self, other):
+        return self.reciprocal() * other
+
+    ## Private method that returns an array of 0/1 flags holding the
+    #  element-wise result of test(a, b), where a and b are the cross
+    #  products of the elements being compared.
+    def _compare(self, other, test):
+        nums, dens = self._operands(other)
+        return array('b', [test(n1 * d2, n2 * d1) for n1, d1, n2, d2 in zip(self.nums, self.dens, nums, dens)])
+
+    ## Implements element-wise RatioArray < other. See _compare().
+    #  @returns An array of 0/1 flags, one per element.
+    def __lt__(self, other):
+        return self._compare(other, int.__lt__)
+
+    ## Implements element-wise RatioArray <= other. See _compare().
+    def __le__(self, other):
+        return self._compare(other, int.__le__)
+
+    ## Implements element-wise RatioArray == other. See _compare().
+    def __eq__(self, other):
+        return self._compare(other, int.__eq__)
+
+    ## Implements element-wise RatioArray != other. See _compare().
+    def __ne__(self, other):
+        return self._compare(other, int.__ne__)
+
+    ## Implements element-wise RatioArray >= other. See _compare().
+    def __ge__(self, other):
+        return self._compare(other, int.__ge__)
+
+    ## Implements element-wise RatioArray > other. See _compare().
+    def __gt__(self, other):
+        return self._compare(other, int.__gt__)
+
+    __hash__ = None
+
+    ## Returns a RatioArray of the reciprocals of the values.
+    #
+    #  A ZeroDivisionError should be raised if any value is 0.
+    def reciprocal(self):
+        return RatioArray._make(*_reduced(self.dens, self.nums))
+
+    ## Returns a new RatioArray with every value in its reduced form. The
+    #  arithmetic methods always return reduced arrays, this method is only
+    #  needed after assigning to the columns directly.
+    def reduce(self):
+        return RatioArray._make(*_reduced(self.nums, self.dens))
+
+    ## Returns the cumulative sum of the values as a new RatioArray, e.g.
+    #  the onsets of a list of durations shifted by one. The running total is
+    #  kept as a single reduced fraction so each step costs one gcd.
+    def cumsum(self):
+        total_num, total_den = 0, 1
+        nums, dens = [], []
+        for num, den in zip(self.nums, self.dens):
+            total_num = total_num * den + num * total_den
+            total_den *= den
+            gcd = math.gcd(total_num, total_den)
+            total_num //= gcd
+            total_den //= gcd
+            nums.append(total_num)
+            dens.append(total_den)
+        return RatioArray._make(_column(nums), _column(dens))
+
+    ## Returns the sum of all the values as a Ratio.
+    def sum(self):
+        if len(self) == 0:
+            return Ratio.from_reduced(0, 1)
+        return self.cumsum()[-1]
+
+    ## Returns the musical 'dotted' value of every ratio. See: Ratio.dotted().
+    #  @param dots  The number of dots to apply.
+    #  @return A new RatioArray of dotted values.
+    #
+    #  The method should raise a ValueError if dots is not a positive integer.
+    def dotted(self, dots=1):
+        if not isinstance(dots, int) or dots <= 0:
+            raise ValueError("Dots is not a positive integer")
+
+        return self * Ratio((2 << dots) - 1, 1 << dots)
+
+    ## Returns the tuplet subdivisions of every ratio, see Ratio.tuplets().
+    #  @param num  The number of tuplets each value is divided into.
+    #  @param intimeof  A Ratio or int that, multiplied by each value, is
+    #  the sum of that value's tuplets.
+    #  @returns A RatioArray of len(self) * num values, the num tuplets
+    #  of each value in order.
+    #
+    #  The method should raise a ValueError if num is not a positive integer
+    #  and a TypeError if intimeof is not a positive Ratio or int.
+    def tuplets(self, num, intimeof=1):
+        if not isinstance(num, int) or num <= 0:
+            raise ValueError("Num is not a positive integer")
+        if not isinstance(intimeof, (Ratio, int)) or intimeof <= 0:
+            raise TypeError("Intimeof is not a positive Ratio or int")
+
+        tuplet = self * intimeof / num
+        return RatioArray._make(_column(n for n in tuplet.nums for _ in range(num)),
+                                _column(d for d in tuplet.dens for _ in range(num)))
+
+    ## Returns the values as an array of floating point numbers.
+    def floats(self):
+        return array('d', [num / den for num, den in zip(self.nums, self.dens)])
+
+    ## Converts every value to floating point seconds according to a given
+    #  tempo and beat, see Ratio.seconds().
+    #  @param tempo  The tempo in beats per minute. Defaults to 60.
+    #  @param beat  A ratio representing the beat. Defaults to 1/4 (quarter note).
+    #  @returns An array of float64 seconds.
+    #
+    #  The method should raise a TypeError if tempo or beat is not a positive
+    #  Ratio or int.
+    def seconds(self, tempo=60, beat=None):
+        if beat == None:
+            beat = Ratio(1, 4)
+        if not isinstance(tempo, (Ratio, int)) or tempo <= 0:
+            raise TypeError("Tempo is not a positive Ratio or int")
+        if not isinstance(beat, (Ratio, int)) or beat <= 0:
+            raise TypeError("Beat is not a positive Ratio or int")
+
+        scale = Ratio(60) / (beat * tempo)
+        scale = scale.num / scale.den
+        return array('d', [num * scale / den for num, den in zip(self.nums, self.dens)])
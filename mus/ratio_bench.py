@@ -0,0 +1,110 @@
+###############################################################################
+## @file
+#  Microbenchmarks for the Ratio comparison and arithmetic fast paths.
+#
+#  Each benchmark times the current Ratio operators against a 'legacy'
+#  version of the same operation written the way Ratio used to implement
+#  it: comparisons built a temporary ratio with self + -other, and sums and
+#  products went back through the full Ratio constructor. The legacy
+#  versions are rebuilt here with the public constructor so both sides run
+#  against the same Ratio class.
+#
+#  Run the benchmarks from the repository root with:
+#  @code
+#  $ python3 -m mus.ratio_bench
+#  @endcode
+
+import math
+import random
+import timeit
+from functools import cmp_to_key
+
+from .ratio import Ratio
+
+
+## Returns -ratio the way Ratio.__neg__ used to compute it.
+def legacy_neg(a):
+    return Ratio(a.num * -1, a.den)
+
+
+## Returns a + b the way Ratio.__add__ used to compute it.
+def legacy_add(a, b):
+    lcm = Ratio.lcm(a.den, b.den)
+    return Ratio(a.num * lcm // a.den + b.num * lcm // b.den, lcm)
+
+
+## Returns a * b the way Ratio.__mul__ used to compute it.
+def legacy_mul(a, b):
+    num, den = a.num * b.num, a.den * b.den
+    gcd = math.gcd(num, den)
+    return Ratio(num // gcd, den // gcd)
+
+
+## Returns a < b the way Ratio.__lt__ used to compute it.
+def legacy_lt(a, b):
+    return legacy_add(a, legacy_neg(b)).num < 0
+
+
+## Returns a == b the way Ratio.__eq__ used to compute it.
+def legacy_eq(a, b):
+    return legacy_add(a, legacy_neg(b)).num == 0
+
+
+## Returns the comparison value of a and b for legacy sorting.
+def legacy_cmp(a, b):
+    diff = legacy_add(a, legacy_neg(b)).num
+    return -1 if diff < 0 else (1 if diff > 0 else 0)
+
+
+## Returns a list of count random note durations and onsets drawn from the
+#  usual metric values (whole notes down to 32nds, dotted values and triplets).
+def sample_ratios(count, seed=105):
+    rng = random.Random(seed)
+    values = [Ratio(1, d) for d in (1, 2, 4, 8, 16, 32)]
+    values += [v.dotted() for v in values[:5]] + [Ratio(1, 12), Ratio(1, 6), Ratio(1, 24)]
+    return [rng.choice(values) * rng.randint(1, 8) for _ in range(count)]
+
+
+## Returns the best time in seconds of running function() number times.
+def best_time(function, number, repeat=5):
+    return min(timeit.repeat(function, number=number, repeat=repeat))
+
+
+## Runs every benchmark and returns a list of (name, legacy, current) times
+#  in seconds.
+def run(count=10000, number=3):
+    ratios = sample_ratios(count)
+    pairs = list(zip(ratios, ratios[1:]))
+    results = []
+
+    results.append(('compare <', best_time(lambda: [legacy_lt(a, b) for a, b in pairs], number),
+                    best_time(lambda: [a < b for a, b in pairs], number)))
+    results.append(('compare ==', best_time(lambda: [legacy_eq(a, b) for a, b in pairs], number),
+                    best_time(lambda: [a == b for a, b in pairs], number)))
+    results.append(('sort onsets', best_time(lambda: sorted(ratios, key=cmp_to_key(legacy_cmp)), number),
+                    best_time(lambda: sorted(ratios), number)))
+    results.append(('add', best_time(lambda: [legacy_add(a, b) for a, b in pairs], number),
+                    best_time(lambda: [a + b for a, b in pairs], number)))
+    results.append(('mul', best_time(lambda: [legacy_mul(a, b) for a, b in pairs], number),
+                    best_time(lambda: [a * b for a, b in pairs], number)))
+
+    def legacy_sum():
+        total = Ratio(0, 1)
+        for r in ratios:
+            total = legacy_add(total, r)
+        return total
+
+    results.append(('sum durations', best_time(legacy_sum, number),
+                    best_time(lambda: sum(ratios), number)))
+    return results
+
+
+## Prints a table of the benchmark results.
+def main():
+    print(f'{"benchmark":<16}{"legacy (s)":>12}{"current (s)":>13}{"speedup":>10}')
+    for name, legacy, current in run():
+        print(f'{name:<16}{legacy:>12.4f}{current:>13.4f}{legacy / current:>9.1f}x')
+
+
+if __name__ == '__main__':
+    main()
@@ -1,4 +1,6 @@
+from collections import namedtuple
 from enum import Enum, IntEnum, auto
+from functools import lru_cache
 
 # Project: complete this implementation
 
@@ -69,4 +71,84 @@ class ScaleDegrees (Enum):
         scale degree.  Hint: Use the values of degrees
         and inflectons to determine the semitonal content"""
 
-        return self.degree() + self.inflection()
\ No newline at end of file
+        return self.degree() + self.inflection()
+
+
+# The semitones of the seven degrees of the major scale, and of the letters
+# C-B. Pnums encode a letter index 0-6 in bits 4-6 and an accidental index
+# 0-4 ('ff' to 'ss') in bits 0-3, see Pitch.pnums.
+MAJOR_SEMITONES = (0, 2, 4, 5, 7, 9, 11)
+
+DegreeTable = namedtuple('DegreeTable', 'pnums pcs')
+DegreeTable.__doc__ = """The scale degree lookup table of a key: pnums is a dict
+mapping the integer value of each diatonic pnum to its ScaleDegrees member,
+and pcs is a tuple holding the member (or None) of each pitch class 0-11."""
+
+
+@lru_cache(maxsize=None)
+def degree_table(tonic, mode):
+    """Returns the DegreeTable for a tonic pnum and a mode. Degrees are
+    inflected relative to the major scale, so the third degree of a minor
+    key is LOWERED_MEDIANT and the fourth of a lydian key RAISED_SUBDOMINANT.
+    Tables are built once per (tonic, mode) and then shared.
+    tonic is a Pnum or its integer value and mode is a Mode or its integer
+    degree 0-6. Raises a ValueError if either is invalid."""
+
+    tonic, mode = int(tonic), int(mode)
+    letter, accidental = tonic >> 4, (tonic & 15) - 2
+    if not 0 <= letter <= 6 or not -2 <= accidental <= 2:
+        raise ValueError("Tonic is not a valid pnum")
+    if not 0 <= mode <= 6:
+        raise ValueError("Mode is not a valid mode")
+
+    tonic_pc = MAJOR_SEMITONES[letter] + accidental
+    pnums, pcs = {}, [None] * 12
+    for degree in range(7):
+        # the semitones of this degree above the tonic in the given mode
+        semitones = (MAJOR_SEMITONES[(degree + mode) % 7] - MAJOR_SEMITONES[mode]) % 12
+        member = ScaleDegrees((MAJOR_SEMITONES[degree], semitones - MAJOR_SEMITONES[degree]))
+        pc = (tonic_pc + semitones) % 12
+        pcs[pc] = member
+
+        degree_letter = (letter + degree) % 7
+        degree_accidental = (pc - MAJOR_SEMITONES[degree_letter] + 6) % 12 - 6
+        if -2 <= degree_accidental <= 2:
+            pnums[(degree_letter << 4) + degree_accidental + 2] = member
+    return DegreeTable(pnums, tuple(pcs))
+
+
+def pnum_degree(pnum, tonic, mode):
+    """Returns the ScaleDegrees member of a pnum in the key of tonic and
+    mode, or None if the pnum is chromatic (not spelled in the scale).
+    See degree_table()."""
+
+    return degree_table(tonic, mode).pnums.get(int(pnum))
+
+
+def pc_degree(pc, tonic, mode):
+    """Returns the ScaleDegrees member of a pitch class 0-11 in the key of
+    tonic and mode, or None if the pitch class is not in the scale.
+    See degree_table(). Raises a ValueError if pc is not 0-11."""
+
+    if not 0 <= pc <= 11:
+        raise ValueError("Pc is not a valid pitch class")
+    return degree_table(tonic, mode).pcs[pc]
+
+
+def classify_pnums(pnums, tonic, mode):
+    """Returns a list holding the ScaleDegrees member (or None) of every
+    pnum in a melody, using one table for the whole melody."""
+
+    table = degree_table(tonic, mode).pnums
+    return [table.get(int(pnum)) for pnum in pnums]
+
+
+def classify_pcs(pcs, tonic, mode):
+    """Returns a list holding the ScaleDegrees member (or None) of every
+    pitch class in a melody, using one table for the whole melody.
+    Raises a ValueError if a value is not 0-11."""
+
+    table, pcs = degree_table(tonic, mode).pcs, list(pcs)
+    if not all(0 <= pc <= 11 for pc in pcs):
+        raise ValueError("Pc is not a valid pitch class")
+    return [table[pc] for pc in pcs]
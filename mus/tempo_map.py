@@ -0,0 +1,167 @@
+###############################################################################
+## @file
+#  A tempo map that converts metric time to clock time.
+#  A TempoMap is a list of piecewise-constant tempo segments, each starting
+#  at an exact Ratio onset. The clock time at the start of every segment is
+#  kept as an exact Ratio, so converting an onset only needs a binary search
+#  for its segment and a little integer arithmetic; the result is rounded to
+#  a float once, at the very end.
+
+from array import array
+from bisect import bisect_right
+
+from .ratio import Ratio
+from .ratio_array import RatioArray
+
+
+## A class that maps metric onsets (Ratios of whole notes) to seconds.
+#
+#  A TempoMap holds parallel lists describing its segments, in onset order:
+#  * starts  The Ratio onset where each segment begins. The first segment
+#  begins at 0 and also applies to negative onsets (pickups).
+#  * tempos  The tempo of each segment in beats per minute.
+#  * beats  The Ratio beat of each segment, e.g. 1/4 for quarter notes.
+#  * clocks  The exact time in seconds (a Ratio) where each segment begins.
+class TempoMap:
+
+    ## Creates a TempoMap with a single segment starting at 0.
+    #  @param tempo  The initial tempo in beats per minute. Defaults to 60.
+    #  @param beat  A ratio representing the beat. Defaults to 1/4 (quarter note).
+    #
+    #  The constructor should raise a TypeError if tempo or beat is not a
+    #  positive Ratio or int.
+    def __init__(self, tempo=60, beat=None):
+        self.starts = []
+        self.tempos = []
+        self.beats = []
+        self.clocks = []
+        self.add_tempo(0, tempo, beat)
+
+    ## Returns a string showing the tempo segments and the hex value of
+    #  the map's memory address.
+    #  Example: <TempoMap: 0/1=60@1/4 2/1=120@1/4 0x10610d2b0>
+    def __str__(self):
+        return f'<TempoMap: {self._segments()} {hex(id(self))}>'
+
+    ## Returns a string showing the tempo segments.
+    #  Example: <TempoMap: 0/1=60@1/4 2/1=120@1/4>
+    def __repr__(self):
+        return f'<TempoMap: {self._segments()}>'
+
+    ## Private method that returns the segments as 'start=tempo@beat' names.
+    def _segments(self):
+        return ' '.join(f'{start.string()}={tempo}@{beat.string()}'
+                        for start, tempo, beat in zip(self.starts, self.tempos, self.beats))
+
+    ## Returns the number of tempo segments.
+    def __len__(self):
+        return len(self.starts)
+
+    ## Sets the tempo from an onset until the next tempo change. A tempo
+    #  already starting at that onset is replaced.
+    #  @param onset  The Ratio or int onset where the tempo starts.
+    #  @param tempo  The tempo in beats per minute.
+    #  @param beat  A ratio representing the beat. Defaults to 1/4 (quarter note).
+    #
+    #  The method should raise a ValueError if onset is negative and a
+    #  TypeError if onset is not a Ratio or int or if tempo or beat is not
+    #  a positive Ratio or int.
+    def add_tempo(self, onset, tempo, beat=None):
+        if beat == None:
+            beat = Ratio(1, 4)
+        if not isinstance(onset, (Ratio, int)):
+            raise TypeError("Onset is not a Ratio or int")
+        elif onset < 0:
+            raise ValueError("Onset is negative")
+        if not isinstance(tempo, (Ratio, int)) or tempo <= 0:
+            raise TypeError("Tempo is not a positive Ratio or int")
+        if not isinstance(beat, (Ratio, int)) or beat <= 0:
+            raise TypeError("Beat is not a positive Ratio or int")
+
+        if isinstance(onset, int):
+            onset = Ratio(onset)
+        if isinstance(beat, int):
+            beat = Ratio(beat)
+        index = bisect_right(self.starts, onset)
+        if index > 0 and self.starts[index - 1] == onset:
+            index -= 1
+            self.tempos[index], self.beats[index] = tempo, beat
+        else:
+            self.starts.insert(index, onset)
+            self.tempos.insert(index, tempo)
+            self.beats.insert(index, beat)
+            self.clocks.insert(index, None)
+        self._update()
+
+    ## Private method that recomputes the exact starting time of every
+    #  segment and each segment's seconds per whole note.
+    def _update(self):
+        self._scales = [Ratio(60) / (beat * tempo) for tempo, beat in zip(self.tempos, self.beats)]
+        clock = Ratio(0)
+        for i, start in enumerate(self.starts):
+            if i > 0:
+                clock += (start - self.starts[i - 1]) * self._scales[i - 1]
+            self.clocks[i] = clock
+
+    ## Returns the tempo (in beats per minute) and beat in effect at an onset.
+    #  @param onset  A Ratio or int onset.
+    def tempo_at(self, onset):
+        index = max(bisect_right(self.starts, onset) - 1, 0)
+        return self.tempos[index], self.beats[index]
+
+    ## Returns the exact clock time of an onset in seconds as a Ratio.
+    #  @param onset  A Ratio or int onset.
+    def clock(self, onset):
+        index = max(bisect_right(self.starts, onset) - 1, 0)
+        return self.clocks[index] + (onset - self.starts[index]) * self._scales[index]
+
+    ## Returns the clock time of an onset in floating point seconds.
+    #  @param onset  A Ratio or int onset.
+    def seconds(self, onset):
+        clock = self.clock(onset)
+        return clock.num / clock.den
+
+    ## Private method that returns the exact clock time of the onset
+    #  num/den as an unreduced (numerator, denominator) pair of ints.
+    def _fraction(self, num, den):
+        i = max(bisect_right(self.starts, Ratio.from_reduced(num, den)) - 1, 0)
+        start, clock, scale = self.starts[i], self.clocks[i], self._scales[i]
+        # clock + (num/den - start) * scale as one fraction
+        part_num = (num * start.den - start.num * den) * scale.num
+        part_den = den * start.den * scale.den
+        return clock.num * part_den + part_num * clock.den, clock.den * part_den
+
+    ## Converts many onsets to floating point seconds. Each onset is placed
+    #  in its segment by binary search and its time is computed exactly
+    #  in integers, then rounded once to a float.
+    #  @param onsets  A RatioArray or an iterable of Ratios or ints.
+    #  @returns An array of float64 seconds, one per onset.
+    def seconds_many(self, onsets):
+        if not isinstance(onsets, RatioArray):
+            onsets = RatioArray(onsets)
+        fraction = self._fraction
+        return array('d', [n / d for n, d in map(fraction, onsets.nums, onsets.dens)])
+
+    ## Converts many notes to floating point durations in seconds, taking
+    #  tempo changes during a note into account.
+    #  @param onsets  A RatioArray or an iterable of Ratio or int onsets.
+    #  @param durs  A RatioArray or an iterable of Ratio or int durations,
+    #  the same length as onsets.
+    #  @returns An array of float64 durations in seconds, one per note.
+    #
+    #  The method should raise a ValueError if onsets and durs have
+    #  different lengths.
+    def durations_many(self, onsets, durs):
+        if not isinstance(onsets, RatioArray):
+            onsets = RatioArray(onsets)
+        if not isinstance(durs, RatioArray):
+            durs = RatioArray(durs)
+        if len(onsets) != len(durs):
+            raise ValueError("Onsets and durations have different lengths")
+        ends = onsets + durs
+        fraction = self._fraction
+        seconds = array('d')
+        for (n1, d1), (n2, d2) in zip(map(fraction, onsets.nums, onsets.dens),
+                                      map(fraction, ends.nums, ends.dens)):
+            seconds.append((n2 * d1 - n1 * d2) / (d1 * d2))
+        return seconds
@@ -21,6 +21,10 @@
 #     72, 'C3', 'C5', 'B#4', 'Dbb8',  and so on.
 
 import math
+import struct
+from array import array
+from bisect import bisect_right
+from itertools import islice
 
 
 ## Returns the midi key number for a given hertz frequency.
@@ -35,7 +39,17 @@ import math
 def hertz_to_midi(hertz):
     if hertz <= 0:
         raise ValueError("Input is not a positive number")
-    
+
+    if _HERTZ_BOUNDS[0] <= hertz < _HERTZ_BOUNDS[128]:
+        return bisect_right(_HERTZ_BOUNDS, hertz) - 1
+
+    return _hertz_to_midi(hertz)
+
+
+## Private function that converts hertz to midi with the formula, see
+#  hertz_to_midi(). It is only called for values outside the lookup table
+#  so that it raises the same errors hertz_to_midi() always has.
+def _hertz_to_midi(hertz):
     midi = round(69 + math.log2(hertz / 440.0) * 12)
     
     if midi < 0 or midi > 127:
@@ -59,7 +73,7 @@ def midi_to_hertz(midi):
     if midi < 0 or midi > 127:
         raise ValueError("Input is not a valid midi key number")
     
-    return 440.0 * 2 ** ((midi - 69) / 12)
+    return _MIDI_HERTZ[midi]
 
 
 ## Returns the pitch class integer for a given midi key number.
@@ -100,6 +114,16 @@ def midi_to_pc(midi):
 #  The function should signal a ValueError if the input is not a valid
 #  pitch name or produces an invalid midi key number.
 def pitch_to_midi(pitch):
+    midi = _PITCH_MIDI.get(pitch) if type(pitch) is str else None
+    if midi is None:
+        return _parse_pitch(pitch)
+    return midi
+
+
+## Private function that parses a pitch name one character at a time, see
+#  pitch_to_midi(). It is only called for names missing from the lookup
+#  table so that it raises the same errors pitch_to_midi() always has.
+def _parse_pitch(pitch):
     letter_to_pc = {
         'C': 0,
         'D': 2,
@@ -173,6 +197,20 @@ def pitch_to_midi(pitch):
 #  is invalid or if the pitch requested does not support the specified
 #  accidental.
 def midi_to_pitch(midi, accidental=None):
+    if type(midi) is int and 0 <= midi <= 127:
+        try:
+            pitch = _MIDI_PITCHES[accidental][midi]
+        except (KeyError, TypeError):
+            pitch = None
+        if pitch is not None:
+            return pitch
+    return _spell_midi(midi, accidental)
+
+
+## Private function that spells a midi key number one case at a time, see
+#  midi_to_pitch(). It is only called for requests missing from the lookup
+#  table so that it raises the same errors midi_to_pitch() always has.
+def _spell_midi(midi, accidental=None):
     if not isinstance(midi, int) or midi < 0 or midi > 127:
         raise ValueError("Midi key number is invalid")
     
@@ -268,6 +306,154 @@ def pitch_to_hertz(pitch):
     return midi_to_hertz(pitch_to_midi(pitch))
 
 
+## Returns the distance in cents (hundredths of a semitone) between a hertz
+#  frequency and the nearest midi key number, see hertz_to_midi().
+#  @param hertz  The hertz frequency to measure.
+#  @returns A float between -50.0 and 50.0, positive if hertz is sharp.
+#
+#  The function should raise a ValueError if the input is not a positive
+#  number or does not produce a valid midi key number.
+def hertz_to_cents_deviation(hertz):
+    return 1200 * math.log2(hertz / _MIDI_HERTZ[hertz_to_midi(hertz)])
+
+
+###############################################################################
+# Array conversions. These functions convert a whole sequence of values at
+# once and return a compact array (see Python's array module) instead of
+# raising on the first bad element: invalid inputs produce the sentinel -1
+# in integer arrays and NaN in float arrays. To process an unbounded stream
+# in constant memory pass the functions to iter_chunks().
+
+## Returns the midi key numbers of a sequence of hertz frequencies, see
+#  hertz_to_midi().
+#  @param hertz  An iterable of numbers.
+#  @returns An array of signed bytes, -1 where a frequency is not positive
+#  or does not produce a valid midi key number.
+def hertz_to_midi_array(hertz):
+    bounds = _HERTZ_BOUNDS
+    low, high = bounds[0], bounds[128]
+    return array('b', [bisect_right(bounds, h) - 1 if low <= h < high else -1 for h in hertz])
+
+
+## Returns the hertz values of a sequence of midi key numbers, see
+#  midi_to_hertz().
+#  @param midis  An iterable of integers.
+#  @returns An array of doubles, NaN where a value is not a valid midi key
+#  number.
+def midi_to_hertz_array(midis):
+    table, nan = _MIDI_HERTZ, math.nan
+    return array('d', [table[m] if type(m) is int and 0 <= m <= 127 else nan for m in midis])
+
+
+## Returns the pitch classes of a sequence of midi key numbers, see
+#  midi_to_pc().
+#  @param midis  An iterable of integers.
+#  @returns An array of signed bytes, -1 where a value is not a valid midi
+#  key number.
+def midi_to_pc_array(midis):
+    return array('b', [m % 12 if type(m) is int and 0 <= m <= 127 else -1 for m in midis])
+
+
+## Returns the cents deviations of a sequence of hertz frequencies, see
+#  hertz_to_cents_deviation().
+#  @param hertz  An iterable of numbers.
+#  @returns An array of doubles, NaN where a frequency is not positive or
+#  does not produce a valid midi key number.
+def hertz_to_cents_deviation_array(hertz):
+    bounds, table, log2, nan = _HERTZ_BOUNDS, _MIDI_HERTZ, math.log2, math.nan
+    low, high = bounds[0], bounds[128]
+    return array('d', [1200 * log2(h / table[bisect_right(bounds, h) - 1]) if low <= h < high else nan
+                       for h in hertz])
+
+
+## Applies an array conversion to a stream of values one chunk at a time,
+#  so that arbitrarily long inputs are converted in bounded memory.
+#  @param function  An array conversion, e.g. hertz_to_midi_array.
+#  @param values  An iterable (or iterator) of values to convert.
+#  @param size  The number of values per chunk. Defaults to 65536.
+#  @returns A generator yielding the converted array of each chunk.
+#
+#  The function should raise a ValueError if size is not a positive integer.
+def iter_chunks(function, values, size=65536):
+    if not isinstance(size, int) or size <= 0:
+        raise ValueError("Size is not a positive integer")
+
+    def chunks():
+        values_iter = iter(values)
+        while True:
+            chunk = list(islice(values_iter, size))
+            if not chunk:
+                return
+            yield function(chunk)
+
+    return chunks()
+
+
+###############################################################################
+# Lookup tables. Every conversion above is a single table lookup; the tables
+# are built once, at import time, from the same formulas and parsers that
+# handle the values falling outside of them.
+
+## The hertz frequency of every midi key number 0-127.
+_MIDI_HERTZ = tuple(440.0 * 2 ** ((midi - 69) / 12) for midi in range(128))
+
+
+## Private function that returns the positive float next to value, one
+#  unit in the last place above it (step 1) or below it (step -1). Positive
+#  floats sort like their bit patterns, so the neighbor is one bit pattern
+#  away. This is math.nextafter(), which needs Python 3.9.
+def _next_float(value, step):
+    bits = struct.unpack('<q', struct.pack('<d', value))[0]
+    return struct.unpack('<d', struct.pack('<q', bits + step))[0]
+
+
+## Private function that returns the smallest float frequency that the
+#  formula in _hertz_to_midi() rounds up to at least midi. Starting from
+#  the exact boundary between midi-1 and midi it steps one float at a time
+#  so that the table agrees with the formula even at the boundaries.
+def _hertz_bound(midi):
+    formula = lambda hertz: round(69 + math.log2(hertz / 440.0) * 12)
+    hertz = 440.0 * 2 ** ((midi - 69.5) / 12)
+    while formula(hertz) < midi:
+        hertz = _next_float(hertz, 1)
+    while formula(_next_float(hertz, -1)) >= midi:
+        hertz = _next_float(hertz, -1)
+    return hertz
+
+
+## _HERTZ_BOUNDS[k] is the lowest frequency converted to midi key number k;
+#  _HERTZ_BOUNDS[128] is the first frequency that is out of range.
+_HERTZ_BOUNDS = tuple(_hertz_bound(midi) for midi in range(129))
+
+
+## Every legal pitch name in the midi range, mapped to its key number.
+_PITCH_MIDI = {}
+for _letter in 'CDEFGAB':
+    for _accidental in ('', 'bb', 'ff', 'b', 'f', '#', 's', '##', 'ss'):
+        for _octave in ('00', '0', '1', '2', '3', '4', '5', '6', '7', '8', '9'):
+            _name = _letter + _accidental + _octave
+            try:
+                _PITCH_MIDI[_name] = _parse_pitch(_name)
+            except ValueError:
+                pass
+
+
+## The pitch name of every midi key number for each accidental preference
+#  accepted by midi_to_pitch(), with None where a key number cannot be
+#  spelled with that accidental.
+_MIDI_PITCHES = {}
+for _accidental in (None, 'bb', 'b', '#', '##'):
+    _names = []
+    for _midi in range(128):
+        try:
+            _names.append(_spell_midi(_midi, _accidental))
+        except ValueError:
+            _names.append(None)
+    _MIDI_PITCHES[_accidental] = tuple(_names)
+
+del _letter, _accidental, _octave, _name, _midi, _names
+
+
 ###############################################################################
 # There are two methods you can use to test out code as you develop it.
 #
@@ -0,0 +1,93 @@
+###############################################################################
+## @file
+#  Throughput benchmarks for the mus.tet lookup tables.
+#
+#  Each benchmark times a million random conversions through the public tet
+#  functions against the 'legacy' implementation of the same conversion:
+#  the character by character parser, the if/elif speller and the log2 and
+#  power formulas. The legacy parser and speller are the private fallbacks
+#  that tet still uses for values outside its tables, so both sides are
+#  always checked against each other before timing.
+#
+#  Run the benchmarks from the repository root with:
+#  @code
+#  $ python3 -m mus.tet_bench
+#  @endcode
+
+import math
+import random
+import timeit
+
+from . import tet
+
+
+## Returns the midi key number of hertz the way tet.hertz_to_midi() used to
+#  compute it.
+def legacy_hertz_to_midi(hertz):
+    if hertz <= 0:
+        raise ValueError("Input is not a positive number")
+    return tet._hertz_to_midi(hertz)
+
+
+## Returns the hertz value of midi the way tet.midi_to_hertz() used to
+#  compute it.
+def legacy_midi_to_hertz(midi):
+    if not isinstance(midi, int) or midi < 0 or midi > 127:
+        raise ValueError("Input is not a valid midi key number")
+    return 440.0 * 2 ** ((midi - 69) / 12)
+
+
+## Returns count random (hertz, midi, pitch name, accidental) samples.
+def samples(count, seed=105):
+    rng = random.Random(seed)
+    names = list(tet._PITCH_MIDI)
+    accidentals = [None, None, None, 'b', '#', 'bb', '##']
+    hertz = [math.exp(rng.uniform(math.log(8.2), math.log(12543.0))) for _ in range(count)]
+    midis = [rng.randrange(128) for _ in range(count)]
+    pitches = [rng.choice(names) for _ in range(count)]
+    spellings = []
+    for _ in range(count):
+        midi, accidental = rng.randrange(128), rng.choice(accidentals)
+        if tet._MIDI_PITCHES[accidental][midi] is None:
+            accidental = None
+        spellings.append((midi, accidental))
+    return hertz, midis, pitches, spellings
+
+
+## Returns the best time in seconds of running function() number times.
+def best_time(function, number, repeat=3):
+    return min(timeit.repeat(function, number=number, repeat=repeat))
+
+
+## Runs every benchmark and returns a list of (name, legacy, current) times
+#  in seconds.
+def run(count=1000000, number=1):
+    hertz, midis, pitches, spellings = samples(count)
+    benchmarks = [
+        ('hertz_to_midi', hertz, legacy_hertz_to_midi, tet.hertz_to_midi),
+        ('midi_to_hertz', midis, legacy_midi_to_hertz, tet.midi_to_hertz),
+        ('pitch_to_midi', pitches, tet._parse_pitch, tet.pitch_to_midi),
+    ]
+    results = []
+    for name, values, legacy, current in benchmarks:
+        assert list(map(legacy, values)) == list(map(current, values)), name
+        results.append((name, best_time(lambda: list(map(legacy, values)), number),
+                        best_time(lambda: list(map(current, values)), number)))
+
+    legacy = [tet._spell_midi(midi, accidental) for midi, accidental in spellings]
+    assert legacy == [tet.midi_to_pitch(midi, accidental) for midi, accidental in spellings]
+    results.append(('midi_to_pitch',
+                    best_time(lambda: [tet._spell_midi(m, a) for m, a in spellings], number),
+                    best_time(lambda: [tet.midi_to_pitch(m, a) for m, a in spellings], number)))
+    return results
+
+
+## Prints a table of the benchmark results.
+def main():
+    print(f'{"benchmark":<16}{"legacy (s)":>12}{"current (s)":>13}{"speedup":>10}')
+    for name, legacy, current in run():
+        print(f'{name:<16}{legacy:>12.4f}{current:>13.4f}{legacy / current:>9.1f}x')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,125 @@
+###############################################################################
+## @file
+#  Tunings: a reference frequency plus a temperament.
+#
+#  The functions in tet assume twelve-tone equal temperament at A440. A
+#  Tuning generalizes this to any reference frequency for A4 (e.g. 415 Hz
+#  for baroque pitch) and to the Pythagorean and 5-limit just temperaments,
+#  whose twelve chromatic steps above a tonic are defined by exact Ratios.
+#  Every tuning precomputes the frequencies of all 128 midi key numbers, and
+#  the tables are shared between equal tunings through a bounded cache, so
+#  looking up a key number or a pitch name is a single table index.
+
+from enum import Enum
+from functools import lru_cache
+
+from .ratio import Ratio
+from .tet import pitch_to_midi
+
+
+## An enumeration of temperaments. The value of a just temperament is a
+#  tuple of the twelve Ratios of its chromatic steps above the tonic. The
+#  value of EQUAL is None since its steps are the irrational 2**(n/12).
+class Temperament (Enum):
+    EQUAL = None
+    PYTHAGOREAN = (Ratio(1, 1), Ratio(256, 243), Ratio(9, 8), Ratio(32, 27),
+                   Ratio(81, 64), Ratio(4, 3), Ratio(729, 512), Ratio(3, 2),
+                   Ratio(128, 81), Ratio(27, 16), Ratio(16, 9), Ratio(243, 128))
+    JUST = (Ratio(1, 1), Ratio(16, 15), Ratio(9, 8), Ratio(6, 5),
+            Ratio(5, 4), Ratio(4, 3), Ratio(45, 32), Ratio(3, 2),
+            Ratio(8, 5), Ratio(5, 3), Ratio(9, 5), Ratio(15, 8))
+
+    ## Returns the Ratio of a key number above (or below) the tonic key
+    #  number, or None for EQUAL.
+    #  @param steps  The number of semitones from the tonic.
+    def ratio(self, steps):
+        if self.value is None:
+            return None
+        octave, pc = divmod(steps, 12)
+        return self.value[pc] * (Ratio(2) ** octave)
+
+
+## Private function that returns the 128 frequencies of a tuning. The tables
+#  are memoized so all tunings with the same settings share one tuple.
+#  @param reference  The frequency of A4 (midi key number 69).
+#  @param temperament  A Temperament.
+#  @param tonic  The pitch class that the temperament's ratios start on.
+@lru_cache(maxsize=32)
+def _frequency_table(reference, temperament, tonic):
+    if temperament is Temperament.EQUAL:
+        return tuple(reference * 2 ** ((midi - 69) / 12) for midi in range(128))
+
+    # The tonic key number in octave 4 and the ratio of A4 above it, which
+    # must sound at the reference frequency.
+    base = 60 + tonic
+    a4 = temperament.ratio(69 - base)
+    table = []
+    for midi in range(128):
+        ratio = temperament.ratio(midi - base) / a4
+        table.append(reference * ratio.num / ratio.den)
+    return tuple(table)
+
+
+## A class that maps midi key numbers and pitch names to frequencies in a
+#  given tuning. A Tuning holds four attributes:
+#  * reference  The frequency of A4 in hertz.
+#  * temperament  The Temperament.
+#  * tonic  The pitch class 0-11 that a just temperament is built on.
+#  * table  The frequencies of midi key numbers 0-127.
+class Tuning:
+
+    ## Creates a Tuning.
+    #  @param reference  The positive frequency of A4. Defaults to 440.0.
+    #  @param temperament  A Temperament. Defaults to Temperament.EQUAL.
+    #  @param tonic  The pitch class 0-11 of the temperament's first step,
+    #  only used by just temperaments. Defaults to 0 (C).
+    #
+    #  The constructor should raise a ValueError if reference is not a
+    #  positive number or tonic is not a pitch class, and a TypeError if
+    #  temperament is not a Temperament.
+    def __init__(self, reference=440.0, temperament=Temperament.EQUAL, tonic=0):
+        if not isinstance(reference, (int, float)) or reference <= 0:
+            raise ValueError("Reference is not a positive number")
+        if not isinstance(temperament, Temperament):
+            raise TypeError("Temperament is not a Temperament")
+        if not isinstance(tonic, int) or tonic < 0 or tonic > 11:
+            raise ValueError("Tonic is not a valid pitch class")
+
+        self.reference = float(reference)
+        self.temperament = temperament
+        self.tonic = tonic if temperament is not Temperament.EQUAL else 0
+        self.table = _frequency_table(self.reference, temperament, self.tonic)
+
+    ## Returns a string showing the tuning's settings and the hex value of
+    #  its memory address.
+    #  Example: <Tuning: A415.0 JUST 0 0x10610d2b0>
+    def __str__(self):
+        return f'<Tuning: A{self.reference} {self.temperament.name} {self.tonic} {hex(id(self))}>'
+
+    ## Returns a string expression that will evaluate to this tuning.
+    def __repr__(self):
+        return f'Tuning({self.reference}, Temperament.{self.temperament.name}, {self.tonic})'
+
+    ## Returns the hertz value of a midi key number in this tuning.
+    #  @param midi  The midi key number to convert.
+    #
+    #  The method should raise a ValueError if the input is not a valid
+    #  midi key number.
+    def midi_to_hertz(self, midi):
+        if not isinstance(midi, int) or midi < 0 or midi > 127:
+            raise ValueError("Input is not a valid midi key number")
+        return self.table[midi]
+
+    ## Returns the hertz value of a pitch name in this tuning, see:
+    #  tet.pitch_to_midi().
+    #  @param pitch  The pitch name to convert.
+    #
+    #  The method should raise a ValueError if the input is not a valid
+    #  pitch name or produces an invalid midi key number.
+    def pitch_to_hertz(self, pitch):
+        return self.table[pitch_to_midi(pitch)]
+
+    ## Returns the table cache statistics, see: functools.lru_cache().
+    @staticmethod
+    def cache_info():
+        return _frequency_table.cache_info()